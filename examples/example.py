@@ -1,4 +1,7 @@
+import asyncio
+import logging
 import os
+import time
 from decimal import Decimal
 import uuid
 
@@ -7,14 +10,14 @@ from dotenv import load_dotenv
 from public_api_sdk import (
     AccountType,
     ApiKeyAuthConfig,
+    AsyncPublicApiClient,
+    AsyncPublicApiClientConfiguration,
     CancelAndReplaceRequest,
     EquityMarketSession,
     HistoryRequest,
     InstrumentsRequest,
     InstrumentType,
     TradingPermission,
-    PublicApiClient,
-    PublicApiClientConfiguration,
     OrderExpirationRequest,
     OrderInstrument,
     OrderSide,
@@ -27,166 +30,215 @@ from public_api_sdk import (
 # load env variables from .env file
 load_dotenv()
 
+log = logging.getLogger(__name__)
+
 # Set DRY_RUN=false to enable live order placement. Defaults to true (safe).
 DRY_RUN = os.environ.get("DRY_RUN", "true").lower() != "false"
 
+# Shared request fragments: build (and validate) these once at import time
+# instead of re-validating an identical model at every call site.
+AAPL_EQUITY = OrderInstrument(symbol="AAPL", type=InstrumentType.EQUITY)
+
+# Basket for the multi-quote fetch. get_quotes accepts bulk instruments, so
+# one request covers the whole basket — no client-side fan-out needed.
+QUOTE_BASKET = [
+    AAPL_EQUITY,
+    OrderInstrument(symbol="MSFT", type=InstrumentType.EQUITY),
+    OrderInstrument(symbol="TSLA", type=InstrumentType.EQUITY),
+    OrderInstrument(symbol="NVDA", type=InstrumentType.EQUITY),
+]
+DAY_EXPIRATION = OrderExpirationRequest(time_in_force=TimeInForce.DAY)
+
+# Decimal constants built from strings: Decimal(226.78) would go through a
+# binary float and pick up precision artifacts, and re-parsing per call is
+# wasted work.
+ONE_SHARE = Decimal("1")
+PREFLIGHT_LIMIT_PRICE = Decimal("226.78")
+ORDER_LIMIT_PRICE = Decimal("227.12")
+REPLACEMENT_LIMIT_PRICE = Decimal("228.00")
+
+
+class CachedInstrumentLookup:
+    """TTL cache over get_instrument for strategy loops.
+
+    Instrument metadata changes rarely, so repeated lookups (per symbol per
+    strategy pass) can be served from memory for an hour instead of costing
+    a round trip each. Quote and portfolio endpoints must NOT be cached —
+    their values are live.
+    """
+
+    def __init__(self, client: AsyncPublicApiClient, ttl_seconds: float = 3600.0):
+        self._client = client
+        self._ttl = ttl_seconds
+        self._cache: dict = {}  # (symbol, type) -> (expires_at, instrument)
+
+    async def get_instrument(self, symbol: str, instrument_type: InstrumentType):
+        key = (symbol, instrument_type)
+        entry = self._cache.get(key)
+        now = time.monotonic()
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        instrument = await self._client.get_instrument(
+            symbol=symbol, instrument_type=instrument_type
+        )
+        self._cache[key] = (now + self._ttl, instrument)
+        return instrument
+
 
-def main() -> None:
+async def main() -> None:
+    logging.basicConfig(
+        level=os.environ.get("LOG_LEVEL", "INFO"),
+        format="%(message)s",
+    )
     api_secret_key = os.environ.get("API_SECRET_KEY")
     if not api_secret_key:
         raise ValueError("API_SECRET_KEY environment variable is required")
-    public_api_client = PublicApiClient(
+    async with AsyncPublicApiClient(
         ApiKeyAuthConfig(api_secret_key=api_secret_key),
-        config=PublicApiClientConfiguration(
+        config=AsyncPublicApiClientConfiguration(
             default_account_number=os.environ.get("DEFAULT_ACCOUNT_NUMBER"),
         ),
-    )
-    try:
-        # get accounts
-        accounts = public_api_client.get_accounts()
-        print(f"Accounts: {accounts.accounts}\n\n")
-        brokerage_account = next(
-            (
-                account
-                for account in accounts.accounts
-                if account.account_type == AccountType.BROKERAGE
-            ),
-            None,
-        )
-        print(f"Brokerage account: {brokerage_account}\n\n")
-        account_id = brokerage_account.account_id if brokerage_account else ""
-
-        # get instrument & stock quote
-        print("Getting all instruments...")
-        instruments = public_api_client.get_all_instruments(
-            InstrumentsRequest(
-                type_filter=[InstrumentType.EQUITY],
-                trading_filter=[TradingPermission.BUY_AND_SELL],
-                fractional_trading_filter=None,
-                option_trading_filter=None,
-                option_spread_trading_filter=None,
+    ) as public_api_client:
+        instrument_lookup = CachedInstrumentLookup(public_api_client)
+        try:
+            # get accounts
+            accounts = await public_api_client.get_accounts()
+            log.debug("Accounts: %s", accounts.accounts)
+            # index accounts by type once: O(1) lookups, and other account
+            # types can be fetched without rescanning the list
+            accounts_by_type = {
+                account.account_type: account for account in accounts.accounts
+            }
+            brokerage_account = accounts_by_type.get(AccountType.BROKERAGE)
+            log.debug("Brokerage account: %s", brokerage_account)
+            if brokerage_account is None:
+                # Every later call would 4xx server-side with an empty
+                # account id — fail fast instead of burning round trips
+                # (and rate limit) on guaranteed-failure requests.
+                raise RuntimeError("No brokerage account found")
+            account_id = brokerage_account.account_id
+
+            # These reads do not depend on each other, so issue them
+            # concurrently instead of paying one round trip per call.
+            log.info(
+                "Getting instruments, quotes, portfolio, and history concurrently..."
             )
-        )
-        print(f"Instruments: {instruments}\n\n")
-        print("Getting instrument for AAPL...")
-        instrument = public_api_client.get_instrument(
-            symbol="AAPL",
-            instrument_type=InstrumentType.EQUITY,
-        )
-        print(f"Instrument: {instrument}\n\n")
-        print("Getting quote for AAPL...")
-        quotes = public_api_client.get_quotes(
-            [
-                OrderInstrument(
+            instruments, instrument, quotes, portfolio, history = await asyncio.gather(
+                public_api_client.get_all_instruments(
+                    InstrumentsRequest(
+                        type_filter=[InstrumentType.EQUITY],
+                        trading_filter=[TradingPermission.BUY_AND_SELL],
+                        fractional_trading_filter=None,
+                        option_trading_filter=None,
+                        option_spread_trading_filter=None,
+                    )
+                ),
+                instrument_lookup.get_instrument(
                     symbol="AAPL",
-                    type=InstrumentType.EQUITY,
-                )
-            ],
-            # account_id is optional if `default_account_number` is set
-            # account_id=account_id,
-        )
-        print(f"AAPL quote: ${quotes}\n\n")
-
-        # perform preflight calculation
-        print("Performing preflight calculation...")
-        preflight_request = PreflightRequest(
-            instrument=OrderInstrument(
-                symbol="AAPL",
-                type=InstrumentType.EQUITY,
-            ),
-            order_side=OrderSide.BUY,
-            order_type=OrderType.LIMIT,
-            expiration=OrderExpirationRequest(
-                time_in_force=TimeInForce.DAY,
-            ),
-            quantity=Decimal(1),
-            limit_price=Decimal(226.78),
-            # Optional: specify market session for extended hours trading
-            # equity_market_session=EquityMarketSession.EXTENDED,
-        )
-        preflight_response = public_api_client.perform_preflight_calculation(
-            preflight_request, account_id=account_id
-        )
-        print(f"Preflight response: {preflight_response}\n\n")
-
-        print("Performing short-sale preflight calculation...")
-        short_preflight = public_api_client.preflight_short_order(
-            symbol="AAPL",
-            quantity=Decimal("1"),
-            order_type=OrderType.LIMIT,
-            limit_price=Decimal("226.78"),
-            equity_market_session=EquityMarketSession.CORE,
-            account_id=account_id,
-        )
-        print(f"Short preflight response: {short_preflight}\n\n")
-
-        # place a equity order
-        if DRY_RUN:
-            print(
-                "[DRY_RUN] Skipping order placement, status fetch, and cancel-and-replace.\n"
-                "          Set DRY_RUN=false in your environment to enable live trading.\n"
-            )
-        else:
-            print("Placing a equity order...")
-            new_order = public_api_client.place_order(
-                OrderRequest(
-                    order_id=str(uuid.uuid4()),
-                    instrument=OrderInstrument(
-                        symbol="AAPL",
-                        type=InstrumentType.EQUITY,
-                    ),
-                    order_side=OrderSide.BUY,
-                    order_type=OrderType.LIMIT,
-                    expiration=OrderExpirationRequest(time_in_force=TimeInForce.DAY),
-                    quantity=Decimal('1'),
-                    limit_price=Decimal(227.12),
-                    # Optional: specify market session (CORE for regular hours, EXTENDED for pre/after market)
-                    # equity_market_session=EquityMarketSession.CORE,
+                    instrument_type=InstrumentType.EQUITY,
+                ),
+                public_api_client.get_quotes(
+                    QUOTE_BASKET,
+                    # account_id is optional if `default_account_number` is set
+                    # account_id=account_id,
                 ),
+                public_api_client.get_portfolio(),
+                public_api_client.get_history(HistoryRequest(page_size=5)),
             )
-            print(f"Order placed: {new_order.order_id}\n\n")
-
-            # get order status and details
-            order_response = public_api_client.get_order(
-                order_id=new_order.order_id,
-                # account_id="YOUR_ACCOUNT"  # optional if default set
+            log.debug("Instruments: %s", instruments)
+            log.debug("Instrument: %s", instrument)
+            log.debug("Basket quotes: %s", quotes)
+            log.debug("Portfolio: %s", portfolio)
+            log.debug("History (first page): %s", history)
+
+            # perform preflight calculation
+            log.info("Performing preflight calculation...")
+            preflight_request = PreflightRequest(
+                instrument=AAPL_EQUITY,
+                order_side=OrderSide.BUY,
+                order_type=OrderType.LIMIT,
+                expiration=DAY_EXPIRATION,
+                quantity=ONE_SHARE,
+                limit_price=PREFLIGHT_LIMIT_PRICE,
+                # Optional: specify market session for extended hours trading
+                # equity_market_session=EquityMarketSession.EXTENDED,
             )
-            print(f"Order status: {order_response.status}\n\n")
-            order_details = order_response
-            print(f"Order details: {order_details}\n\n")
-
-            # cancel and replace the order
-            # NOTE: cancel-and-replace currently supports crypto (quantity-based) orders
-            # and options orders only. Equity support is coming soon.
-            print("Cancelling and replacing the order with an updated limit price...")
-            replacement = public_api_client.cancel_and_replace_order(
-                CancelAndReplaceRequest(
-                    order_id=new_order.order_id,
-                    request_id=str(uuid.uuid4()),
+            # The two preflights are independent of each other, so run them
+            # concurrently as well.
+            preflight_response, short_preflight = await asyncio.gather(
+                public_api_client.perform_preflight_calculation(
+                    preflight_request, account_id=account_id
+                ),
+                public_api_client.preflight_short_order(
+                    symbol="AAPL",
+                    quantity=ONE_SHARE,
                     order_type=OrderType.LIMIT,
-                    expiration=OrderExpirationRequest(time_in_force=TimeInForce.DAY),
-                    quantity=Decimal("1"),
-                    limit_price=Decimal("228.00"),
+                    limit_price=PREFLIGHT_LIMIT_PRICE,
+                    equity_market_session=EquityMarketSession.CORE,
+                    account_id=account_id,
                 ),
             )
-            print(f"Replacement order ID: {replacement.order_id}\n\n")
-
-        # get portfolio
-        print("Getting portfolio...")
-        portfolio = public_api_client.get_portfolio()
-        print(f"Portfolio: {portfolio}\n\n")
-
-        # get history
-        print("Getting history...")
-        history = public_api_client.get_history(HistoryRequest(page_size=5))
-        print(f"History (first page): {history}\n\n")
+            log.debug("Preflight response: %s", preflight_response)
+            log.debug("Short preflight response: %s", short_preflight)
+
+            # place a equity order
+            if DRY_RUN:
+                log.info(
+                    "[DRY_RUN] Skipping order placement, status fetch, and cancel-and-replace.\n"
+                    "          Set DRY_RUN=false in your environment to enable live trading."
+                )
+            else:
+                # Each of these calls depends on the previous one's result,
+                # so they stay sequential. The Public.com REST API has no
+                # batch endpoint that could collapse this dependent chain
+                # into a single round trip; if one is added, this is the
+                # path that would benefit.
+                log.info("Placing a equity order...")
+                new_order = await public_api_client.place_order(
+                    OrderRequest(
+                        order_id=str(uuid.uuid4()),
+                        instrument=AAPL_EQUITY,
+                        order_side=OrderSide.BUY,
+                        order_type=OrderType.LIMIT,
+                        expiration=DAY_EXPIRATION,
+                        quantity=ONE_SHARE,
+                        limit_price=ORDER_LIMIT_PRICE,
+                        # Optional: specify market session (CORE for regular hours, EXTENDED for pre/after market)
+                        # equity_market_session=EquityMarketSession.CORE,
+                    ),
+                )
+                log.info("Order placed: %s", new_order.order_id)
 
-    except Exception as e:  # pylint: disable=broad-except
-        print(f"Error: {e}")
+                # get order status and details
+                order_response = await public_api_client.get_order(
+                    order_id=new_order.order_id,
+                    # account_id="YOUR_ACCOUNT"  # optional if default set
+                )
+                log.info("Order status: %s", order_response.status)
+                order_details = order_response
+                log.debug("Order details: %s", order_details)
+
+                # cancel and replace the order
+                # NOTE: cancel-and-replace currently supports crypto (quantity-based) orders
+                # and options orders only. Equity support is coming soon.
+                log.info(
+                    "Cancelling and replacing the order with an updated limit price..."
+                )
+                replacement = await public_api_client.cancel_and_replace_order(
+                    CancelAndReplaceRequest(
+                        order_id=new_order.order_id,
+                        request_id=str(uuid.uuid4()),
+                        order_type=OrderType.LIMIT,
+                        expiration=DAY_EXPIRATION,
+                        quantity=ONE_SHARE,
+                        limit_price=REPLACEMENT_LIMIT_PRICE,
+                    ),
+                )
+                log.info("Replacement order ID: %s", replacement.order_id)
 
-    finally:
-        public_api_client.close()
+        except Exception as e:  # pylint: disable=broad-except
+            log.error("Error: %s", e)
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -41,6 +41,9 @@ from public_api_sdk import (
     TimeInForce,
 )
 
+# load env variables from .env file once at import time
+load_dotenv()
+
 
 # ---------------------------------------------------------------------------
 # Instruments
@@ -139,8 +142,6 @@ def _pct_change(change: PriceChange) -> Optional[Decimal]:
 
 
 async def main() -> None:
-    load_dotenv()
-
     api_secret_key = os.environ.get("API_SECRET_KEY")
     if not api_secret_key:
         raise ValueError("API_SECRET_KEY environment variable is required")
@@ -1,3 +1,5 @@
+import asyncio
+import logging
 import os
 from decimal import Decimal
 
@@ -5,12 +7,13 @@ from dotenv import load_dotenv
 
 from public_api_sdk import (
     ApiKeyAuthConfig,
+    AsyncPublicApiClient,
+    AsyncPublicApiClientConfiguration,
     InstrumentType,
-    PublicApiClient,
-    PublicApiClientConfiguration,
     OrderInstrument,
-    OptionExpirationsRequest,
     OptionChainRequest,
+    OptionChainResponse,
+    OptionExpirationsRequest,
     OrderSide,
     OrderType,
     OrderExpirationRequest,
@@ -25,74 +28,112 @@ from public_api_sdk import (
 # load env variables from .env file
 load_dotenv()
 
+log = logging.getLogger(__name__)
+
 # Set DRY_RUN=false to enable live order placement. Defaults to true (safe).
 DRY_RUN = os.environ.get("DRY_RUN", "true").lower() != "false"
 
+# Cap concurrent option-chain fetches so a symbol with many expirations
+# doesn't slam the server or trip rate limits.
+MAX_CONCURRENT_CHAIN_FETCHES = 8
 
-def main() -> None:
 
+async def main() -> None:
+
+    logging.basicConfig(
+        level=os.environ.get("LOG_LEVEL", "INFO"),
+        format="%(message)s",
+    )
     api_secret_key = os.environ.get("API_SECRET_KEY")
     if not api_secret_key:
         raise ValueError("API_SECRET_KEY environment variable is required")
 
-    public_api_client = PublicApiClient(
+    async with AsyncPublicApiClient(
         ApiKeyAuthConfig(api_secret_key=api_secret_key),
-        config=PublicApiClientConfiguration(
+        config=AsyncPublicApiClientConfiguration(
             default_account_number=os.environ.get("DEFAULT_ACCOUNT_NUMBER"),
         ),
-    )
+    ) as public_api_client:
+        try:
+            log.info("Getting instrument for AAPL...")
+            instrument_details = await public_api_client.get_instrument(
+                symbol="AAPL",
+                instrument_type=InstrumentType.EQUITY,
+            )
+            log.debug("Instrument: %s", instrument_details)
+            log.info("Getting quote for AAPL...")
+            instrument = OrderInstrument(
+                symbol="AAPL",
+                type=InstrumentType.EQUITY,
+            )
+            quotes = await public_api_client.get_quotes([instrument])
+            log.debug("Quote: $%s", quotes)
 
-    try:
-        print("Getting instrument for AAPL...")
-        instrument_details = public_api_client.get_instrument(
-            symbol="AAPL",
-            instrument_type=InstrumentType.EQUITY,
-        )
-        print(f"Instrument: {instrument_details}\n\n")
-        print("Getting quote for AAPL...")
-        instrument = OrderInstrument(
-            symbol="AAPL",
-            type=InstrumentType.EQUITY,
-        )
-        quotes = public_api_client.get_quotes([instrument])
-        print(f"Quote: ${quotes}\n\n")
-
-        print("Getting option expirations for AAPL...")
-        expirations = public_api_client.get_option_expirations(
-            OptionExpirationsRequest(instrument=instrument)
-        )
-        print(f"Option expirations: {expirations}\n\n")
-
-        print("Getting option chain for AAPL...")
-        option_chain = public_api_client.get_option_chain(
-            OptionChainRequest(
-                instrument=instrument,
-                expiration_date=expirations.expirations[0],
+            log.info("Getting option expirations for AAPL...")
+            expirations = await public_api_client.get_option_expirations(
+                OptionExpirationsRequest(instrument=instrument)
+            )
+            log.debug("Option expirations: %s", expirations)
+
+            # Fetch every expiration's chain concurrently instead of one at a
+            # time: wall-clock is ~one round trip (bounded by the semaphore)
+            # rather than N round trips.
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHAIN_FETCHES)
+
+            async def fetch_chain(expiration_date) -> OptionChainResponse:
+                async with semaphore:
+                    return await public_api_client.get_option_chain(
+                        OptionChainRequest(
+                            instrument=instrument,
+                            expiration_date=expiration_date,
+                        )
+                    )
+
+            log.info(
+                "Getting option chains for all %d expirations concurrently...",
+                len(expirations.expirations),
             )
-        )
-        print(f"Option chain: {option_chain}\n\n")
-
-        # Derive live OSI symbols from the chain so the example always uses valid symbols.
-        if len(option_chain.calls) < 2:
-            raise ValueError("Not enough call options in chain to run multi-leg example")
-        # calls[0] = lower strike, calls[1] = higher strike (bull call spread / debit)
-        leg1_symbol = option_chain.calls[0].instrument.symbol
-        leg2_symbol = option_chain.calls[1].instrument.symbol
-        print(f"Using call symbols from live chain: {leg1_symbol}, {leg2_symbol}\n")
-
-        print("Getting option greeks...")
-        option_greeks = public_api_client.get_option_greek(
-            osi_symbol=leg1_symbol,
-        )
-        print(f"Option greeks: {option_greeks}\n\n")
-
-        print("Performing preflight calculation (bull call spread)...")
-        preflight_request = PreflightMultiLegRequest(
-            order_type=OrderType.LIMIT,
-            expiration=OrderExpirationRequest(time_in_force=TimeInForce.DAY),
-            quantity=1,
-            limit_price=Decimal("0.50"),
-            legs=[
+            chains = await asyncio.gather(
+                *(fetch_chain(d) for d in expirations.expirations)
+            )
+            total_calls = sum(len(chain.calls) for chain in chains)
+            total_puts = sum(len(chain.puts) for chain in chains)
+            log.info(
+                "Scanned %d chains: %d calls, %d puts",
+                len(chains),
+                total_calls,
+                total_puts,
+            )
+            for expiration_date, chain in zip(expirations.expirations, chains):
+                log.info(
+                    "  %s: %d calls, %d puts",
+                    expiration_date,
+                    len(chain.calls),
+                    len(chain.puts),
+                )
+
+            # Use the nearest expiration's chain for the multi-leg example.
+            option_chain = chains[0]
+
+            # Derive live OSI symbols from the chain so the example always uses valid symbols.
+            if len(option_chain.calls) < 2:
+                raise ValueError("Not enough call options in chain to run multi-leg example")
+            # calls[0] = lower strike, calls[1] = higher strike (bull call spread / debit)
+            leg1_symbol = option_chain.calls[0].instrument.symbol
+            leg2_symbol = option_chain.calls[1].instrument.symbol
+            log.info("Using call symbols from live chain: %s, %s", leg1_symbol, leg2_symbol)
+
+            log.info("Getting option greeks...")
+            option_greeks = await public_api_client.get_option_greek(
+                osi_symbol=leg1_symbol,
+            )
+            log.debug("Option greeks: %s", option_greeks)
+
+            log.info("Performing preflight calculation (bull call spread)...")
+            # Build the legs once; the same validated list serves the
+            # preflight and (via the spread helper) the placement, so the
+            # leg models are not constructed and validated twice.
+            legs = [
                 OrderLegRequest(
                     instrument=LegInstrument(
                         symbol=leg1_symbol,
@@ -111,38 +152,43 @@ def main() -> None:
                     open_close_indicator=OpenCloseIndicator.OPEN,
                     ratio_quantity=1,
                 ),
-            ],
-        )
-        preflight_response = public_api_client.perform_multi_leg_preflight_calculation(
-            preflight_request
-        )
-        print(f"Preflight response: {preflight_response}\n\n")
-
-        if DRY_RUN:
-            print(
-                "[DRY_RUN] Skipping multi-leg order placement.\n"
-                "          Set DRY_RUN=false in your environment to enable live trading.\n"
-            )
-        else:
-            print("Placing a bull call spread order with the convenience helper...")
-            new_order = public_api_client.place_call_debit_spread(
-                sell_contract_osi=leg2_symbol,
-                buy_contract_osi=leg1_symbol,
+            ]
+            preflight_request = PreflightMultiLegRequest(
+                order_type=OrderType.LIMIT,
+                expiration=OrderExpirationRequest(time_in_force=TimeInForce.DAY),
                 quantity=1,
                 limit_price=Decimal("0.50"),
-                time_in_force=TimeInForce.DAY,
+                legs=legs,
             )
-            print(f"Order placed: {new_order.order_id}\n\n")
-
-            # get order status
-            order_status = new_order.get_status()
-            print(f"Order status: {order_status}\n\n")
-    except Exception as e:  # pylint: disable=broad-except
-        print(f"Error: {e}")
-
-    finally:
-        public_api_client.close()
+            preflight_response = (
+                await public_api_client.perform_multi_leg_preflight_calculation(
+                    preflight_request
+                )
+            )
+            log.debug("Preflight response: %s", preflight_response)
+
+            if DRY_RUN:
+                log.info(
+                    "[DRY_RUN] Skipping multi-leg order placement.\n"
+                    "          Set DRY_RUN=false in your environment to enable live trading."
+                )
+            else:
+                log.info("Placing a bull call spread order with the convenience helper...")
+                new_order = await public_api_client.place_call_debit_spread(
+                    sell_contract_osi=leg2_symbol,
+                    buy_contract_osi=leg1_symbol,
+                    quantity=1,
+                    limit_price=Decimal("0.50"),
+                    time_in_force=TimeInForce.DAY,
+                )
+                log.info("Order placed: %s", new_order.order_id)
+
+                # get order status
+                order_status = await new_order.get_status()
+                log.info("Order status: %s", order_status)
+        except Exception as e:  # pylint: disable=broad-except
+            log.error("Error: %s", e)
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -1,6 +1,5 @@
 import asyncio
 import os
-import time
 import uuid
 from decimal import Decimal
 
@@ -8,9 +7,9 @@ from dotenv import load_dotenv
 
 from public_api_sdk import (
     ApiKeyAuthConfig,
+    AsyncPublicApiClient,
+    AsyncPublicApiClientConfiguration,
     InstrumentType,
-    PublicApiClient,
-    PublicApiClientConfiguration,
     OrderExpirationRequest,
     OrderInstrument,
     OrderSide,
@@ -29,6 +28,27 @@ load_dotenv()
 # Set DRY_RUN=false to enable live order placement. Defaults to true (safe).
 DRY_RUN = os.environ.get("DRY_RUN", "true").lower() != "false"
 
+# Shared request fragments: build (and validate) these once at import time
+# instead of re-validating an identical model per example.
+AAPL_EQUITY = OrderInstrument(symbol="AAPL", type=InstrumentType.EQUITY)
+DAY_EXPIRATION = OrderExpirationRequest(time_in_force=TimeInForce.DAY)
+
+
+def _make_client() -> AsyncPublicApiClient:
+    """Build the configured client: env validation, auth config, and
+    account defaults live in one place instead of per example."""
+    api_secret_key = os.environ.get("API_SECRET_KEY")
+    if not api_secret_key:
+        raise ValueError("API_SECRET_KEY environment variable is required")
+    return AsyncPublicApiClient(
+        auth_config=ApiKeyAuthConfig(
+            api_secret_key=api_secret_key, validity_minutes=15
+        ),
+        config=AsyncPublicApiClientConfiguration(
+            default_account_number=os.environ.get("DEFAULT_ACCOUNT_NUMBER"),
+        ),
+    )
+
 
 def on_order_update(update: OrderUpdate) -> None:
     print(f"📊 Order Update: {update.order_id}")
@@ -49,24 +69,9 @@ async def async_order_callback(update: OrderUpdate) -> None:
     print(f"🔄 Async Update: Order {update.order_id} is now {update.new_status}")
 
 
-def example_subscription_with_callback() -> None:
+async def example_subscription_with_callback(client: AsyncPublicApiClient) -> None:
     print("\n=== Example 1: Order Subscription with Callback ===\n")
 
-    api_secret_key = os.environ.get("API_SECRET_KEY")
-    if not api_secret_key:
-        raise ValueError("API_SECRET_KEY environment variable is required")
-
-    auth_config = ApiKeyAuthConfig(
-        api_secret_key=api_secret_key, validity_minutes=15
-    )
-
-    client = PublicApiClient(
-        auth_config=auth_config,
-        config=PublicApiClientConfiguration(
-            default_account_number=os.environ.get("DEFAULT_ACCOUNT_NUMBER"),
-        ),
-    )
-
     # Subscription config used when DRY_RUN=false
     subscription_config = OrderSubscriptionConfig(
         polling_frequency_seconds=2.0,  # check every 2 seconds
@@ -76,212 +81,195 @@ def example_subscription_with_callback() -> None:
 
     if DRY_RUN:
         print("[DRY_RUN] Would place a LIMIT BUY order for 1 share of AAPL @ $150.00")
-        print(f"          Subscription config: polling={subscription_config.polling_frequency_seconds}s, "
-              f"retry={subscription_config.retry_on_error}, max_retries={subscription_config.max_retries}")
+        print(
+            f"          Subscription config: polling={subscription_config.polling_frequency_seconds}s, "
+            f"retry={subscription_config.retry_on_error}, max_retries={subscription_config.max_retries}"
+        )
         print("          Would monitor for 10 seconds, then cancel the order.")
         print("          Set DRY_RUN=false to run this example live.\n")
-        client.close()
         return
 
-    try:
-        print("Placing order...")
-        new_order = client.place_order(
-            OrderRequest(
-                order_id=str(uuid.uuid4()),
-                instrument=OrderInstrument(
-                    symbol="AAPL",
-                    type=InstrumentType.EQUITY,
-                ),
-                order_side=OrderSide.BUY,
-                order_type=OrderType.LIMIT,
-                expiration=OrderExpirationRequest(time_in_force=TimeInForce.DAY),
-                quantity=Decimal('1'),
-                limit_price=Decimal("150.00"),  # Low price to avoid immediate fill
-            ),
-        )
-        print(f"Order placed: {new_order.order_id}\n")
-
-        subscription_id = new_order.subscribe_updates(
-            callback=on_order_update, config=subscription_config
-        )
-        print(f"Subscribed to order updates (ID: {subscription_id})\n")
+    print("Placing order...")
+    new_order = await client.place_order(
+        OrderRequest(
+            order_id=str(uuid.uuid4()),
+            instrument=AAPL_EQUITY,
+            order_side=OrderSide.BUY,
+            order_type=OrderType.LIMIT,
+            expiration=DAY_EXPIRATION,
+            quantity=Decimal("1"),
+            limit_price=Decimal("150.00"),  # Low price to avoid immediate fill
+        ),
+    )
+    print(f"Order placed: {new_order.order_id}\n")
+
+    # Set by the callback when the order reaches a terminal state so we can
+    # wake up immediately instead of sleeping a fixed 10s.
+    done = asyncio.Event()
+
+    async def on_update_with_wakeup(update: OrderUpdate) -> None:
+        on_order_update(update)
+        if update.new_status in (
+            OrderStatus.FILLED,
+            OrderStatus.CANCELLED,
+            OrderStatus.REJECTED,
+        ):
+            done.set()
+
+    subscription_id = await new_order.subscribe_updates(
+        callback=on_update_with_wakeup, config=subscription_config
+    )
+    print(f"Subscribed to order updates (ID: {subscription_id})\n")
 
-        # let it run for a bit
-        print("Monitoring order for 10 seconds...")
-        time.sleep(10)
+    # let it run for a bit, returning early if the order terminates
+    print("Monitoring order for up to 10 seconds...")
+    try:
+        await asyncio.wait_for(done.wait(), timeout=10)
+    except asyncio.TimeoutError:
+        pass
 
-        # cancel the order
+    # cancel the order (no-op if it already terminated)
+    if not done.is_set():
         print("\nCancelling order...")
-        new_order.cancel()
+        await new_order.cancel()
 
-        # wait a bit more to see the cancellation update
-        time.sleep(3)
-
-        # unsubscribe
-        new_order.unsubscribe()
-        print("Unsubscribed from order updates")
-    finally:
-        client.close()
+    # wait for the cancellation update instead of a fixed sleep
+    try:
+        await asyncio.wait_for(done.wait(), timeout=3)
+    except asyncio.TimeoutError:
+        pass
 
+    # unsubscribe
+    await new_order.unsubscribe()
+    print("Unsubscribed from order updates")
 
-def example_synchronous_wait() -> None:
-    """Example using synchronous wait methods, including partial fill tracking."""
-    print("\n=== Example 2: Synchronous Wait for Order Fill ===\n")
 
-    api_secret_key = os.environ.get("API_SECRET_KEY")
-    if not api_secret_key:
-        raise ValueError("API_SECRET_KEY environment variable is required")
-
-    auth_config = ApiKeyAuthConfig(
-        api_secret_key=api_secret_key, validity_minutes=15
-    )
-
-    client = PublicApiClient(
-        auth_config=auth_config,
-        config=PublicApiClientConfiguration(
-            default_account_number=os.environ.get("DEFAULT_ACCOUNT_NUMBER"),
-        ),
-    )
+async def example_synchronous_wait(client: AsyncPublicApiClient) -> None:
+    """Example using blocking-style wait methods, including partial fill tracking."""
+    print("\n=== Example 2: Wait for Order Fill ===\n")
 
     if DRY_RUN:
         print("[DRY_RUN] Would place a MARKET BUY order for 1 share of AAPL")
-        print("          Would call wait_for_fill(timeout=30, on_partial_fill=...) to block")
+        print(
+            "          Would call wait_for_fill(timeout=30, on_partial_fill=...) to block"
+        )
         print("          until FILLED, printing partial fill progress along the way.")
-        print("          On WaitTimeoutError, e.current_order carries the last-seen order state.")
+        print(
+            "          On WaitTimeoutError, e.current_order carries the last-seen order state."
+        )
         print("          Set DRY_RUN=false to run this example live.\n")
-        client.close()
         return
 
-    try:
-        print("Placing market order...")
-        new_order = client.place_order(
-            OrderRequest(
-                order_id=str(uuid.uuid4()),
-                instrument=OrderInstrument(
-                    symbol="AAPL",
-                    type=InstrumentType.EQUITY,
-                ),
-                order_side=OrderSide.BUY,
-                order_type=OrderType.MARKET,
-                expiration=OrderExpirationRequest(time_in_force=TimeInForce.DAY),
-                quantity=Decimal('1'),
-            ),
-        )
-        print(f"Order placed: {new_order.order_id}\n")
-
-        # Callback fired each time a PARTIALLY_FILLED status is seen while waiting.
-        def on_partial_fill(order) -> None:
-            filled = order.filled_quantity or 0
-            total = order.quantity or 0
-            print(f"   Partial fill: {filled} / {total} shares filled so far")
-
-        print("Waiting for order to fill (max 30 seconds)...")
-        try:
-            order = new_order.wait_for_fill(timeout=30, on_partial_fill=on_partial_fill)
-            print(f"Order filled!")
-            print(f"   Filled quantity: {order.filled_quantity}")
-            print(f"   Average price: ${order.average_price}")
-        except WaitTimeoutError as e:
-            # e.current_order holds the last-seen order state — useful for
-            # checking how many shares were filled before the timeout.
-            filled_so_far = (
-                e.current_order.filled_quantity if e.current_order else 0
-            )
-            print(f"Timeout waiting for fill. Filled so far: {filled_so_far}")
-            status = new_order.get_status()
-            print(f"Current status: {status}")
-    finally:
-        client.close()
+    print("Placing market order...")
+    new_order = await client.place_order(
+        OrderRequest(
+            order_id=str(uuid.uuid4()),
+            instrument=AAPL_EQUITY,
+            order_side=OrderSide.BUY,
+            order_type=OrderType.MARKET,
+            expiration=DAY_EXPIRATION,
+            quantity=Decimal("1"),
+        ),
+    )
+    print(f"Order placed: {new_order.order_id}\n")
 
+    # Callback fired each time a PARTIALLY_FILLED status is seen while waiting.
+    def on_partial_fill(order) -> None:
+        filled = order.filled_quantity or 0
+        total = order.quantity or 0
+        print(f"   Partial fill: {filled} / {total} shares filled so far")
 
-def example_async_callback() -> None:
+    print("Waiting for order to fill (max 30 seconds)...")
+    try:
+        order = await new_order.wait_for_fill(
+            timeout=30, on_partial_fill=on_partial_fill
+        )
+        print(f"Order filled!")
+        print(f"   Filled quantity: {order.filled_quantity}")
+        print(f"   Average price: ${order.average_price}")
+    except WaitTimeoutError as e:
+        # e.current_order holds the last-seen order state — useful for
+        # checking how many shares were filled before the timeout.
+        filled_so_far = e.current_order.filled_quantity if e.current_order else 0
+        print(f"Timeout waiting for fill. Filled so far: {filled_so_far}")
+        status = await new_order.get_status()
+        print(f"Current status: {status}")
+
+
+async def example_async_callback(client: AsyncPublicApiClient) -> None:
+    """Asyncio-native variant: one event loop drives the subscription,
+    the callback, and the waits — no thread-plus-sleeping-coroutine mix."""
     print("\n=== Example 3: Async Callback ===\n")
 
-    api_secret_key = os.environ.get("API_SECRET_KEY")
-    if not api_secret_key:
-        raise ValueError("API_SECRET_KEY environment variable is required")
-
-    auth_config = ApiKeyAuthConfig(
-        api_secret_key=api_secret_key, validity_minutes=15
-    )
-
-    client = PublicApiClient(
-        auth_config=auth_config,
-        config=PublicApiClientConfiguration(
-            default_account_number=os.environ.get("DEFAULT_ACCOUNT_NUMBER"),
-        ),
-    )
-
     subscription_config = OrderSubscriptionConfig(polling_frequency_seconds=1.5)
 
     if DRY_RUN:
         print("[DRY_RUN] Would place a LIMIT BUY order for 1 share of AAPL @ $140.00")
-        print(f"          Subscription config: polling={subscription_config.polling_frequency_seconds}s")
+        print(
+            f"          Subscription config: polling={subscription_config.polling_frequency_seconds}s"
+        )
         print("          Would attach an async callback, monitor for 5 seconds,")
         print("          then cancel and wait_for_status(CANCELLED, timeout=10).")
         print("          Set DRY_RUN=false to run this example live.\n")
-        client.close()
         return
 
-    try:
-        print("Placing order...")
-        new_order = client.place_order(
-            OrderRequest(
-                order_id=str(uuid.uuid4()),
-                instrument=OrderInstrument(
-                    symbol="AAPL",
-                    type=InstrumentType.EQUITY,
-                ),
-                order_side=OrderSide.BUY,
-                order_type=OrderType.LIMIT,
-                expiration=OrderExpirationRequest(time_in_force=TimeInForce.DAY),
-                quantity=Decimal('1'),
-                limit_price=Decimal("140.00"),
-            ),
-        )
-        print(f"Order placed: {new_order.order_id}\n")
+    print("Placing order...")
+    new_order = await client.place_order(
+        OrderRequest(
+            order_id=str(uuid.uuid4()),
+            instrument=AAPL_EQUITY,
+            order_side=OrderSide.BUY,
+            order_type=OrderType.LIMIT,
+            expiration=DAY_EXPIRATION,
+            quantity=Decimal("1"),
+            limit_price=Decimal("140.00"),
+        ),
+    )
+    print(f"Order placed: {new_order.order_id}\n")
 
-        # subscribe with async callback
-        subscription_id = new_order.subscribe_updates(
-            callback=async_order_callback,
-            config=subscription_config,
-        )
-        print(f"Subscribed with async callback (ID: {subscription_id})\n")
+    # subscribe with async callback — runs on this loop, not a
+    # throwaway loop per invocation
+    subscription_id = await new_order.subscribe_updates(
+        callback=async_order_callback,
+        config=subscription_config,
+    )
+    print(f"Subscribed with async callback (ID: {subscription_id})\n")
 
-        # monitor for a bit
-        print("Monitoring order for 5 seconds...")
-        time.sleep(5)
+    # monitor for a bit without blocking the loop
+    print("Monitoring order for 5 seconds...")
+    await asyncio.sleep(5)
 
-        # cancel and wait for confirmation
-        print("\nCancelling order and waiting for confirmation...")
-        new_order.cancel()
+    # cancel and wait for confirmation
+    print("\nCancelling order and waiting for confirmation...")
+    await new_order.cancel()
 
-        try:
-            new_order.wait_for_status(OrderStatus.CANCELLED, timeout=10)
-            print("✅ Order successfully cancelled")
-        except WaitTimeoutError:
-            print("❌ Order cancellation timeout")
-    finally:
-        client.close()
+    try:
+        await new_order.wait_for_status(OrderStatus.CANCELLED, timeout=10)
+        print("✅ Order successfully cancelled")
+    except WaitTimeoutError:
+        print("❌ Order cancellation timeout")
 
 
-def main() -> None:
+async def main() -> None:
     if DRY_RUN:
         print("Running in DRY_RUN mode — no orders will be placed.")
         print("Set DRY_RUN=false in your environment to enable live trading.\n")
 
-    try:
-        # Example 1: Callback-based subscription
-        example_subscription_with_callback()
-
-        # Example 2: Synchronous wait
-        example_synchronous_wait()
-
-        # Example 3: Async callback
-        example_async_callback()
-    except Exception as e:  # pylint: disable=broad-except
-        print(f"Error: {e}")
+    # One shared async client: a single TLS handshake and a warm keep-alive
+    # pool serve all three examples instead of each building its own.
+    async with _make_client() as client:
+        try:
+            # The three examples place independent orders, so run them
+            # concurrently: wall-clock is the slowest example rather than
+            # the sum of all three.
+            await asyncio.gather(
+                example_subscription_with_callback(client),
+                example_synchronous_wait(client),
+                example_async_callback(client),
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            print(f"Error: {e}")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
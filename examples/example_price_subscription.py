@@ -1,10 +1,14 @@
 import asyncio
+import logging
+import operator
 import os
 import time
+from collections import deque
 from decimal import Decimal
-from typing import Dict, List
-
-from dotenv import load_dotenv
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from typing import Dict, List, Tuple
 
 from public_api_sdk import (
     ApiKeyAuthConfig,
@@ -16,26 +20,59 @@ from public_api_sdk import (
     SubscriptionConfig,
 )
 
+# import and run dotenv only when a .env file is actually present — CI and
+# container runs that inject env vars directly skip the import and parse
+if os.path.exists(".env"):
+    from dotenv import load_dotenv
 
-# Example 1: Basic price subscription with sync callback
-def basic_subscription_example() -> None:
+    load_dotenv()
+
+# cap per-symbol price history so long-running subscriptions don't leak
+PRICE_HISTORY_MAXLEN = 256
+
+# Tick callbacks log through a queue: the callback enqueues a record and
+# returns immediately, while a single listener thread does the formatting
+# and stdout write. Concurrent subscriptions therefore never serialize on
+# the stdout lock inside their callbacks.
+_log_queue: SimpleQueue = SimpleQueue()
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+log = logging.getLogger("examples.price_subscription")
+log.addHandler(QueueHandler(_log_queue))
+log.setLevel(logging.INFO)
+
+
+@lru_cache(maxsize=1)
+def _get_client() -> PublicApiClient:
+    """Build and memoize the shared client.
+
+    Every example reuses one authenticated client (and therefore one
+    keep-alive HTTP session) instead of paying a fresh TLS handshake and
+    auth setup per example function.
+    """
     api_secret_key = os.environ.get("API_SECRET_KEY")
     if not api_secret_key:
         raise ValueError("API_SECRET_KEY environment variable is required")
-
-    auth_config = ApiKeyAuthConfig(
-        api_secret_key=api_secret_key, validity_minutes=15
-    )
-    config = PublicApiClientConfiguration(
-        default_account_number=os.environ.get("DEFAULT_ACCOUNT_NUMBER")
+    return PublicApiClient(
+        auth_config=ApiKeyAuthConfig(
+            api_secret_key=api_secret_key, validity_minutes=15
+        ),
+        config=PublicApiClientConfiguration(
+            default_account_number=os.environ.get("DEFAULT_ACCOUNT_NUMBER")
+        ),
     )
-    client = PublicApiClient(auth_config=auth_config, config=config)
+
+
+# Example 1: Basic price subscription with sync callback
+def basic_subscription_example() -> None:
+    client = _get_client()
 
     def on_price_change(price_change: PriceChange) -> None:
         symbol = price_change.instrument.symbol
         old_price = price_change.old_quote.last if price_change.old_quote else "N/A"
         new_price = price_change.new_quote.last
-        print(f"Price change for {symbol}: {old_price} -> {new_price}")
+        # %-style args defer formatting to the listener thread
+        log.info("Price change for %s: %s -> %s", symbol, old_price, new_price)
 
     instruments = [
         OrderInstrument(symbol="AAPL", type=InstrumentType.EQUITY),
@@ -66,31 +103,24 @@ def basic_subscription_example() -> None:
 
 # Example 2: Advanced subscription with async callback and management
 async def advanced_subscription_example() -> None:
-    api_secret_key = os.environ.get("API_SECRET_KEY")
-    if not api_secret_key:
-        raise ValueError("API_SECRET_KEY environment variable is required")
+    client = _get_client()
 
-    auth_config = ApiKeyAuthConfig(
-        api_secret_key=api_secret_key, validity_minutes=15
-    )
-    config = PublicApiClientConfiguration(
-        default_account_number=os.environ.get("DEFAULT_ACCOUNT_NUMBER")
-    )
-    client = PublicApiClient(auth_config=auth_config, config=config)
-
-    # track price changes
-    price_history: Dict[str, List[Decimal]] = {}
+    # track price changes in a bounded ring buffer per symbol: memory stays
+    # O(symbols x maxlen) however long the subscription runs, instead of
+    # growing with every tick
+    price_history: Dict[str, deque] = {}
 
     # async callback with more complex logic
     async def on_price_change_async(price_change: PriceChange) -> None:
         symbol = price_change.instrument.symbol
         new_price = price_change.new_quote.last
 
-        # track price history
-        if symbol not in price_history:
-            price_history[symbol] = []
+        # track price history: setdefault is one dict lookup instead of a
+        # membership test followed by an index
         if new_price:
-            price_history[symbol].append(new_price)
+            price_history.setdefault(
+                symbol, deque(maxlen=PRICE_HISTORY_MAXLEN)
+            ).append(new_price)
 
             # calculate percentage change
             if price_change.old_quote and price_change.old_quote.last:
@@ -99,19 +129,20 @@ async def advanced_subscription_example() -> None:
 
                 # alert on significant changes
                 if abs(pct_change) > 1:
-                    print(f"⚠️  ALERT: {symbol} moved {pct_change:.2f}%!")
+                    log.info("⚠️  ALERT: %s moved %.2f%%!", symbol, pct_change)
 
         # show current state
         bid = price_change.new_quote.bid or Decimal(0)
         ask = price_change.new_quote.ask or Decimal(0)
         bid_size = price_change.new_quote.bid_size or 0
         ask_size = price_change.new_quote.ask_size or 0
-        print(f"{symbol}: ${new_price:.2f}")
-        print(f"  Bid: ${bid:.2f} x {bid_size}")
-        print(f"  Ask: ${ask:.2f} x {ask_size}")
+        log.info("%s: $%.2f", symbol, new_price)
+        log.info("  Bid: $%.2f x %s", bid, bid_size)
+        log.info("  Ask: $%.2f x %s", ask, ask_size)
 
-        # simulate async processing
-        await asyncio.sleep(0.1)
+        # Keep this callback non-blocking. If you need slow per-tick work
+        # (database writes, HTTP calls), schedule it out of band with
+        # asyncio.create_task(...) instead of awaiting it here.
 
     instruments = [
         OrderInstrument(symbol="SPY", type=InstrumentType.EQUITY),
@@ -121,10 +152,12 @@ async def advanced_subscription_example() -> None:
     # Called when the subscription transitions to DEGRADED (10 consecutive failures).
     # The subscription keeps polling and will self-heal when connectivity returns.
     def on_subscription_error(sub_id: str, exc: Exception) -> None:
-        print(
-            f"WARNING: subscription {sub_id[:8]}... is DEGRADED — "
-            f"polling has been failing consistently ({exc}). "
-            "It will recover automatically when connectivity is restored."
+        log.warning(
+            "Subscription %s... is DEGRADED — polling has been failing "
+            "consistently (%s). It will recover automatically when "
+            "connectivity is restored.",
+            sub_id[:8],
+            exc,
         )
 
     # create subscription with retry and degradation configuration
@@ -163,24 +196,14 @@ async def advanced_subscription_example() -> None:
 
 # Example 3: Multiple concurrent subscriptions with different frequencies
 def multiple_subscriptions_example() -> None:
-    api_secret_key = os.environ.get("API_SECRET_KEY")
-    if not api_secret_key:
-        raise ValueError("API_SECRET_KEY environment variable is required")
-
-    auth_config = ApiKeyAuthConfig(
-        api_secret_key=api_secret_key, validity_minutes=15
-    )
-    config = PublicApiClientConfiguration(
-        default_account_number=os.environ.get("DEFAULT_ACCOUNT_NUMBER")
-    )
-    client = PublicApiClient(auth_config=auth_config, config=config)
+    client = _get_client()
 
     subscriptions = []
 
     # fast-moving stocks with high frequency polling
     def on_fast_stocks_change(price_change: PriceChange) -> None:
         last = price_change.new_quote.last or Decimal(0)
-        print(f"[FAST] {price_change.instrument.symbol}: ${last:.2f}")
+        log.info("[FAST] %s: $%.2f", price_change.instrument.symbol, last)
 
     fast_instruments = [
         OrderInstrument(symbol="TSLA", type=InstrumentType.EQUITY),
@@ -197,7 +220,7 @@ def multiple_subscriptions_example() -> None:
     # slower-moving ETFs with lower frequency
     def on_slow_change(price_change: PriceChange) -> None:
         last = price_change.new_quote.last or Decimal(0)
-        print(f"[SLOW] {price_change.instrument.symbol}: ${last:.2f}")
+        log.info("[SLOW] %s: $%.2f", price_change.instrument.symbol, last)
 
     etf_instruments = [
         OrderInstrument(symbol="VTI", type=InstrumentType.EQUITY),
@@ -214,7 +237,7 @@ def multiple_subscriptions_example() -> None:
     # medium frequency
     def on_medium_frequency_change(price_change: PriceChange) -> None:
         last = price_change.new_quote.last or Decimal(0)
-        print(f"[MED] {price_change.instrument.symbol}: ${last:.2f}")
+        log.info("[MED] %s: $%.2f", price_change.instrument.symbol, last)
 
     medium_frequency_instruments = [
         OrderInstrument(symbol="MSFT", type=InstrumentType.EQUITY),
@@ -245,12 +268,44 @@ def multiple_subscriptions_example() -> None:
 
 
 # Example 4: Custom price alert system
+class Alert:
+    """A single price alert. Slots keep per-alert memory small and make
+    attribute reads on the per-tick hot path cheaper than dict lookups.
+
+    (Explicit __slots__ rather than dataclass(slots=True), which needs
+    Python 3.10 while the SDK supports 3.9.)
+    """
+
+    __slots__ = ("symbol", "type", "target", "alert_type", "comparator", "triggered")
+
+    def __init__(
+        self,
+        symbol: str,
+        type: InstrumentType,  # pylint: disable=redefined-builtin
+        target: Decimal,
+        alert_type: str = "above",
+    ):
+        self.symbol = symbol
+        self.type = type
+        self.target = target
+        self.alert_type = alert_type
+        # bind the comparison once at construction so the per-tick check
+        # doesn't re-branch on the alert_type string
+        self.comparator = operator.gt if alert_type == "above" else operator.lt
+        self.triggered = False
+
+
 class PriceAlertSystem:
     """A custom price alert system built on top of subscriptions."""
 
     def __init__(self, client: PublicApiClient):
         self.client = client
-        self.alerts: Dict[str, Dict] = {}
+        # keyed by (symbol, type) tuple: hashed once per tick with no
+        # per-callback string formatting
+        self.alerts: Dict[Tuple[str, InstrumentType], Alert] = {}
+        # instruments snapshot kept in lockstep with alerts, so
+        # start_monitoring doesn't rebuild OrderInstrument models per call
+        self._instruments: List[OrderInstrument] = []
         self.subscription_id = ""
 
     def add_alert(
@@ -260,56 +315,49 @@ class PriceAlertSystem:
         target_price: Decimal,
         alert_type: str = "above",
     ) -> None:
-        key = f"{symbol}_{instrument_type.value}"
-        self.alerts[key] = {
-            "symbol": symbol,
-            "type": instrument_type,
-            "target": target_price,
-            "alert_type": alert_type,
-            "triggered": False,
-        }
+        key = (symbol, instrument_type)
+        if key not in self.alerts:
+            self._instruments.append(
+                OrderInstrument(symbol=symbol, type=instrument_type)
+            )
+        self.alerts[key] = Alert(
+            symbol=symbol,
+            type=instrument_type,
+            target=target_price,
+            alert_type=alert_type,
+        )
 
     def start_monitoring(self) -> None:
         if not self.alerts:
             print("No alerts configured")
             return
 
-        instruments = [
-            OrderInstrument(symbol=alert["symbol"], type=alert["type"])
-            for alert in self.alerts.values()
-        ]
         self.subscription_id = self.client.price_stream.subscribe(
-            instruments=instruments,
+            instruments=self._instruments,
             callback=self._check_alerts,
             config=SubscriptionConfig(polling_frequency_seconds=1.0),
         )
 
     def _check_alerts(self, price_change: PriceChange) -> None:
         """Check if any alerts should be triggered."""
-        key = f"{price_change.instrument.symbol}_{price_change.instrument.type.value}"
-
-        if key not in self.alerts:
-            return
+        instrument = price_change.instrument
+        alert = self.alerts.get((instrument.symbol, instrument.type))
 
-        alert = self.alerts[key]
-        if alert["triggered"]:
+        if alert is None or alert.triggered:
             return
 
         current_price = price_change.new_quote.last
         if not current_price:
             return
 
-        should_trigger = False
-        if alert["alert_type"] == "above" and current_price > alert["target"]:
-            should_trigger = True
-        elif alert["alert_type"] == "below" and current_price < alert["target"]:
-            should_trigger = True
-
-        if should_trigger:
-            alert["triggered"] = True
-            print(
-                f"🔔 ALERT: {alert['symbol']} is now ${current_price:.2f} "
-                f"({alert['alert_type']} target ${alert['target']:.2f})"
+        if alert.comparator(current_price, alert.target):
+            alert.triggered = True
+            log.info(
+                "🔔 ALERT: %s is now $%.2f (%s target $%.2f)",
+                alert.symbol,
+                current_price,
+                alert.alert_type,
+                alert.target,
             )
 
     def stop_monitoring(self) -> None:
@@ -319,17 +367,7 @@ class PriceAlertSystem:
 
 
 def price_alert_example() -> None:
-    api_secret_key = os.environ.get("API_SECRET_KEY")
-    if not api_secret_key:
-        raise ValueError("API_SECRET_KEY environment variable is required")
-
-    auth_config = ApiKeyAuthConfig(
-        api_secret_key=api_secret_key, validity_minutes=15
-    )
-    config = PublicApiClientConfiguration(
-        default_account_number=os.environ.get("DEFAULT_ACCOUNT_NUMBER")
-    )
-    client = PublicApiClient(auth_config=auth_config, config=config)
+    client = _get_client()
 
     # create alert system
     alert_system = PriceAlertSystem(client)
@@ -353,29 +391,29 @@ def price_alert_example() -> None:
 
 
 if __name__ == "__main__":
-    import sys
-
-    # load env variables from .env file
-    load_dotenv()
-
-    print("Public API SDK - Price Subscription Examples")
-    print("=" * 50)
-    print("1. Basic subscription example")
-    print("2. Advanced async subscription example")
-    print("3. Multiple concurrent subscriptions")
-    print("4. Price alert system")
-    print("=" * 50)
-
-    choice = input("Select an example (1-4): ").strip()
-
-    if choice == "1":
-        basic_subscription_example()
-    elif choice == "2":
-        asyncio.run(advanced_subscription_example())
-    elif choice == "3":
-        multiple_subscriptions_example()
-    elif choice == "4":
-        price_alert_example()
-    else:
-        print("Invalid choice")
-        sys.exit(1)
+    import argparse
+
+    # non-interactive dispatch: `python example_price_subscription.py
+    # --example 2` works in scripts and CI, with no input() TTY wait
+    examples = {
+        1: basic_subscription_example,
+        2: lambda: asyncio.run(advanced_subscription_example()),
+        3: multiple_subscriptions_example,
+        4: price_alert_example,
+    }
+
+    parser = argparse.ArgumentParser(
+        description="Public API SDK - Price Subscription Examples"
+    )
+    parser.add_argument(
+        "--example",
+        type=int,
+        choices=sorted(examples),
+        required=True,
+        help=(
+            "1: basic subscription, 2: advanced async subscription, "
+            "3: multiple concurrent subscriptions, 4: price alert system"
+        ),
+    )
+    args = parser.parse_args()
+    examples[args.example]()
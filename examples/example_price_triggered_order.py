@@ -1,11 +1,10 @@
+import operator
 import os
-import time
+import threading
 import uuid
 from decimal import Decimal
 from typing import Optional
 
-from dotenv import load_dotenv
-
 from public_api_sdk import (
     ApiKeyAuthConfig,
     InstrumentType,
@@ -23,16 +22,46 @@ from public_api_sdk import (
     PriceChange,
     SubscriptionConfig,
     OrderSubscriptionConfig,
-    WaitTimeoutError,
 )
 
+# import and run dotenv only when a .env file is actually present — CI and
+# container runs that inject env vars directly skip the import and parse
+# (this must stay above the DRY_RUN read below)
+if os.path.exists(".env"):
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
 
 # Set DRY_RUN=false to enable live order placement. Defaults to true (safe).
 DRY_RUN = os.environ.get("DRY_RUN", "true").lower() != "false"
 
 
 class PriceTriggeredOrderBot:
-    """A bot that monitors price and places an order when a threshold is reached."""
+    """A bot that monitors price and places an order when a threshold is reached.
+
+    Uses __slots__: the bot's attributes are read on every price tick, and
+    slot descriptors are both smaller and faster than __dict__ lookups.
+    (Explicit __slots__ rather than dataclass(slots=True), which needs
+    Python 3.10 while the SDK supports 3.9.)
+    """
+
+    __slots__ = (
+        "client",
+        "symbol",
+        "target_price",
+        "order_quantity",
+        "dry_run",
+        "order_side",
+        "_target_display",
+        "_trigger",
+        "_trigger_word",
+        "order_placed",
+        "current_order",
+        "price_subscription_id",
+        "order_subscription_id",
+        "_done",
+    )
 
     def __init__(
         self,
@@ -48,10 +77,28 @@ class PriceTriggeredOrderBot:
         self.order_quantity = order_quantity
         self.dry_run = dry_run
         self.order_side = OrderSide.BUY
+        # precompute the display string once so the target is not
+        # re-formatted on every callback; the trigger itself compares the
+        # Decimal prices exactly, so sub-cent quotes are never rounded
+        # across the threshold
+        self._target_display = f"${target_price:.2f}"
+        # bind the trigger comparator once: order_side never changes after
+        # construction, so each tick skips the buy/sell branch entirely
+        if self.order_side == OrderSide.BUY:
+            # for buy orders, trigger when price is at or below target
+            self._trigger = operator.le
+            self._trigger_word = "at or below"
+        else:
+            # for sell orders, trigger when price is at or above target
+            self._trigger = operator.ge
+            self._trigger_word = "at or above"
         self.order_placed = False
         self.current_order: Optional[NewOrder] = None
         self.price_subscription_id: Optional[str] = None
         self.order_subscription_id: Optional[str] = None
+        # set by on_order_update when the order reaches a terminal status,
+        # so main() can block on it instead of polling in a sleep loop
+        self._done = threading.Event()
 
     def on_price_change(self, price_change: PriceChange) -> None:
         if not price_change.new_quote or not price_change.new_quote.last:
@@ -61,32 +108,16 @@ class PriceTriggeredOrderBot:
 
         print(
             f"📊 {self.symbol} Price: ${current_price:.2f} "
-            f"(Target: ${self.target_price:.2f})"
+            f"(Target: {self._target_display})"
         )
 
         # check if we should place an order
-        if not self.order_placed:
-            should_place_order = False
-
-            if self.order_side == OrderSide.BUY:
-                # for buy orders, trigger when price is at or below target
-                if current_price <= self.target_price:
-                    should_place_order = True
-                    print(
-                        f"✅ Price ${current_price:.2f} is at or below target "
-                        f"${self.target_price:.2f}"
-                    )
-            else:
-                # for sell orders, trigger when price is at or above target
-                if current_price >= self.target_price:
-                    should_place_order = True
-                    print(
-                        f"✅ Price ${current_price:.2f} is at or above target "
-                        f"${self.target_price:.2f}"
-                    )
-
-            if should_place_order:
-                self.place_market_order()
+        if not self.order_placed and self._trigger(current_price, self.target_price):
+            print(
+                f"✅ Price ${current_price:.2f} is {self._trigger_word} "
+                f"target {self._target_display}"
+            )
+            self.place_market_order()
 
     def place_market_order(self) -> None:
         if self.order_placed:
@@ -116,8 +147,7 @@ class PriceTriggeredOrderBot:
                 order_side=self.order_side,
                 order_type=OrderType.MARKET,
                 expiration=OrderExpirationRequest(
-                    time_in_force=TimeInForce.DAY,
-                    expiration_time=None
+                    time_in_force=TimeInForce.DAY, expiration_time=None
                 ),
                 quantity=self.order_quantity,
                 amount=None,  # Not needed for orders with quantity
@@ -163,14 +193,17 @@ class PriceTriggeredOrderBot:
                 print("\n🛑 Stopping price monitoring...")
                 self.client.price_stream.unsubscribe(self.price_subscription_id)
                 self.price_subscription_id = None
+            self._done.set()
 
         elif update.new_status == OrderStatus.CANCELLED:
             print("\n❌ Order CANCELLED")
             self.order_placed = False
+            self._done.set()
 
         elif update.new_status == OrderStatus.REJECTED:
             print(f"\n⚠️ Order REJECTED: {update.order.reject_reason}")
             self.order_placed = False
+            self._done.set()
 
     def start_monitoring(self) -> None:
         print(f"\n🔍 Starting price monitoring for {self.symbol}...")
@@ -193,6 +226,13 @@ class PriceTriggeredOrderBot:
             ),
         )
 
+    def wait_until_done(self, timeout: float) -> bool:
+        """Block until the order reaches a terminal status or timeout elapses.
+
+        Returns True if a terminal status was reached, False on timeout.
+        """
+        return self._done.wait(timeout)
+
     def stop_monitoring(self) -> None:
         if self.price_subscription_id:
             self.client.price_stream.unsubscribe(self.price_subscription_id)
@@ -223,15 +263,11 @@ def main() -> None:
         print("3. Track the order until it's filled")
     print("=" * 60)
 
-    load_dotenv()
-
     api_secret_key = os.environ.get("API_SECRET_KEY")
     if not api_secret_key:
         raise ValueError("API_SECRET_KEY environment variable is required")
 
-    auth_config = ApiKeyAuthConfig(
-        api_secret_key=api_secret_key, validity_minutes=15
-    )
+    auth_config = ApiKeyAuthConfig(api_secret_key=api_secret_key, validity_minutes=15)
     config = PublicApiClientConfiguration(
         default_account_number=os.environ.get("DEFAULT_ACCOUNT_NUMBER"),
     )
@@ -248,28 +284,17 @@ def main() -> None:
     try:
         bot.start_monitoring()
 
-        # run for a maximum time (2 minutes) or until order is filled
+        # run for a maximum time (2 minutes) or until the order terminates
         max_runtime = 120
-        start_time = time.time()
 
         print("\nMonitoring... (Press Ctrl+C to stop)\n")
 
-        while time.time() - start_time < max_runtime:
-            # check if order has been filled
-            if bot.current_order:
-                try:
-                    # wait for the order to reach terminal status (with short timeout)
-                    order = bot.current_order.wait_for_terminal_status(timeout=1)
-                    if order.status == OrderStatus.FILLED:
-                        print("\n✅ Order filled successfully! Exiting...")
-                        break
-                except WaitTimeoutError:
-                    # order not yet in terminal status, continue monitoring
-                    pass
-
-            time.sleep(1)
-
-        if time.time() - start_time >= max_runtime:
+        # block on the bot's terminal-status event instead of waking up
+        # every second to re-poll: the order subscription already delivers
+        # the terminal update, so this is one wakeup for the whole wait
+        if bot.wait_until_done(timeout=max_runtime):
+            print("\n✅ Order reached a terminal status! Exiting...")
+        else:
             print(f"\n⏱️ Maximum runtime of {max_runtime} seconds reached")
     except KeyboardInterrupt:
         print("\n\n Interrupted by user")
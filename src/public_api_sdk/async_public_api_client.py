@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional, TYPE_CHECKING
+from typing import AsyncIterator, List, Optional, TYPE_CHECKING
 
 import httpx
 
@@ -355,6 +355,37 @@ class AsyncPublicApiClient:
         )
         return InstrumentsResponse(**response)
 
+    async def iter_instruments(
+        self,
+        instruments_request: Optional[InstrumentsRequest] = None,
+        account_id: Optional[str] = None,
+    ) -> AsyncIterator[Instrument]:
+        """Iterate over available trading instruments one at a time.
+
+        Async counterpart to PublicApiClient.iter_instruments: one fetch
+        today (the endpoint is unpaginated), but models are validated
+        lazily so scans stay O(1) in model overhead.
+
+        Args:
+            instruments_request: Optional filters (type, capabilities)
+            account_id: Account ID (optional when default_account_number is set)
+
+        Yields:
+            Instrument details, one per matching instrument
+        """
+        account_id = self._get_account_id(account_id)
+        await self.auth_manager.refresh_token_if_needed()
+        response = await self.api_client.get(
+            "/userapigateway/trading/instruments",
+            params=(
+                instruments_request.model_dump(by_alias=True, exclude_none=True)
+                if instruments_request
+                else None
+            ),
+        )
+        for item in response.get("instruments", []):
+            yield Instrument(**item)
+
     async def get_instrument(
         self, symbol: str, instrument_type: InstrumentType
     ) -> Instrument:
@@ -3,7 +3,7 @@
 import asyncio
 import logging
 import uuid
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 from .models import (
     OrderInstrument,
@@ -276,7 +276,12 @@ class AsyncPriceSubscriptionManager:
 
             old_quote = self._last_quotes.get(key)
             if old_quote is not None:
-                price_change = self._detect_price_change(instrument, old_quote, new_quote)
+                price_change = self._detect_price_change(
+                    instrument,
+                    old_quote,
+                    new_quote,
+                    subscription.config.watch_fields,
+                )
                 if price_change and subscription.callback:
                     await self._execute_callback(subscription.callback, price_change)
 
@@ -321,15 +326,19 @@ class AsyncPriceSubscriptionManager:
         return []
 
     def _detect_price_change(
-        self, instrument: OrderInstrument, old_quote: Quote, new_quote: Quote
+        self,
+        instrument: OrderInstrument,
+        old_quote: Quote,
+        new_quote: Quote,
+        watch_fields: Tuple[str, ...] = ("last", "bid", "ask"),
     ) -> Optional[PriceChange]:
-        changed_fields = []
-        if old_quote.last != new_quote.last:
-            changed_fields.append("last")
-        if old_quote.bid != new_quote.bid:
-            changed_fields.append("bid")
-        if old_quote.ask != new_quote.ask:
-            changed_fields.append("ask")
+        # compare only the fields the subscription watches; no change in
+        # any of them means no callback dispatch for this tick
+        changed_fields = [
+            field
+            for field in watch_fields
+            if getattr(old_quote, field) != getattr(new_quote, field)
+        ]
 
         if changed_fields:
             return PriceChange(
@@ -18,6 +18,11 @@ class APIError(Exception):
             (the ``errorCode`` field), or ``None`` when absent.
     """
 
+    # slots keep the attributes off the per-instance __dict__ (which the
+    # Exception base still provides, but empty) — a client raising these in
+    # a rate-limit storm allocates noticeably less
+    __slots__ = ("message", "status_code", "response_data", "error_code")
+
     def __init__(
         self,
         message: str,
@@ -59,6 +64,8 @@ class AuthenticationError(APIError):
             print("Invalid or expired credentials.")
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Authentication failed",
@@ -90,11 +97,13 @@ class RateLimitError(APIError):
             quotes = client.get_quotes(instruments)
     """
 
+    __slots__ = ("retry_after",)
+
     def __init__(
         self,
         message: str = "Rate limit exceeded",
         status_code: int = 429,
-        retry_after: Optional[int] = None,
+        retry_after: Optional[float] = None,
         response_data: Optional[Dict[str, Any]] = None,
     ) -> None:
         super().__init__(message, status_code, response_data)
@@ -128,6 +137,8 @@ class ValidationError(APIError):
             print(f"Details: {e.response_data}")
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Request validation failed",
@@ -161,6 +172,8 @@ class NotFoundError(APIError):
             print("Order not found yet; retrying...")
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Resource not found",
@@ -190,6 +203,8 @@ class ServerError(APIError):
             order = client.place_order(order_request)
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Internal server error",
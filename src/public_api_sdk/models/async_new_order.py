@@ -178,14 +178,21 @@ class AsyncNewOrder:
                 if order.status in target_statuses:
                     return order
 
-            if timeout is not None and time.monotonic() - start >= timeout:
-                current = order.status if order else "not indexed yet"
-                raise WaitTimeoutError(
-                    f"Timeout waiting for order {self._order_id} to reach "
-                    f"status {target_statuses}. Current status: {current}"
-                )
-
-            await asyncio.sleep(polling_interval)
+            if timeout is not None:
+                elapsed = time.monotonic() - start
+                if elapsed >= timeout:
+                    current = order.status if order else "not indexed yet"
+                    raise WaitTimeoutError(
+                        f"Timeout waiting for order {self._order_id} to reach "
+                        f"status {target_statuses}. Current status: {current}"
+                    )
+                # sleep until the next poll, never past the deadline: the
+                # order API has no push channel to wake us early, but we can
+                # at least avoid overshooting the caller's timeout by a full
+                # interval
+                await asyncio.sleep(min(polling_interval, timeout - elapsed))
+            else:
+                await asyncio.sleep(polling_interval)
 
     async def wait_for_fill(
         self,
@@ -244,15 +251,19 @@ class AsyncNewOrder:
                     else:
                         on_partial_fill(order)
 
-            if timeout is not None and time.monotonic() - start >= timeout:
-                current = order.status if order else "not indexed yet"
-                raise WaitTimeoutError(
-                    f"Order {self._order_id} did not fill within {timeout}s. "
-                    f"Current status: {current}",
-                    current_order=last_seen_order,
-                )
-
-            await asyncio.sleep(polling_interval)
+            if timeout is not None:
+                elapsed = time.monotonic() - start
+                if elapsed >= timeout:
+                    current = order.status if order else "not indexed yet"
+                    raise WaitTimeoutError(
+                        f"Order {self._order_id} did not fill within {timeout}s. "
+                        f"Current status: {current}",
+                        current_order=last_seen_order,
+                    )
+                # as above: cap the sleep to the remaining timeout budget
+                await asyncio.sleep(min(polling_interval, timeout - elapsed))
+            else:
+                await asyncio.sleep(polling_interval)
 
     async def wait_for_terminal_status(self, timeout: Optional[float] = None) -> Order:
         """Poll until the order reaches any terminal status.
@@ -244,9 +244,13 @@ class NewOrder:
                         f"Timeout waiting for order {self._order_id} to reach "
                         f"status {target_statuses}. Current status: {current}"
                     )
-
-            # sleep before next check
-            time.sleep(polling_interval)
+                # sleep before next check, never past the deadline: the order
+                # API has no push channel to wake us early, but we can at
+                # least avoid overshooting the caller's timeout by a full
+                # interval
+                time.sleep(min(polling_interval, timeout - elapsed))
+            else:
+                time.sleep(polling_interval)
 
     def wait_for_fill(
         self,
@@ -313,8 +317,10 @@ class NewOrder:
                         f"Current status: {current}",
                         current_order=last_seen_order,
                     )
-
-            time.sleep(polling_interval)
+                # as above: cap the sleep to the remaining timeout budget
+                time.sleep(min(polling_interval, timeout - elapsed))
+            else:
+                time.sleep(polling_interval)
 
     def wait_for_terminal_status(self, timeout: Optional[float] = None) -> Order:
         """
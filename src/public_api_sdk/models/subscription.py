@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Callable, List, Optional, Any, Union, Awaitable
+from typing import Callable, List, Optional, Any, Tuple, Union, Awaitable
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
 from .order import OrderInstrument
@@ -59,6 +59,35 @@ class SubscriptionConfig(BaseModel):
             "DEGRADED.  Signature: on_error(subscription_id: str, exc: Exception)"
         ),
     )
+    callback_timeout_seconds: Optional[float] = Field(
+        default=None,
+        gt=0.0,
+        description=(
+            "Upper bound on how long one price-change callback may run.  "
+            "When set, sync callbacks are dispatched to the shared pool and "
+            "the poll pass stops waiting at the deadline instead of letting "
+            "a slow callback stall every other subscription; None keeps the "
+            "inline fast path."
+        ),
+    )
+    watch_fields: Tuple[str, ...] = Field(
+        default=("last", "bid", "ask"),
+        description=(
+            "Quote fields compared between polls; the callback fires only "
+            "when at least one watched field changed.  Narrow this (e.g. "
+            "('last',)) to suppress bid/ask-only ticks."
+        ),
+    )
+
+    @field_validator("watch_fields")
+    @classmethod
+    def validate_watch_fields(cls, v: Tuple[str, ...]) -> Tuple[str, ...]:
+        if not v:
+            raise ValueError("watch_fields must name at least one quote field")
+        unknown = [f for f in v if f not in Quote.model_fields]
+        if unknown:
+            raise ValueError(f"Unknown quote fields in watch_fields: {unknown}")
+        return v
 
     @field_validator("polling_frequency_seconds")
     @classmethod
@@ -39,6 +39,12 @@ class OrderSubscriptionManager:
     Manages order status subscriptions and polling.
 
     Similar to PriceSubscriptionManager but focused on order updates.
+
+    Updates are detected by polling ``GET /order/{id}`` because the
+    Public.com API does not expose a streaming (WebSocket/SSE) order feed.
+    All subscriptions share a single background polling thread, so N
+    concurrent subscriptions cost one scheduler loop rather than N threads;
+    if the API grows a push feed, this manager is the place to consume it.
     """
 
     def __init__(self, get_order_func: Callable[[str, str], Order]):
@@ -1,6 +1,6 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from .api_client import ApiClient
 from .auth_config import AuthConfig
@@ -310,6 +310,34 @@ class PublicApiClient:
         )
         return InstrumentsResponse(**response)
 
+    def iter_instruments(
+        self,
+        instruments_request: Optional[InstrumentsRequest] = None,
+        account_id: Optional[str] = None,
+    ) -> Iterator[Instrument]:
+        """
+        Iterate over available trading instruments one at a time.
+
+        The instruments endpoint currently returns the whole universe in a
+        single response, but validating every row into a pydantic model up
+        front is wasteful when the caller only scans or filters. This
+        generator validates lazily, one instrument per step, and callers
+        written against it will keep working unchanged if server-side
+        pagination is introduced.
+        """
+        account_id = self.__get_account_id(account_id)
+        self.auth_manager.refresh_token_if_needed()
+        response = self.api_client.get(
+            "/userapigateway/trading/instruments",
+            params=(
+                instruments_request.model_dump(by_alias=True, exclude_none=True)
+                if instruments_request
+                else None
+            ),
+        )
+        for item in response.get("instruments", []):
+            yield Instrument(**item)
+
     def get_instrument(
         self, symbol: str, instrument_type: InstrumentType
     ) -> Instrument:
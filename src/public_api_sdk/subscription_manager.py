@@ -1,9 +1,11 @@
 import asyncio
+import itertools
 import logging
 import threading
 import time
-import uuid
-from typing import Dict, List, Optional, Set, Callable
+import weakref
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Set, Callable, Tuple
 from concurrent.futures import ThreadPoolExecutor
 
 from .models import (
@@ -17,27 +19,72 @@ from .models import (
     PriceChangeCallback,
 )
 
-
 logger = logging.getLogger(__name__)
 
 
+def _instrument_key(instrument: OrderInstrument) -> str:
+    """Dict key identifying one instrument across the manager's indexes."""
+    return f"{instrument.symbol}_{instrument.type.value}"
+
+
 class PriceSubscriptionManager:
+    """
+    Manages price subscriptions and quote polling.
+
+    All subscriptions are driven by a single asyncio event loop running in
+    one background thread: each tick is an ``await``, not a per-subscription
+    sleeping OS thread, so N concurrent subscriptions cost one scheduler
+    loop rather than N threads. Blocking work (the synchronous get_quotes
+    call and sync user callbacks) is offloaded to a shared executor.
+    """
+
     def __init__(self, get_quotes_func: Callable[[List[OrderInstrument]], List[Quote]]):
         self.get_quotes_func = get_quotes_func
         self.default_config = SubscriptionConfig()
-        self.subscriptions: Dict[str, Subscription] = {}
-        self.instrument_to_subscription: Dict[str, Set[str]] = {}
+        # copy-on-write: mutators build a fresh dict under _lock and swap
+        # the reference, so the polling loop reads a coherent snapshot
+        # without taking any lock (attribute loads are atomic under the GIL)
+        self._subscriptions: Mapping[str, Subscription] = MappingProxyType({})
+        # tuple view over _subscriptions, rebuilt on the same swaps; the
+        # per-tick scans iterate this instead of materializing .values()
+        self._subs_view: Tuple[Subscription, ...] = ()
+        self._instrument_to_subscription: Mapping[str, Set[str]] = MappingProxyType({})
+        # ids with status ACTIVE, maintained on every transition (guarded
+        # by _lock) so get_active_subscriptions need not scan all subs
+        self._active_ids: Set[str] = set()
         self.last_quotes: Dict[str, Quote] = {}
         # track last poll time per subscription
         self.last_poll_times: Dict[str, float] = {}
         self.polling_task: Optional[asyncio.Task] = None
         self.loop: Optional[asyncio.AbstractEventLoop] = None
         self.thread: Optional[threading.Thread] = None
-        self.executor = ThreadPoolExecutor(max_workers=10)
+        # set from other threads (via call_soon_threadsafe) whenever the
+        # subscription set or a polling frequency changes, so the loop
+        # re-evaluates its deadline instead of sleeping out the old one
+        self._wakeup: Optional[asyncio.Event] = None
+        # one pool for every subscription's blocking work (quote fetches and
+        # sync callbacks): threads are reused across events, never created
+        # per dispatch
+        self.executor = ThreadPoolExecutor(
+            max_workers=10, thread_name_prefix="price-sub"
+        )
         self._stop_event = threading.Event()
         self._lock = threading.Lock()
         # consecutive failure counter per subscription (not stored in Pydantic model)
         self._consecutive_failures: Dict[str, int] = {}
+        # subscription ids only need to be unique within this manager;
+        # next() on a count is atomic under the GIL, so no lock is needed
+        self._next_id = itertools.count(1)
+
+    @property
+    def subscriptions(self) -> Mapping[str, Subscription]:
+        """Read-only snapshot of subscription id -> Subscription."""
+        return self._subscriptions
+
+    @property
+    def instrument_to_subscription(self) -> Mapping[str, Set[str]]:
+        """Read-only snapshot of instrument key -> subscribing ids."""
+        return self._instrument_to_subscription
 
     def start(self) -> None:
         if self.thread and self.thread.is_alive():
@@ -50,6 +97,7 @@ class PriceSubscriptionManager:
     def _run_event_loop(self) -> None:
         self.loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
+        self._wakeup = asyncio.Event()
         self.polling_task = self.loop.create_task(self._polling_loop())
 
         try:
@@ -63,57 +111,105 @@ class PriceSubscriptionManager:
         while not self._stop_event.is_set():
             try:
                 await self._poll_all_subscriptions()
-
-                # Find minimum polling frequency across all active/degraded subscriptions
-                min_frequency = self.default_config.polling_frequency_seconds
-                with self._lock:
-                    for sub in self.subscriptions.values():
-                        if sub.status in (
-                            SubscriptionStatus.ACTIVE,
-                            SubscriptionStatus.DEGRADED,
-                        ):
-                            min_frequency = min(
-                                min_frequency, sub.config.polling_frequency_seconds
-                            )
-
-                await asyncio.sleep(min_frequency)
+                await self._wait_for_next_poll(self._seconds_until_next_poll())
             except (RuntimeError, ValueError, TypeError) as e:
                 logger.error("Error in polling loop: %s", e)
                 await asyncio.sleep(1)
 
+    async def _wait_for_next_poll(self, delay: Optional[float]) -> None:
+        """Sleep until the next deadline or until a mutator wakes the loop.
+
+        Waiting on the event rather than a plain ``asyncio.sleep`` means a
+        new subscription with a short frequency (or a lowered frequency on
+        an existing one) takes effect immediately instead of after the
+        previously computed deadline expires.  ``delay=None`` means nothing
+        is pollable (no subscriptions, or all paused): the loop then blocks
+        on the event alone, burning no CPU until the next mutation or
+        ``stop()``.
+        """
+        if self._wakeup is None:
+            if delay is None:
+                delay = self.default_config.polling_frequency_seconds
+            await asyncio.sleep(delay)
+            return
+        # clearing here cannot lose a wakeup: set() from other threads is
+        # delivered through call_soon_threadsafe, so it runs in this thread
+        # only once we reach the await below, where it ends the wait
+        self._wakeup.clear()
+        if delay is None:
+            await self._wakeup.wait()
+            return
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+
+    def _notify_loop(self) -> None:
+        """Wake the polling loop so it re-evaluates deadlines now."""
+        loop = self.loop
+        wakeup = self._wakeup
+        if loop is None or wakeup is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(wakeup.set)
+        except RuntimeError:
+            pass  # loop shut down between the check and the call
+
+    def _seconds_until_next_poll(self) -> Optional[float]:
+        """Seconds until the earliest subscription deadline, or None if idle.
+
+        Deadlines are absolute (last poll time + frequency) on the monotonic
+        clock, so the runtime of the poll pass itself does not push every
+        subsequent tick later the way a fixed ``sleep(frequency)`` would.
+        None means no subscription is pollable; the caller then waits for a
+        mutation instead of ticking on the default frequency.
+        """
+        next_deadline: Optional[float] = None
+        for sub in self._subs_view:
+            if sub.status in (
+                SubscriptionStatus.ACTIVE,
+                SubscriptionStatus.DEGRADED,
+            ):
+                last_poll = self.last_poll_times.get(sub.id)
+                if last_poll is None:
+                    # never polled: due immediately
+                    return 0.0
+                deadline = last_poll + sub.config.polling_frequency_seconds
+                if next_deadline is None or deadline < next_deadline:
+                    next_deadline = deadline
+        if next_deadline is None:
+            return None
+        return max(0.0, next_deadline - time.monotonic())
+
     async def _poll_all_subscriptions(self) -> None:
-        with self._lock:
-            active_subscriptions = [
-                sub
-                for sub in self.subscriptions.values()
-                if sub.status in (SubscriptionStatus.ACTIVE, SubscriptionStatus.DEGRADED)
-            ]
+        # lock-free: _subs_view is an immutable snapshot swapped whole;
+        # status is filtered per tick because it mutates in place
+        active_subscriptions = [
+            sub
+            for sub in self._subs_view
+            if sub.status in (SubscriptionStatus.ACTIVE, SubscriptionStatus.DEGRADED)
+        ]
 
         if not active_subscriptions:
             return
 
-        # group instruments by subscription config for batch processing
-        config_groups: Dict[float, List[Subscription]] = {}
-        for sub in active_subscriptions:
-            freq = sub.config.polling_frequency_seconds
-            if freq not in config_groups:
-                config_groups[freq] = []
-            config_groups[freq].append(sub)
-
-        # process each config group
-        for frequency, subs in config_groups.items():
-            # check if it's time to poll this group
-            current_time = time.time()
-            should_poll = any(
-                sub.id not in self.last_poll_times
-                or (current_time - self.last_poll_times.get(sub.id, 0)) >= frequency
-                for sub in subs
-            )
-
-            if should_poll:
-                await self._poll_subscription_group(subs)
-                for sub in subs:
-                    self.last_poll_times[sub.id] = current_time
+        # collect every subscription that is due on this tick, regardless of
+        # its configured frequency: one get_quotes call then serves all of
+        # them, so overlapping instruments are fetched once per tick instead
+        # of once per subscription
+        current_time = time.monotonic()
+        due_subscriptions = [
+            sub
+            for sub in active_subscriptions
+            if sub.id not in self.last_poll_times
+            or (current_time - self.last_poll_times[sub.id])
+            >= sub.config.polling_frequency_seconds
+        ]
+
+        if due_subscriptions:
+            await self._poll_subscription_group(due_subscriptions)
+            for sub in due_subscriptions:
+                self.last_poll_times[sub.id] = current_time
 
     async def _poll_subscription_group(self, subscriptions: List[Subscription]) -> None:
         # collect all unique instruments
@@ -121,7 +217,7 @@ class PriceSubscriptionManager:
         seen = set()
         for sub in subscriptions:
             for instrument in sub.instruments:
-                key = f"{instrument.symbol}_{instrument.type.value}"
+                key = _instrument_key(instrument)
                 if key not in seen:
                     seen.add(key)
                     all_instruments.append(instrument)
@@ -146,6 +242,8 @@ class PriceSubscriptionManager:
                     and sub.status == SubscriptionStatus.ACTIVE
                 ):
                     sub.status = SubscriptionStatus.DEGRADED
+                    with self._lock:
+                        self._active_ids.discard(sub.id)
                     logger.warning(
                         "Subscription %s is DEGRADED after %d consecutive failures",
                         sub.id,
@@ -162,10 +260,7 @@ class PriceSubscriptionManager:
             return
 
         # create a map for quick lookup
-        quote_map = {}
-        for quote in quotes:
-            key = f"{quote.instrument.symbol}_{quote.instrument.type.value}"
-            quote_map[key] = quote
+        quote_map = {_instrument_key(quote.instrument): quote for quote in quotes}
 
         # check for price changes and trigger callbacks
         for sub in subscriptions:
@@ -174,24 +269,36 @@ class PriceSubscriptionManager:
                 self._consecutive_failures[sub.id] = 0
                 if sub.status == SubscriptionStatus.DEGRADED:
                     sub.status = SubscriptionStatus.ACTIVE
-                    logger.info(
-                        "Subscription %s recovered from DEGRADED state", sub.id
-                    )
+                    with self._lock:
+                        # guard against an unsubscribe that raced the poll
+                        if sub.id in self._subscriptions:
+                            self._active_ids.add(sub.id)
+                    logger.info("Subscription %s recovered from DEGRADED state", sub.id)
 
             for instrument in sub.instruments:
-                key = f"{instrument.symbol}_{instrument.type.value}"
-                if key in quote_map:
-                    new_quote = quote_map[key]
-                    old_quote = self.last_quotes.get(key)
-
-                    if old_quote:
-                        price_change = self._detect_price_change(
-                            instrument, old_quote, new_quote
+                key = _instrument_key(instrument)
+                new_quote = quote_map.get(key)
+                if new_quote is None:
+                    continue
+                old_quote = self.last_quotes.get(key)
+
+                # without a callback there is nobody to notify, so skip
+                # the field comparison and the PriceChange allocation
+                if old_quote and sub.callback:
+                    price_change = self._detect_price_change(
+                        instrument,
+                        old_quote,
+                        new_quote,
+                        sub.config.watch_fields,
+                    )
+                    if price_change:
+                        await self._execute_callback(
+                            sub.callback,
+                            price_change,
+                            sub.config.callback_timeout_seconds,
                         )
-                        if price_change and sub.callback:
-                            await self._execute_callback(sub.callback, price_change)
 
-                    self.last_quotes[key] = new_quote
+                self.last_quotes[key] = new_quote
 
     async def _fetch_quotes_with_retry(
         self, instruments: List[OrderInstrument], config: SubscriptionConfig
@@ -228,21 +335,19 @@ class PriceSubscriptionManager:
         return []
 
     def _detect_price_change(
-        self, instrument: OrderInstrument, old_quote: Quote, new_quote: Quote
+        self,
+        instrument: OrderInstrument,
+        old_quote: Quote,
+        new_quote: Quote,
+        watch_fields: Tuple[str, ...] = ("last", "bid", "ask"),
     ) -> Optional[PriceChange]:
-        changed_fields = []
-
-        # check last price
-        if old_quote.last != new_quote.last:
-            changed_fields.append("last")
-
-        # check bid
-        if old_quote.bid != new_quote.bid:
-            changed_fields.append("bid")
-
-        # check ask
-        if old_quote.ask != new_quote.ask:
-            changed_fields.append("ask")
+        # compare only the fields the subscription watches; no change in
+        # any of them means no callback dispatch for this tick
+        changed_fields = [
+            field
+            for field in watch_fields
+            if getattr(old_quote, field) != getattr(new_quote, field)
+        ]
 
         if changed_fields:
             return PriceChange(
@@ -255,31 +360,73 @@ class PriceSubscriptionManager:
         return None
 
     async def _execute_callback(
-        self, callback: PriceChangeCallback, price_change: PriceChange
+        self,
+        callback: PriceChangeCallback,
+        price_change: PriceChange,
+        timeout: Optional[float] = None,
     ) -> None:
         try:
             # check if callback is async
             if asyncio.iscoroutinefunction(callback):
-                await callback(price_change)
-            else:
-                # run sync callback in executor
-                if self.loop:
-                    await self.loop.run_in_executor(
-                        self.executor, callback, price_change
+                # schedule rather than await: a slow async handler must not
+                # delay the next poll tick for every other subscription
+                coro = callback(price_change)
+                if timeout is not None:
+                    coro = asyncio.wait_for(coro, timeout)
+                task = asyncio.ensure_future(coro)
+                task.add_done_callback(self._log_callback_exception)
+            elif timeout is not None:
+                # bounded dispatch: the callback runs on the shared pool
+                # and the poll pass stops waiting at the deadline (the
+                # worker thread itself cannot be interrupted)
+                future = asyncio.get_running_loop().run_in_executor(
+                    self.executor, callback, price_change
+                )
+                try:
+                    await asyncio.wait_for(future, timeout)
+                except asyncio.TimeoutError:
+                    logger.warning(
+                        "Callback exceeded its %.3fs timeout; abandoning wait",
+                        timeout,
                     )
-        except (RuntimeError, TypeError, ValueError) as e:
+            else:
+                # sync callbacks run inline: the poll pass awaited the
+                # executor future anyway, so the handoff bought no
+                # concurrency — just a Future allocation and a queue
+                # round-trip per dispatch
+                callback(price_change)
+        except Exception as e:  # pylint: disable=broad-except
+            # a raising user callback must not take down the polling loop
             logger.error("Error executing callback: %s", e)
 
+    @staticmethod
+    def _log_callback_exception(task: "asyncio.Task") -> None:
+        """Surface exceptions from detached callback tasks in the log."""
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.error("Error executing callback: %s", exc)
+
     def subscribe(
         self,
         instruments: List[OrderInstrument],
         callback: PriceChangeCallback,
         config: Optional[SubscriptionConfig] = None,
+        owner: Optional[object] = None,
     ) -> str:
+        """Register a subscription; returns its id.
+
+        ``owner`` optionally ties the subscription's lifetime to another
+        object: when the owner is garbage-collected without an explicit
+        unsubscribe, a finalizer removes the subscription and its cached
+        state, so dropping the owning object cannot leak a polling
+        subscription.  Without an owner the caller must unsubscribe.
+        """
         if not instruments:
             raise ValueError("At least one instrument must be provided")
 
-        subscription_id = str(uuid.uuid4())
+        subscription_id = f"sub-{next(self._next_id)}"
 
         config = config or self.default_config
 
@@ -292,40 +439,62 @@ class PriceSubscriptionManager:
         )
 
         with self._lock:
-            self.subscriptions[subscription_id] = subscription
+            new_subs = dict(self._subscriptions)
+            new_subs[subscription_id] = subscription
 
-            # update instrument mapping
+            # update instrument mapping; modified sets are copied too so
+            # snapshots held by readers never change under them
+            new_map = dict(self._instrument_to_subscription)
             for instrument in instruments:
-                key = f"{instrument.symbol}_{instrument.type.value}"
-                if key not in self.instrument_to_subscription:
-                    self.instrument_to_subscription[key] = set()
-                self.instrument_to_subscription[key].add(subscription_id)
+                key = _instrument_key(instrument)
+                owners = set(new_map.get(key, ()))
+                owners.add(subscription_id)
+                new_map[key] = owners
+
+            self._subscriptions = MappingProxyType(new_subs)
+            self._subs_view = tuple(new_subs.values())
+            self._instrument_to_subscription = MappingProxyType(new_map)
+            self._active_ids.add(subscription_id)
+
+        if owner is not None:
+            weakref.finalize(owner, self.unsubscribe, subscription_id)
 
         # start polling if not already started
         self.start()
+        self._notify_loop()
 
         return subscription_id
 
     def unsubscribe(self, subscription_id: str) -> bool:
         with self._lock:
-            if subscription_id not in self.subscriptions:
+            if subscription_id not in self._subscriptions:
                 return False
 
-            subscription = self.subscriptions[subscription_id]
+            subscription = self._subscriptions[subscription_id]
 
             # remove from instrument mapping
+            new_map = dict(self._instrument_to_subscription)
             for instrument in subscription.instruments:
-                key = f"{instrument.symbol}_{instrument.type.value}"
-                if key in self.instrument_to_subscription:
-                    self.instrument_to_subscription[key].discard(subscription_id)
-                    if not self.instrument_to_subscription[key]:
-                        del self.instrument_to_subscription[key]
+                key = _instrument_key(instrument)
+                if key in new_map:
+                    owners = set(new_map[key])
+                    owners.discard(subscription_id)
+                    if owners:
+                        new_map[key] = owners
+                    else:
+                        del new_map[key]
                         # remove cached quote if no more subscriptions
                         if key in self.last_quotes:
                             del self.last_quotes[key]
 
             # remove subscription
-            del self.subscriptions[subscription_id]
+            new_subs = dict(self._subscriptions)
+            del new_subs[subscription_id]
+
+            self._subscriptions = MappingProxyType(new_subs)
+            self._subs_view = tuple(new_subs.values())
+            self._instrument_to_subscription = MappingProxyType(new_map)
+            self._active_ids.discard(subscription_id)
 
             # clean up poll time tracking
             if subscription_id in self.last_poll_times:
@@ -334,28 +503,36 @@ class PriceSubscriptionManager:
             # clean up failure tracking
             self._consecutive_failures.pop(subscription_id, None)
 
-            return True
+        self._notify_loop()
+        return True
 
     def unsubscribe_all(self) -> None:
         with self._lock:
-            self.subscriptions.clear()
-            self.instrument_to_subscription.clear()
+            self._subscriptions = MappingProxyType({})
+            self._subs_view = ()
+            self._instrument_to_subscription = MappingProxyType({})
+            self._active_ids.clear()
             self.last_quotes.clear()
             self.last_poll_times.clear()
+        self._notify_loop()
 
     def pause_subscription(self, subscription_id: str) -> bool:
         with self._lock:
-            if subscription_id in self.subscriptions:
-                self.subscriptions[subscription_id].status = SubscriptionStatus.PAUSED
-                return True
-            return False
+            if subscription_id not in self.subscriptions:
+                return False
+            self.subscriptions[subscription_id].status = SubscriptionStatus.PAUSED
+            self._active_ids.discard(subscription_id)
+        self._notify_loop()
+        return True
 
     def resume_subscription(self, subscription_id: str) -> bool:
         with self._lock:
-            if subscription_id in self.subscriptions:
-                self.subscriptions[subscription_id].status = SubscriptionStatus.ACTIVE
-                return True
-            return False
+            if subscription_id not in self.subscriptions:
+                return False
+            self.subscriptions[subscription_id].status = SubscriptionStatus.ACTIVE
+            self._active_ids.add(subscription_id)
+        self._notify_loop()
+        return True
 
     def set_polling_frequency(
         self, subscription_id: str, frequency_seconds: float
@@ -364,34 +541,32 @@ class PriceSubscriptionManager:
             raise ValueError("Polling frequency must be between 0.1 and 60 seconds")
 
         with self._lock:
-            if subscription_id in self.subscriptions:
-                self.subscriptions[subscription_id].config.polling_frequency_seconds = (
-                    frequency_seconds
-                )
-                return True
-            return False
+            if subscription_id not in self.subscriptions:
+                return False
+            self.subscriptions[subscription_id].config.polling_frequency_seconds = (
+                frequency_seconds
+            )
+        self._notify_loop()
+        return True
 
     def get_active_subscriptions(self) -> List[str]:
+        # the brief lock keeps the copy coherent against concurrent
+        # transitions; the cost is O(actives), not O(all subscriptions)
         with self._lock:
-            return [
-                sub_id
-                for sub_id, sub in self.subscriptions.items()
-                if sub.status == SubscriptionStatus.ACTIVE
-            ]
+            return list(self._active_ids)
 
     def get_subscription_info(self, subscription_id: str) -> Optional[SubscriptionInfo]:
-        with self._lock:
-            if subscription_id in self.subscriptions:
-                sub = self.subscriptions[subscription_id]
-                return SubscriptionInfo(
-                    id=sub.id,
-                    instruments=sub.instruments,
-                    status=sub.status.value,
-                    polling_frequency=sub.config.polling_frequency_seconds,
-                    retry_on_error=sub.config.retry_on_error,
-                    max_retries=sub.config.max_retries,
-                )
+        sub = self._subscriptions.get(subscription_id)
+        if sub is None:
             return None
+        return SubscriptionInfo(
+            id=sub.id,
+            instruments=sub.instruments,
+            status=sub.status.value,
+            polling_frequency=sub.config.polling_frequency_seconds,
+            retry_on_error=sub.config.retry_on_error,
+            max_retries=sub.config.max_retries,
+        )
 
     def stop(self) -> None:
         self._stop_event.set()
@@ -404,8 +579,11 @@ class PriceSubscriptionManager:
 
         if self.thread:
             self.thread.join(timeout=5)
+            if not self.thread.is_alive():
+                # fully torn down; start() builds a fresh thread and loop
+                self.thread = None
 
-        self.executor.shutdown(wait=False)
+        self.executor.shutdown(wait=False, cancel_futures=True)
 
     def __del__(self) -> None:
         try:
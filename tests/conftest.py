@@ -0,0 +1,116 @@
+"""Shared fixtures for the test suite."""
+
+import copy
+from contextlib import ExitStack
+from unittest.mock import Mock, patch
+
+import pytest
+
+from public_api_sdk import (
+    ApiKeyAuthConfig,
+    PublicApiClient,
+    PublicApiClientConfiguration,
+)
+from public_api_sdk.api_client import ApiClient
+
+
+@pytest.fixture(scope="module")
+def api_client():
+    """One ApiClient (and one underlying requests.Session) per test module.
+
+    Construction builds a session, mounts adapters, and allocates the
+    urllib3 pool manager; sharing one instance amortizes that across all
+    tests in a module.  Tests that mutate the client must scope their
+    changes with ``monkeypatch`` (or a wrapping function-scoped fixture)
+    so state is restored between tests.
+    """
+    client = ApiClient(base_url="https://api.example.com")
+    yield client
+    client.close()
+
+
+class _Recorder:
+    """Minimal stand-in for ``Mock(return_value=...)`` on the hot test path.
+
+    Implements just the slice of the Mock API this suite uses — configurable
+    ``return_value``, ``call_args``/``call_args_list``/``call_count``, and the
+    two assertion helpers — without Mock's child-mock machinery on every call.
+    ``call_args`` is an (args, kwargs) tuple, so ``call_args[0][0]`` and
+    ``call_args[1]["json_data"]`` read the same as with a real Mock.
+    """
+
+    __slots__ = ("return_value", "call_args", "call_args_list", "call_count")
+
+    def __init__(self, return_value=None):
+        self.return_value = return_value
+        self.call_args = None
+        self.call_args_list = []
+        self.call_count = 0
+
+    def __call__(self, *args, **kwargs):
+        self.call_count += 1
+        self.call_args = (args, kwargs)
+        self.call_args_list.append(self.call_args)
+        return self.return_value
+
+    def assert_not_called(self):
+        assert self.call_count == 0, f"expected no calls, got {self.call_count}"
+
+    def assert_called_once(self):
+        assert self.call_count == 1, f"expected one call, got {self.call_count}"
+
+
+class _ApiClientStub:
+    """Stand-in for the real ApiClient with one _Recorder per HTTP verb.
+
+    ``__slots__`` keeps the typo protection a spec_set Mock gave: touching an
+    attribute outside the surface PublicApiClient uses raises AttributeError.
+    """
+
+    __slots__ = ("get", "post", "put", "delete", "close", "base_url")
+
+    def __init__(self):
+        self.get = _Recorder()
+        self.post = _Recorder()
+        self.put = _Recorder()
+        self.delete = _Recorder()
+        self.close = _Recorder()
+        self.base_url = ""
+
+
+@pytest.fixture(scope="session")
+def _base_public_client():
+    """One PublicApiClient template for the whole session.
+
+    Entering the two ``patch()`` context managers and running the full
+    client construction dominates per-test setup in
+    test_public_api_client.py; building the template once and handing out
+    shallow copies amortizes that across the suite.  The default account
+    number matches the ``_ACCOUNT`` constant used by those tests.
+    """
+    with ExitStack() as stack:
+        stack.enter_context(patch("public_api_sdk.public_api_client.ApiClient"))
+        stack.enter_context(patch("public_api_sdk.public_api_client.AuthManager"))
+        client = PublicApiClient(
+            auth_config=ApiKeyAuthConfig(api_secret_key="test_key"),
+            config=PublicApiClientConfiguration(default_account_number="ACC123"),
+        )
+    return client
+
+
+@pytest.fixture
+def client(_base_public_client):
+    """Function-scoped PublicApiClient with fresh mock collaborators.
+
+    Shallow-copies the session template and replaces every attribute the
+    tests interact with, so call records never leak between tests.  The
+    api_client stub exposes only the surface PublicApiClient actually uses,
+    so typos in tests fail with AttributeError instead of silently recording
+    calls; tests configure it via ``.get.return_value = ...``.
+    """
+    c = copy.copy(_base_public_client)
+    c.api_client = _ApiClientStub()
+    c.auth_manager = Mock()
+    c._subscription_manager = Mock()
+    c._order_subscription_manager = Mock()
+    return c
@@ -0,0 +1,71 @@
+"""Micro-benchmarks for the ApiClient hot paths.
+
+Runs only when pytest-codspeed (dev extra) is installed; skipped otherwise
+so the plain test suite stays dependency-free.  These pin the payoff of the
+_handle_response dispatch table, the orjson body decoding, and the memoized
+URL join, so regressions show up as benchmark deltas rather than silently.
+"""
+
+import json
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from public_api_sdk.api_client import ApiClient
+
+pytest.importorskip("pytest_codspeed")
+
+
+def _response(status_code: int, body: dict) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(body).encode()
+    response.headers = CaseInsensitiveDict()
+    response.encoding = "utf-8"
+    return response
+
+
+@pytest.fixture(scope="module")
+def client() -> ApiClient:
+    c = ApiClient(base_url="https://api.example.com")
+    yield c
+    c.close()
+
+
+def test_handle_response_success_bodies(benchmark, client) -> None:
+    responses = [
+        _response(200, {"orders": [{"orderId": f"O-{i}", "status": "FILLED"}]})
+        for i in range(100)
+    ]
+
+    @benchmark
+    def run() -> None:
+        for response in responses:
+            client._handle_response(response)
+
+
+def test_handle_response_error_dispatch(benchmark, client) -> None:
+    from public_api_sdk.exceptions import APIError
+
+    responses = [
+        _response(status, {"message": "error"})
+        for status in (400, 401, 404, 418, 500, 503)
+    ] * 20
+
+    @benchmark
+    def run() -> None:
+        for response in responses:
+            try:
+                client._handle_response(response)
+            except APIError:
+                pass
+
+
+def test_build_url_paths(benchmark, client) -> None:
+    paths = ["/a", "/trading/ACC/order/O-1", "nope"] * 100
+
+    @benchmark
+    def run() -> None:
+        for path in paths:
+            client._build_url(path)
@@ -6,6 +6,7 @@ from unittest.mock import Mock
 
 import pytest
 import requests
+from requests.structures import CaseInsensitiveDict
 
 from public_api_sdk.api_client import ApiClient, BlockHTTPAdapter
 from public_api_sdk.exceptions import (
@@ -23,18 +24,38 @@ def _make_response(
     data: object = None,
     headers: Optional[dict] = None,
     empty_body: bool = False,
-) -> Mock:
-    """Build a mock requests.Response."""
-    response = Mock(spec=requests.Response)
+    raw: Optional[bytes] = None,
+) -> requests.Response:
+    """Build a real requests.Response with a preloaded body.
+
+    Constructing a Response and assigning status/_content/headers directly
+    is cheaper than Mock(spec=requests.Response) — no spec introspection —
+    and exercises the production body-access path instead of a stub.  Pass
+    ``raw`` for a non-JSON body.
+    """
+    response = requests.Response()
     response.status_code = status_code
-    response.content = b"" if empty_body else b'{"key": "val"}'
-    response.json.return_value = data if data is not None else {}
-    response.headers = headers or {}
-    response.text = ""
+    if raw is not None:
+        response._content = raw
+    elif empty_body:
+        response._content = b""
+    else:
+        response._content = json.dumps(data if data is not None else {}).encode()
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.encoding = "utf-8"
     return response
 
 
+@pytest.fixture
+def auth_client(api_client):
+    """The shared client, with auth headers stripped again afterwards."""
+    yield api_client
+    api_client.remove_auth_header()
+
+
 class TestApiClientInit:
+    # these tests exercise construction itself, so they build their own
+    # clients instead of using the shared module fixture
     def test_base_url_trailing_slash_stripped(self) -> None:
         client = ApiClient(base_url="https://api.example.com/")
         assert client.base_url == "https://api.example.com"
@@ -63,233 +84,425 @@ class TestApiClientInit:
         with pytest.raises(RuntimeError, match="Insecure HTTP"):
             client.session.get("http://insecure.example.com/endpoint", timeout=1)
 
+    def test_https_adapter_pool_sizes(self) -> None:
+        # connection reuse across calls depends on the pool being big enough
+        client = ApiClient(base_url="https://api.example.com")
+        adapter = client.session.get_adapter("https://api.example.com")
+        assert adapter._pool_connections >= 10
+        assert adapter._pool_maxsize >= 50
+
+    def test_keep_alive_header_set(self) -> None:
+        client = ApiClient(base_url="https://api.example.com")
+        assert client.session.headers.get("Connection") == "keep-alive"
+
+    def test_default_headers_shared_across_instances(self) -> None:
+        from public_api_sdk.api_client import _default_headers
+
+        first = ApiClient(base_url="https://api.example.com")
+        second = ApiClient(base_url="https://other.example.com")
+        # the source mapping is built once and reused, not rebuilt per client
+        assert _default_headers() is _default_headers()
+        assert (
+            first.session.headers["User-Agent"]
+            == second.session.headers["User-Agent"]
+        )
 
-class TestApiClientAuthHeaders:
-    def setup_method(self) -> None:
-        self.client = ApiClient(base_url="https://api.example.com")
 
-    def test_set_auth_header(self) -> None:
-        self.client.set_auth_header("my_token")
-        assert self.client.session.headers["Authorization"] == "Bearer my_token"
+class TestApiClientAuthHeaders:
+    def test_set_auth_header(self, auth_client) -> None:
+        auth_client.set_auth_header("my_token")
+        assert auth_client.session.headers["Authorization"] == "Bearer my_token"
 
-    def test_set_auth_header_overwrites_previous(self) -> None:
-        self.client.set_auth_header("token_1")
-        self.client.set_auth_header("token_2")
-        assert self.client.session.headers["Authorization"] == "Bearer token_2"
+    def test_set_auth_header_overwrites_previous(self, auth_client) -> None:
+        auth_client.set_auth_header("token_1")
+        auth_client.set_auth_header("token_2")
+        assert auth_client.session.headers["Authorization"] == "Bearer token_2"
 
-    def test_remove_auth_header(self) -> None:
-        self.client.set_auth_header("my_token")
-        self.client.remove_auth_header()
-        assert "Authorization" not in self.client.session.headers
+    def test_remove_auth_header(self, auth_client) -> None:
+        auth_client.set_auth_header("my_token")
+        auth_client.remove_auth_header()
+        assert "Authorization" not in auth_client.session.headers
 
-    def test_remove_auth_header_when_not_set(self) -> None:
+    def test_remove_auth_header_when_not_set(self, auth_client) -> None:
         # should not raise
-        self.client.remove_auth_header()
-        assert "Authorization" not in self.client.session.headers
+        auth_client.remove_auth_header()
+        assert "Authorization" not in auth_client.session.headers
 
 
 class TestApiClientUrlBuilding:
-    def setup_method(self) -> None:
-        self.client = ApiClient(base_url="https://api.example.com")
-
-    def test_build_url_with_leading_slash(self) -> None:
-        url = self.client._build_url("/endpoint")
+    def test_build_url_with_leading_slash(self, api_client) -> None:
+        url = api_client._build_url("/endpoint")
         assert url == "https://api.example.com/endpoint"
 
-    def test_build_url_without_leading_slash(self) -> None:
-        url = self.client._build_url("endpoint")
+    def test_build_url_without_leading_slash(self, api_client) -> None:
+        url = api_client._build_url("endpoint")
         assert url == "https://api.example.com/endpoint"
 
-    def test_build_url_nested_path(self) -> None:
-        url = self.client._build_url("/foo/bar/baz")
+    def test_build_url_nested_path(self, api_client) -> None:
+        url = api_client._build_url("/foo/bar/baz")
         assert url == "https://api.example.com/foo/bar/baz"
 
-    def test_build_url_with_path_segments(self) -> None:
-        url = self.client._build_url("/trading/ACC123/order/ORDER-456")
+    def test_build_url_with_path_segments(self, api_client) -> None:
+        url = api_client._build_url("/trading/ACC123/order/ORDER-456")
         assert url == "https://api.example.com/trading/ACC123/order/ORDER-456"
 
+    def test_build_url_memoizes_repeat_endpoints(self, api_client) -> None:
+        first = api_client._build_url("/trading/account")
+        second = api_client._build_url("/trading/account")
+        # same cached string object, not a fresh concatenation
+        assert first is second
 
-class TestApiClientHandleResponse:
-    def setup_method(self) -> None:
-        self.client = ApiClient(base_url="https://api.example.com")
 
-    def test_200_returns_data(self) -> None:
+class TestApiClientHandleResponse:
+    def test_200_returns_data(self, api_client) -> None:
         response = _make_response(200, data={"key": "value"})
-        result = self.client._handle_response(response)
+        result = api_client._handle_response(response)
         assert result == {"key": "value"}
 
-    def test_200_empty_body_returns_empty_dict(self) -> None:
+    def test_200_empty_body_returns_empty_dict(self, api_client) -> None:
         response = _make_response(200, empty_body=True)
-        result = self.client._handle_response(response)
+        result = api_client._handle_response(response)
         assert result == {}
 
-    def test_201_returns_created_resource_data(self) -> None:
+    def test_201_returns_created_resource_data(self, api_client) -> None:
         response = _make_response(201, data={"orderId": "ORDER-123"})
-        result = self.client._handle_response(response)
+        result = api_client._handle_response(response)
         assert result == {"orderId": "ORDER-123"}
 
-    def test_204_empty_body_returns_empty_dict(self) -> None:
+    def test_204_empty_body_returns_empty_dict(self, api_client) -> None:
         response = _make_response(204, empty_body=True)
-        result = self.client._handle_response(response)
+        result = api_client._handle_response(response)
         assert result == {}
 
-    def test_401_raises_authentication_error(self) -> None:
-        response = _make_response(401, data={"message": "Unauthorized"})
-        with pytest.raises(AuthenticationError) as exc_info:
-            self.client._handle_response(response)
-        assert exc_info.value.status_code == 401
-        assert exc_info.value.message == "Unauthorized"
-
-    def test_400_raises_validation_error(self) -> None:
-        response = _make_response(400, data={"message": "Bad request body"})
-        with pytest.raises(ValidationError) as exc_info:
-            self.client._handle_response(response)
-        assert exc_info.value.status_code == 400
-        assert exc_info.value.message == "Bad request body"
-
-    def test_404_raises_not_found_error(self) -> None:
-        response = _make_response(404, data={"message": "Order not found"})
-        with pytest.raises(NotFoundError) as exc_info:
-            self.client._handle_response(response)
-        assert exc_info.value.status_code == 404
-
-    def test_429_raises_rate_limit_error_with_retry_after(self) -> None:
+    def test_empty_body_successes_share_one_result(self, api_client) -> None:
+        first = api_client._handle_response(_make_response(200, empty_body=True))
+        second = api_client._handle_response(_make_response(204, empty_body=True))
+        # the shared frozen mapping, not a fresh dict per call
+        assert first is second
+
+    @pytest.mark.parametrize(
+        "status,exc,msg",
+        [
+            (401, AuthenticationError, "Unauthorized"),
+            (400, ValidationError, "Bad request body"),
+            (404, NotFoundError, "Order not found"),
+            (429, RateLimitError, "Too many requests"),
+            (500, ServerError, "Internal server error"),
+            (503, ServerError, "Service unavailable"),
+            (418, APIError, "I'm a teapot"),
+        ],
+    )
+    def test_error_status_raises(self, api_client, status, exc, msg) -> None:
+        response = _make_response(status, data={"message": msg})
+        with pytest.raises(exc) as exc_info:
+            api_client._handle_response(response)
+        assert exc_info.value.status_code == status
+        assert exc_info.value.message == msg
+
+    def test_429_retry_after_header_parsed(self, api_client) -> None:
         response = _make_response(
             429,
             data={"message": "Too many requests"},
             headers={"Retry-After": "30"},
         )
         with pytest.raises(RateLimitError) as exc_info:
-            self.client._handle_response(response)
-        assert exc_info.value.status_code == 429
+            api_client._handle_response(response)
         assert exc_info.value.retry_after == 30
 
-    def test_429_without_retry_after_header(self) -> None:
+    def test_429_without_retry_after_header(self, api_client) -> None:
         response = _make_response(429, data={"message": "Rate limited"}, headers={})
         with pytest.raises(RateLimitError) as exc_info:
-            self.client._handle_response(response)
+            api_client._handle_response(response)
         assert exc_info.value.retry_after is None
 
-    def test_500_raises_server_error(self) -> None:
-        response = _make_response(500, data={"message": "Internal server error"})
-        with pytest.raises(ServerError) as exc_info:
-            self.client._handle_response(response)
-        assert exc_info.value.status_code == 500
-
-    def test_503_raises_server_error(self) -> None:
-        response = _make_response(503, data={"message": "Service unavailable"})
-        with pytest.raises(ServerError) as exc_info:
-            self.client._handle_response(response)
-        assert exc_info.value.status_code == 503
-
-    def test_unknown_4xx_raises_api_error(self) -> None:
-        response = _make_response(418, data={"message": "I'm a teapot"})
-        with pytest.raises(APIError) as exc_info:
-            self.client._handle_response(response)
-        assert exc_info.value.status_code == 418
-
-    def test_error_response_data_stored_on_exception(self) -> None:
+    def test_error_response_data_stored_on_exception(self, api_client) -> None:
         body = {"message": "Not found", "detail": "Order ORDER-1 not found"}
         response = _make_response(404, data=body)
         with pytest.raises(NotFoundError) as exc_info:
-            self.client._handle_response(response)
+            api_client._handle_response(response)
         assert exc_info.value.response_data == body
 
-    def test_missing_message_field_uses_default(self) -> None:
+    def test_missing_message_field_uses_default(self, api_client) -> None:
         response = _make_response(400, data={"code": "INVALID"})
         with pytest.raises(ValidationError) as exc_info:
-            self.client._handle_response(response)
+            api_client._handle_response(response)
         assert exc_info.value.message == "Unknown error"
 
-    def test_dict_message_field_is_stringified(self) -> None:
+    def test_dict_message_field_is_stringified(self, api_client) -> None:
         response = _make_response(400, data={"message": {"nested": "error"}})
         with pytest.raises(ValidationError) as exc_info:
-            self.client._handle_response(response)
+            api_client._handle_response(response)
         assert exc_info.value.message is not None
         assert isinstance(exc_info.value.message, str)
 
-    def test_invalid_json_falls_back_to_raw_content(self) -> None:
-        response = Mock(spec=requests.Response)
-        response.status_code = 400
-        response.content = b"not valid json"
-        response.json.side_effect = json.JSONDecodeError("No JSON", "", 0)
-        response.text = "not valid json"
-        response.headers = {}
+    def test_invalid_json_falls_back_to_raw_content(self, api_client) -> None:
+        response = _make_response(400, raw=b"not valid json")
         with pytest.raises(ValidationError):
-            self.client._handle_response(response)
+            api_client._handle_response(response)
+
+    @pytest.mark.parametrize(
+        "content,expected",
+        [
+            (b'{"a": 1}', {"a": 1}),
+            (b"", {}),
+            (b"not json", {"raw_content": "not json"}),
+        ],
+    )
+    def test_body_decoding(self, api_client, content, expected) -> None:
+        response = _make_response(200, raw=content)
+        assert api_client._handle_response(response) == expected
+
+
+def _patch_adapter_send(monkeypatch, response=None):
+    """Patch HTTPAdapter.send so the real session pipeline runs up to the wire.
+
+    Unlike replacing session.get/post, this exercises requests' prepared-
+    request building, header merging, and URL resolution — the code the
+    pooling and keep-alive configuration actually flows through.  Returns a
+    list of (PreparedRequest, kwargs) pairs captured per send.
+    """
+    sent = []
+    ok = (
+        response
+        if response is not None
+        else _make_response(200, data={"result": "ok"})
+    )
+
+    def send(self, request, **kwargs):
+        sent.append((request, kwargs))
+        return ok
+
+    monkeypatch.setattr(requests.adapters.HTTPAdapter, "send", send)
+    return sent
 
 
 class TestApiClientHttpMethods:
-    def setup_method(self) -> None:
-        self.client = ApiClient(base_url="https://api.example.com")
-        self.ok_response = _make_response(200, data={"result": "ok"})
-
-    def test_get_calls_session_get(self) -> None:
-        self.client.session.get = Mock(return_value=self.ok_response)
-        result = self.client.get("/endpoint")
-        self.client.session.get.assert_called_once()
+    def test_get_sends_prepared_request(self, api_client, monkeypatch) -> None:
+        sent = _patch_adapter_send(monkeypatch)
+        result = api_client.get("/endpoint")
+        assert len(sent) == 1
+        request, _ = sent[0]
+        assert request.method == "GET"
         assert result == {"result": "ok"}
 
-    def test_get_builds_correct_url(self) -> None:
-        self.client.session.get = Mock(return_value=self.ok_response)
-        self.client.get("/trading/account")
-        call_args = self.client.session.get.call_args
-        assert "https://api.example.com/trading/account" in call_args[0]
-
-    def test_get_passes_params(self) -> None:
-        self.client.session.get = Mock(return_value=self.ok_response)
-        self.client.get("/endpoint", params={"foo": "bar", "page": 2})
-        call_kwargs = self.client.session.get.call_args[1]
-        assert call_kwargs["params"] == {"foo": "bar", "page": 2}
-
-    def test_get_passes_timeout(self) -> None:
-        self.client.session.get = Mock(return_value=self.ok_response)
-        self.client.get("/endpoint")
-        call_kwargs = self.client.session.get.call_args[1]
-        assert "timeout" in call_kwargs
-
-    def test_post_calls_session_post(self) -> None:
-        self.client.session.post = Mock(return_value=self.ok_response)
-        result = self.client.post("/endpoint", json_data={"key": "val"})
-        self.client.session.post.assert_called_once()
+    def test_get_builds_correct_url(self, api_client, monkeypatch) -> None:
+        sent = _patch_adapter_send(monkeypatch)
+        api_client.get("/trading/account")
+        request, _ = sent[0]
+        assert request.url == "https://api.example.com/trading/account"
+
+    def test_get_encodes_params_into_url(self, api_client, monkeypatch) -> None:
+        sent = _patch_adapter_send(monkeypatch)
+        api_client.get("/endpoint", params={"foo": "bar", "page": 2})
+        request, _ = sent[0]
+        assert request.url == "https://api.example.com/endpoint?foo=bar&page=2"
+
+    def test_get_passes_timeout(self, api_client, monkeypatch) -> None:
+        sent = _patch_adapter_send(monkeypatch)
+        api_client.get("/endpoint")
+        _, kwargs = sent[0]
+        assert kwargs["timeout"] == api_client.timeout
+
+    def test_get_merges_session_headers(self, api_client, monkeypatch) -> None:
+        sent = _patch_adapter_send(monkeypatch)
+        api_client.get("/endpoint")
+        request, _ = sent[0]
+        assert "public-python-api-sdk" in request.headers["User-Agent"]
+        assert request.headers["Content-Type"] == "application/json"
+
+    def test_post_sends_prepared_request(self, api_client, monkeypatch) -> None:
+        sent = _patch_adapter_send(monkeypatch)
+        result = api_client.post("/endpoint", json_data={"key": "val"})
+        assert len(sent) == 1
+        request, _ = sent[0]
+        assert request.method == "POST"
         assert result == {"result": "ok"}
 
-    def test_post_passes_json_data(self) -> None:
-        self.client.session.post = Mock(return_value=self.ok_response)
+    def test_post_sends_json_body(self, api_client, monkeypatch) -> None:
+        sent = _patch_adapter_send(monkeypatch)
         payload = {"instruments": [{"symbol": "AAPL", "type": "EQUITY"}]}
-        self.client.post("/quotes", json_data=payload)
-        call_kwargs = self.client.session.post.call_args[1]
-        assert call_kwargs["json"] == payload
-
-    def test_delete_calls_session_delete(self) -> None:
-        delete_response = _make_response(204, empty_body=True)
-        self.client.session.delete = Mock(return_value=delete_response)
-        result = self.client.delete("/endpoint")
-        self.client.session.delete.assert_called_once()
+        api_client.post("/quotes", json_data=payload)
+        request, _ = sent[0]
+        # whether orjson pre-serialized it or requests' encoder ran, the
+        # wire payload must match
+        assert json.loads(request.body) == payload
+
+    def test_encode_json_body_round_trips(self, api_client) -> None:
+        data, json_data = api_client._encode_json_body(None, {"key": "val"})
+        if json_data is not None:
+            assert json_data == {"key": "val"}
+        else:
+            assert json.loads(data) == {"key": "val"}
+
+    def test_encode_json_body_leaves_raw_data_untouched(self, api_client) -> None:
+        data, json_data = api_client._encode_json_body(b"raw", None)
+        assert data == b"raw"
+        assert json_data is None
+
+    def test_delete_sends_prepared_request(self, api_client, monkeypatch) -> None:
+        sent = _patch_adapter_send(
+            monkeypatch, response=_make_response(204, empty_body=True)
+        )
+        result = api_client.delete("/endpoint")
+        assert len(sent) == 1
+        request, _ = sent[0]
+        assert request.method == "DELETE"
         assert result == {}
 
-    def test_delete_builds_correct_url(self) -> None:
-        delete_response = _make_response(200, data={})
-        self.client.session.delete = Mock(return_value=delete_response)
-        self.client.delete("/trading/ACC123/order/ORDER-456")
-        call_args = self.client.session.delete.call_args
-        assert "ORDER-456" in call_args[0][0]
+    def test_delete_builds_correct_url(self, api_client, monkeypatch) -> None:
+        sent = _patch_adapter_send(monkeypatch, response=_make_response(200, data={}))
+        api_client.delete("/trading/ACC123/order/ORDER-456")
+        request, _ = sent[0]
+        assert request.url == "https://api.example.com/trading/ACC123/order/ORDER-456"
 
     def test_close_closes_session(self) -> None:
-        self.client.session.close = Mock()
-        self.client.close()
-        self.client.session.close.assert_called_once()
-
-    def test_get_raises_on_api_error(self) -> None:
-        self.client.session.get = Mock(
-            return_value=_make_response(401, data={"message": "Unauthorized"})
+        # closing would poison the shared module client, so use a local one
+        client = ApiClient(base_url="https://api.example.com")
+        client.session.close = Mock()
+        client.close()
+        client.session.close.assert_called_once()
+
+    def test_get_raises_on_api_error(self, api_client, monkeypatch) -> None:
+        _patch_adapter_send(
+            monkeypatch,
+            response=_make_response(401, data={"message": "Unauthorized"}),
         )
         with pytest.raises(AuthenticationError):
-            self.client.get("/protected/endpoint")
+            api_client.get("/protected/endpoint")
 
-    def test_post_raises_on_validation_error(self) -> None:
-        self.client.session.post = Mock(
-            return_value=_make_response(400, data={"message": "Invalid body"})
+    def test_post_retries_are_exhausted_then_raise(self, monkeypatch) -> None:
+        client = ApiClient(base_url="https://api.example.com", max_retries=2)
+        mock_post = Mock(
+            return_value=_make_response(503, data={"message": "unavailable"})
+        )
+        monkeypatch.setattr(client.session, "post", mock_post)
+        monkeypatch.setattr("public_api_sdk.api_client.time.sleep", lambda _: None)
+        with pytest.raises(ServerError):
+            client.post("/endpoint", json_data={"k": "v"})
+        assert mock_post.call_count == 3  # initial attempt + 2 retries
+
+    def test_post_raises_on_validation_error(self, api_client, monkeypatch) -> None:
+        _patch_adapter_send(
+            monkeypatch,
+            response=_make_response(400, data={"message": "Invalid body"}),
         )
         with pytest.raises(ValidationError):
-            self.client.post("/endpoint", json_data={"bad": "data"})
+            api_client.post("/endpoint", json_data={"bad": "data"})
+
+
+class TestApiClientRetryBackoff:
+    """Backoff policy for the application-level retry on non-safe methods."""
+
+    @pytest.mark.parametrize(
+        "status,headers",
+        [
+            (429, {"Retry-After": "1"}),
+            (503, {}),
+            (500, {}),
+        ],
+    )
+    def test_transient_errors_sleep_then_succeed(
+        self, api_client, monkeypatch, status, headers
+    ) -> None:
+        mock_post = Mock(
+            side_effect=[
+                _make_response(status, data={"message": "transient"}, headers=headers),
+                _make_response(status, data={"message": "transient"}, headers=headers),
+                _make_response(200, data={"ok": True}),
+            ]
+        )
+        monkeypatch.setattr(api_client.session, "post", mock_post)
+        sleeps: list = []
+        monkeypatch.setattr("public_api_sdk.api_client.time.sleep", sleeps.append)
+        monkeypatch.setattr("public_api_sdk.api_client.random.random", lambda: 0.0)
+
+        result = api_client.post("/endpoint", json_data={"k": "v"})
+
+        assert result == {"ok": True}
+        assert mock_post.call_count == 3
+        if "Retry-After" in headers:
+            # a server-provided Retry-After is honored exactly, no jitter
+            assert sleeps == [1, 1]
+        else:
+            # exponential backoff from the default 0.3 factor
+            assert sleeps == [0.3, 0.6]
+
+    def test_backoff_jitter_stretches_sleep(self, api_client, monkeypatch) -> None:
+        mock_post = Mock(
+            side_effect=[
+                _make_response(500, data={"message": "boom"}),
+                _make_response(200, data={"ok": True}),
+            ]
+        )
+        monkeypatch.setattr(api_client.session, "post", mock_post)
+        sleeps: list = []
+        monkeypatch.setattr("public_api_sdk.api_client.time.sleep", sleeps.append)
+        monkeypatch.setattr("public_api_sdk.api_client.random.random", lambda: 1.0)
+
+        api_client.post("/endpoint", json_data={"k": "v"})
+
+        assert sleeps == [pytest.approx(0.3 * 1.1)]
+
+    def test_backoff_capped_at_30_seconds(self, monkeypatch) -> None:
+        client = ApiClient(
+            base_url="https://api.example.com", backoff_factor=40.0
+        )
+        mock_post = Mock(
+            side_effect=[
+                _make_response(500, data={"message": "boom"}),
+                _make_response(200, data={"ok": True}),
+            ]
+        )
+        monkeypatch.setattr(client.session, "post", mock_post)
+        sleeps: list = []
+        monkeypatch.setattr("public_api_sdk.api_client.time.sleep", sleeps.append)
+        monkeypatch.setattr("public_api_sdk.api_client.random.random", lambda: 0.0)
+
+        client.post("/endpoint", json_data={"k": "v"})
+
+        assert sleeps == [30.0]
+
+
+class TestParseRetryAfter:
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("30", 30.0),
+            ("0", 0.0),
+            (None, None),
+            ("", None),
+            ("not a date", None),
+            # an HTTP-date in the past clamps to zero rather than going negative
+            ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0),
+        ],
+    )
+    def test_parse_forms(self, value, expected) -> None:
+        from public_api_sdk.api_client import _parse_retry_after
+
+        assert _parse_retry_after(value) == expected
+
+    def test_http_date_in_future(self) -> None:
+        from datetime import datetime, timedelta, timezone
+        from email.utils import format_datetime
+
+        from public_api_sdk.api_client import _parse_retry_after
+
+        header = format_datetime(
+            datetime.now(timezone.utc) + timedelta(seconds=60)
+        )
+        result = _parse_retry_after(header)
+        assert result == pytest.approx(60.0, abs=5.0)
+
+    def test_429_with_http_date_header(self, api_client) -> None:
+        from datetime import datetime, timedelta, timezone
+        from email.utils import format_datetime
+
+        header = format_datetime(
+            datetime.now(timezone.utc) + timedelta(seconds=120)
+        )
+        response = _make_response(
+            429, data={"message": "Rate limited"}, headers={"Retry-After": header}
+        )
+        with pytest.raises(RateLimitError) as exc_info:
+            api_client._handle_response(response)
+        assert exc_info.value.retry_after == pytest.approx(120.0, abs=5.0)
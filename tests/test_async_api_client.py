@@ -298,7 +298,14 @@ class TestAsyncApiClientHttpMethods:
         payload = {"instruments": [{"symbol": "AAPL"}]}
         await self.client.post("/quotes", json_data=payload)
         call_kwargs = self.client._client.request.call_args[1]
-        assert call_kwargs["json"] == payload
+        # with orjson installed the body is pre-serialized bytes with an
+        # explicit Content-Type; otherwise httpx's json encoder is used —
+        # either way the wire payload must match
+        if "content" in call_kwargs:
+            assert json.loads(call_kwargs["content"]) == payload
+            assert call_kwargs["headers"]["Content-Type"] == "application/json"
+        else:
+            assert call_kwargs["json"] == payload
 
     @pytest.mark.asyncio
     async def test_delete_returns_data(self) -> None:
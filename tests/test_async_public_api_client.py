@@ -345,6 +345,18 @@ class TestGetInstrument:
         url = self.client.api_client.get.call_args[0][0]
         assert "/trading/instruments" in url
 
+    @pytest.mark.asyncio
+    async def test_iter_instruments_yields_models(self) -> None:
+        self.client.api_client.get = AsyncMock(
+            return_value={"instruments": [self.instrument_payload]}
+        )
+        results = [
+            instrument async for instrument in self.client.iter_instruments()
+        ]
+        assert len(results) == 1
+        assert isinstance(results[0], Instrument)
+        assert results[0].instrument.symbol == "AAPL"
+
 
 # ---------------------------------------------------------------------------
 # place_order / place_multileg_order
@@ -67,67 +67,48 @@ class TestAPIError:
             raise APIError("test", status_code=418)
         assert exc_info.value.status_code == 418
 
+    def test_attributes_stored_in_slots(self) -> None:
+        # the Exception base still provides an instance dict, but all SDK
+        # attributes live in __slots__ so it stays empty
+        err = APIError("x", status_code=500, response_data={"errorCode": "E"})
+        assert err.__dict__ == {}
+        assert RateLimitError(retry_after=5).__dict__ == {}
+
+
+# (class, default status code, default message) for every APIError subclass
+SUBCLASS_DEFAULTS = [
+    (AuthenticationError, 401, "Authentication failed"),
+    (ValidationError, 400, "Request validation failed"),
+    (NotFoundError, 404, "Resource not found"),
+    (RateLimitError, 429, "Rate limit exceeded"),
+    (ServerError, 500, "Internal server error"),
+]
+
+
+class TestSubclassDefaults:
+    @pytest.mark.parametrize("cls,code,msg", SUBCLASS_DEFAULTS)
+    def test_defaults(self, cls, code, msg) -> None:
+        err = cls()
+        assert isinstance(err, APIError)
+        assert err.status_code == code
+        assert err.message == msg
+
+    @pytest.mark.parametrize("cls", [case[0] for case in SUBCLASS_DEFAULTS])
+    def test_catchable_as_api_error(self, cls) -> None:
+        with pytest.raises(APIError):
+            raise cls()
 
-class TestAuthenticationError:
-    def test_is_api_error(self) -> None:
-        assert issubclass(AuthenticationError, APIError)
-
-    def test_default_status_code(self) -> None:
-        err = AuthenticationError()
-        assert err.status_code == 401
-
-    def test_default_message(self) -> None:
-        err = AuthenticationError()
-        assert err.message == "Authentication failed"
 
-    def test_custom_message(self) -> None:
+class TestSubclassSpecifics:
+    def test_authentication_error_custom_message(self) -> None:
         err = AuthenticationError("Token expired")
         assert err.message == "Token expired"
 
-    def test_catchable_as_api_error(self) -> None:
-        with pytest.raises(APIError):
-            raise AuthenticationError()
-
-
-class TestValidationError:
-    def test_is_api_error(self) -> None:
-        assert issubclass(ValidationError, APIError)
-
-    def test_default_status_code(self) -> None:
-        err = ValidationError()
-        assert err.status_code == 400
-
-    def test_default_message(self) -> None:
-        err = ValidationError()
-        assert err.message == "Request validation failed"
-
-    def test_custom_message_and_data(self) -> None:
+    def test_validation_error_custom_message_and_data(self) -> None:
         err = ValidationError("Invalid field", response_data={"field": "quantity"})
         assert err.message == "Invalid field"
         assert err.response_data == {"field": "quantity"}
 
-
-class TestNotFoundError:
-    def test_is_api_error(self) -> None:
-        assert issubclass(NotFoundError, APIError)
-
-    def test_default_status_code(self) -> None:
-        err = NotFoundError()
-        assert err.status_code == 404
-
-    def test_default_message(self) -> None:
-        err = NotFoundError()
-        assert err.message == "Resource not found"
-
-
-class TestRateLimitError:
-    def test_is_api_error(self) -> None:
-        assert issubclass(RateLimitError, APIError)
-
-    def test_default_status_code(self) -> None:
-        err = RateLimitError()
-        assert err.status_code == 429
-
     def test_retry_after_stored(self) -> None:
         err = RateLimitError(retry_after=60)
         assert err.retry_after == 60
@@ -136,32 +117,11 @@ class TestRateLimitError:
         err = RateLimitError()
         assert err.retry_after is None
 
-    def test_custom_message(self) -> None:
+    def test_rate_limit_custom_message(self) -> None:
         err = RateLimitError("Slow down", retry_after=30)
         assert err.message == "Slow down"
         assert err.retry_after == 30
 
-    def test_catchable_as_api_error(self) -> None:
-        with pytest.raises(APIError):
-            raise RateLimitError(retry_after=5)
-
-
-class TestServerError:
-    def test_is_api_error(self) -> None:
-        assert issubclass(ServerError, APIError)
-
-    def test_default_status_code(self) -> None:
-        err = ServerError()
-        assert err.status_code == 500
-
-    def test_default_message(self) -> None:
-        err = ServerError()
-        assert err.message == "Internal server error"
-
-    def test_custom_status_code(self) -> None:
+    def test_server_error_custom_status_code(self) -> None:
         err = ServerError("Service unavailable", status_code=503)
         assert err.status_code == 503
-
-    def test_catchable_as_api_error(self) -> None:
-        with pytest.raises(APIError):
-            raise ServerError("boom")
@@ -7,11 +7,14 @@
 """
 
 import asyncio
+import logging
 from decimal import Decimal
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, Mock, call, patch
 
+import httpx
 import pytest
+import requests
 
 from public_api_sdk.api_client import ApiClient
 from public_api_sdk.async_api_client import AsyncApiClient
@@ -26,7 +29,9 @@ from public_api_sdk.models.order import (
     OrderStatus,
     OrderType,
 )
+from public_api_sdk.models.quote import Quote
 from public_api_sdk.models.subscription import SubscriptionConfig, SubscriptionStatus
+from public_api_sdk.async_subscription_manager import AsyncPriceSubscriptionManager
 
 
 # ---------------------------------------------------------------------------
@@ -58,8 +63,6 @@ class TestOrderStatusUnknown:
         assert result is OrderStatus.UNKNOWN
 
     def test_unknown_value_logs_warning(self, caplog: pytest.LogCaptureFixture) -> None:
-        import logging
-
         with caplog.at_level(logging.WARNING, logger="public_api_sdk.models.order"):
             OrderStatus("TOTALLY_NEW_STATUS")
 
@@ -153,8 +156,6 @@ class TestSyncRetryNonSafe:
     @patch("time.sleep")
     def test_post_method_uses_retry(self, mock_sleep: Mock) -> None:
         """post() must retry on ServerError via _retry_non_safe."""
-        import requests
-
         mock_response_ok = Mock(spec=requests.Response)
         mock_response_ok.status_code = 200
         mock_response_ok.content = b'{"id": "123"}'
@@ -179,8 +180,6 @@ class TestSyncRetryNonSafe:
     @patch("time.sleep")
     def test_delete_method_uses_retry(self, mock_sleep: Mock) -> None:
         """delete() must retry on ServerError via _retry_non_safe."""
-        import requests
-
         mock_ok = Mock(spec=requests.Response)
         mock_ok.status_code = 200
         mock_ok.content = b"{}"
@@ -206,8 +205,6 @@ class TestAsyncRetryNonSafe:
 
     @pytest.mark.asyncio
     async def test_post_retries_on_server_error(self) -> None:
-        import httpx
-
         client = AsyncApiClient(
             base_url="https://api.example.com", max_retries=2, backoff_factor=0
         )
@@ -236,8 +233,6 @@ class TestAsyncRetryNonSafe:
 
     @pytest.mark.asyncio
     async def test_delete_retries_on_rate_limit(self) -> None:
-        import httpx
-
         client = AsyncApiClient(
             base_url="https://api.example.com", max_retries=2, backoff_factor=0
         )
@@ -455,13 +450,10 @@ class TestAsyncSubscriptionDegradation:
     """AsyncPriceSubscriptionManager sets DEGRADED and calls on_error."""
 
     def _make_instrument(self):
-        from public_api_sdk.models.order import OrderInstrument
         return OrderInstrument(symbol="AAPL", type=InstrumentType.EQUITY)
 
     @pytest.mark.asyncio
     async def test_degraded_after_consecutive_failures(self) -> None:
-        from public_api_sdk.async_subscription_manager import AsyncPriceSubscriptionManager
-
         error_cb = Mock()
         config = SubscriptionConfig(max_consecutive_failures=3, on_error=error_cb)
 
@@ -493,9 +485,6 @@ class TestAsyncSubscriptionDegradation:
 
     @pytest.mark.asyncio
     async def test_recovers_from_degraded_on_success(self) -> None:
-        from public_api_sdk.async_subscription_manager import AsyncPriceSubscriptionManager
-        from public_api_sdk.models.quote import Quote
-
         instrument = self._make_instrument()
 
         # Build a mock quote for the success poll
@@ -546,8 +535,6 @@ class TestAsyncSubscriptionDegradation:
 
     @pytest.mark.asyncio
     async def test_does_not_degrade_below_threshold(self) -> None:
-        from public_api_sdk.async_subscription_manager import AsyncPriceSubscriptionManager
-
         config = SubscriptionConfig(max_consecutive_failures=5, on_error=Mock())
         get_quotes = AsyncMock(side_effect=ConnectionError("down"))
         manager = AsyncPriceSubscriptionManager(get_quotes_func=get_quotes)
@@ -573,8 +560,6 @@ class TestAsyncSubscriptionDegradation:
     @pytest.mark.asyncio
     async def test_degraded_subscription_continues_polling(self) -> None:
         """DEGRADED subscriptions must still be polled (not skipped)."""
-        from public_api_sdk.async_subscription_manager import AsyncPriceSubscriptionManager
-
         config = SubscriptionConfig(max_consecutive_failures=1, on_error=Mock())
         get_quotes = AsyncMock(side_effect=ConnectionError("down"))
         manager = AsyncPriceSubscriptionManager(get_quotes_func=get_quotes)
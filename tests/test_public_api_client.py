@@ -1,20 +1,20 @@
 """Tests for PublicApiClient API methods.
 
-All tests patch ApiClient and AuthManager at construction time so no real HTTP
-calls are made. After construction the mocked api_client and auth_manager
-instances remain on the client object and can be configured per-test.
+No real HTTP calls are made: every client carries mocked api_client and
+auth_manager collaborators (see the ``client`` fixture in conftest.py and
+``_make_client`` below) that tests configure as needed.
 """
 
 from decimal import Decimal
+from functools import lru_cache
 from types import SimpleNamespace
 from typing import Optional
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 from uuid import UUID
 
 import pytest
 
 from public_api_sdk import (
-    ApiKeyAuthConfig,
     InstrumentType,
     OrderInstrument,
     PublicApiClient,
@@ -30,12 +30,18 @@ from public_api_sdk.models.historic_data import (
     TradingSessionToggle,
 )
 from public_api_sdk.models.history import HistoryRequest, HistoryResponsePage
-from public_api_sdk.models.instrument import Instrument
+from public_api_sdk.models.instrument import Instrument, InstrumentsRequest, Trading
 from public_api_sdk.models.new_order import NewOrder
-from public_api_sdk.models.option import GreeksResponse
+from public_api_sdk.models.option import (
+    GreeksResponse,
+    OptionExpirationsRequest,
+    OptionExpirationsResponse,
+    OptionGreeks,
+)
 from public_api_sdk.models.order import (
     CancelAndReplaceRequest,
     EquityMarketSession,
+    GatewayTaxLotMatchingInstruction,
     OpenCloseIndicator,
     Order,
     OrderExpirationRequest,
@@ -49,7 +55,19 @@ from public_api_sdk.models.order import (
 )
 from public_api_sdk.models.portfolio import Portfolio
 from public_api_sdk.models.quote import Quote, QuoteRequest
+from public_api_sdk.models.strategy_quote import (
+    DebitCredit,
+    StrategyOrderLeg,
+    StrategyQuoteDto,
+    StrategyQuoteRequest,
+)
+from public_api_sdk.models.tax_lots import (
+    Base64File,
+    UnrealizedLotsDetailResponse,
+    UnrealizedLotsSummaryResponse,
+)
 
+from tests.conftest import _ApiClientStub
 
 # ---------------------------------------------------------------------------
 # Shared helpers
@@ -58,44 +76,85 @@ from public_api_sdk.models.quote import Quote, QuoteRequest
 _ACCOUNT = "ACC123"
 _VALID_UUID = "550e8400-e29b-41d4-a716-446655440000"
 
+# expected URL fragments for the default account, derived once from _ACCOUNT
+_URL_PORTFOLIO = f"/{_ACCOUNT}/portfolio/v2"
+_URL_QUOTES = f"/{_ACCOUNT}/quotes"
+_URL_HISTORY = f"/{_ACCOUNT}/history"
+_URL_OPTION_EXPIRATIONS = f"/{_ACCOUNT}/option-expirations"
+_URL_GREEKS = f"/{_ACCOUNT}/greeks"
+_URL_PREFLIGHT = f"/{_ACCOUNT}/preflight/single-leg"
+_URL_ORDER = f"/{_ACCOUNT}/order"
+_URL_TAXLOTS = f"/userapigateway/trading/{_ACCOUNT}/taxlots/unrealized"
+_URL_TAXLOTS_CSV = f"/userapigateway/trading/{_ACCOUNT}/taxlots/csv/unrealized"
+
+
+@lru_cache(maxsize=4)
+def _config(default_account: Optional[str]) -> PublicApiClientConfiguration:
+    """One configuration per distinct account number.
+
+    The suite only ever uses a handful of values and never mutates the
+    config, so repeat _make_client calls reuse the same instance.
+    """
+    return PublicApiClientConfiguration(default_account_number=default_account)
+
 
 def _make_client(default_account: Optional[str] = _ACCOUNT) -> PublicApiClient:
-    """Return a PublicApiClient with ApiClient and AuthManager patched out."""
-    with patch("public_api_sdk.public_api_client.ApiClient"), patch(
-        "public_api_sdk.public_api_client.AuthManager"
-    ):
-        config = PublicApiClientConfiguration(default_account_number=default_account)
-        client = PublicApiClient(
-            auth_config=ApiKeyAuthConfig(api_secret_key="test_key"),
-            config=config,
-        )
+    """Return a PublicApiClient with mock collaborators injected directly.
+
+    Skips ``__init__`` (and with it the two ``mock.patch`` context managers
+    the old helper paid for on every call): the tests only touch ``config``,
+    ``api_client``, ``auth_manager``, and the subscription managers, so those
+    are assigned on a bare instance.  Most tests use the ``client`` fixture;
+    this helper remains for the few tests that need a non-default account
+    number.
+    """
+    client = PublicApiClient.__new__(PublicApiClient)
+    client.config = _config(default_account)
+    client.api_client = _ApiClientStub()
+    client.auth_manager = Mock()
+    client._subscription_manager = Mock()
+    client._order_subscription_manager = Mock()
     return client
 
 
-def _order_payload(order_id: str = "ORDER-123", status: str = "NEW") -> dict:
-    return {
-        "orderId": order_id,
-        "instrument": {"symbol": "AAPL", "type": "EQUITY"},
-        "type": "LIMIT",
-        "side": "BUY",
-        "status": status,
-        "quantity": "10",
-    }
+# canned response payloads, built once at import time.  Tests treat these as
+# read-only; variants are spelled `{**_PAYLOAD, "key": value}` at the call site.
+_ORDER_PAYLOAD = {
+    "orderId": "ORDER-123",
+    "instrument": {"symbol": "AAPL", "type": "EQUITY"},
+    "type": "LIMIT",
+    "side": "BUY",
+    "status": "NEW",
+    "quantity": "10",
+}
 
+_PORTFOLIO_PAYLOAD = {
+    "accountId": _ACCOUNT,
+    "accountType": "BROKERAGE",
+    "buyingPower": {
+        "cashOnlyBuyingPower": "10000.00",
+        "buyingPower": "20000.00",
+        "optionsBuyingPower": "5000.00",
+    },
+    "equity": [],
+    "positions": [],
+    "orders": [],
+}
 
-def _portfolio_payload(account_id: str = _ACCOUNT) -> dict:
-    return {
-        "accountId": account_id,
-        "accountType": "BROKERAGE",
-        "buyingPower": {
-            "cashOnlyBuyingPower": "10000.00",
-            "buyingPower": "20000.00",
-            "optionsBuyingPower": "5000.00",
-        },
-        "equity": [],
-        "positions": [],
-        "orders": [],
-    }
+_INSTRUMENT_PAYLOAD = {
+    "instrument": {"symbol": "AAPL", "type": "EQUITY"},
+    "trading": "BUY_AND_SELL",
+    "fractionalTrading": "BUY_AND_SELL",
+    "optionTrading": "BUY_AND_SELL",
+    "optionSpreadTrading": "DISABLED",
+}
+
+# validated once at import; stored as a tuple so no test can mutate the
+# shared sequence, and call sites pass list(...) to match the signature
+_QUOTE_INSTRUMENTS = (
+    OrderInstrument(symbol="AAPL", type=InstrumentType.EQUITY),
+    OrderInstrument(symbol="GOOGL", type=InstrumentType.EQUITY),
+)
 
 
 # ---------------------------------------------------------------------------
@@ -106,14 +165,20 @@ def _portfolio_payload(account_id: str = _ACCOUNT) -> dict:
 class TestAccountIdResolution:
     def test_default_account_used_when_no_explicit_id(self) -> None:
         client = _make_client(default_account="DEFAULT_ACC")
-        client.api_client.get = Mock(return_value=_portfolio_payload("DEFAULT_ACC"))
+        client.api_client.get.return_value = {
+            **_PORTFOLIO_PAYLOAD,
+            "accountId": "DEFAULT_ACC",
+        }
         client.get_portfolio()
         url = client.api_client.get.call_args[0][0]
         assert "DEFAULT_ACC" in url
 
     def test_explicit_account_overrides_default(self) -> None:
         client = _make_client(default_account="DEFAULT_ACC")
-        client.api_client.get = Mock(return_value=_portfolio_payload("EXPLICIT_ACC"))
+        client.api_client.get.return_value = {
+            **_PORTFOLIO_PAYLOAD,
+            "accountId": "EXPLICIT_ACC",
+        }
         client.get_portfolio(account_id="EXPLICIT_ACC")
         url = client.api_client.get.call_args[0][0]
         assert "EXPLICIT_ACC" in url
@@ -125,45 +190,171 @@ class TestAccountIdResolution:
 
     def test_no_account_explicit_none_raises_value_error(self) -> None:
         client = _make_client(default_account=None)
-        client.api_client.get = Mock(return_value={})
+        client.api_client.get.return_value = {}
         with pytest.raises(ValueError, match="No account ID provided"):
             client.get_portfolio(account_id=None)
 
 
+# ---------------------------------------------------------------------------
+# Endpoint routing
+# ---------------------------------------------------------------------------
+
+
+class TestEndpoints:
+    """URL routing for the read/cancel style methods, in one table.
+
+    Each row is (client method, mocked HTTP verb, call args/kwargs, canned
+    payload, substrings the request URL must contain).  Collapsing the
+    near-identical per-class endpoint tests into one parametrized function
+    keeps collection and fixture overhead to a single test item per row.
+    """
+
+    @pytest.mark.parametrize(
+        ("method_name", "http_verb", "args", "kwargs", "payload", "expected"),
+        [
+            (
+                "get_accounts",
+                "get",
+                (),
+                {},
+                {"accounts": []},
+                ("/userapigateway/trading/account",),
+            ),
+            (
+                "get_portfolio",
+                "get",
+                (),
+                {},
+                _PORTFOLIO_PAYLOAD,
+                (_URL_PORTFOLIO,),
+            ),
+            (
+                "get_portfolio",
+                "get",
+                (),
+                {"account_id": "OTHER"},
+                _PORTFOLIO_PAYLOAD,
+                ("/OTHER/portfolio/v2",),
+            ),
+            (
+                "get_quotes",
+                "post",
+                (list(_QUOTE_INSTRUMENTS),),
+                {},
+                {"quotes": []},
+                (_URL_QUOTES,),
+            ),
+            (
+                "get_history",
+                "get",
+                (),
+                {},
+                {"transactions": []},
+                (_URL_HISTORY,),
+            ),
+            (
+                "get_instrument",
+                "get",
+                ("AAPL", InstrumentType.EQUITY),
+                {},
+                _INSTRUMENT_PAYLOAD,
+                ("AAPL", "EQUITY"),
+            ),
+            (
+                "get_all_instruments",
+                "get",
+                (),
+                {},
+                {"instruments": []},
+                ("instruments",),
+            ),
+            (
+                "get_order",
+                "get",
+                ("ORDER-123",),
+                {},
+                _ORDER_PAYLOAD,
+                ("ORDER-123", _ACCOUNT),
+            ),
+            (
+                "get_order",
+                "get",
+                ("ORDER-123",),
+                {"account_id": "OTHER_ACC"},
+                _ORDER_PAYLOAD,
+                ("ORDER-123", "OTHER_ACC"),
+            ),
+            ("cancel_order", "delete", ("ORDER-123",), {}, {}, ("ORDER-123", _ACCOUNT)),
+            (
+                "cancel_order",
+                "delete",
+                ("ORDER-123",),
+                {"account_id": "OTHER_ACC"},
+                {},
+                ("ORDER-123", "OTHER_ACC"),
+            ),
+        ],
+    )
+    def test_routes_to_expected_url(
+        self,
+        client: PublicApiClient,
+        method_name: str,
+        http_verb: str,
+        args: tuple,
+        kwargs: dict,
+        payload: dict,
+        expected: tuple,
+    ) -> None:
+        verb = getattr(client.api_client, http_verb)
+        verb.return_value = payload
+        getattr(client, method_name)(*args, **kwargs)
+        url = verb.call_args[0][0]
+        for substring in expected:
+            assert substring in url
+
+    @pytest.mark.parametrize(
+        ("method_name", "http_verb", "args", "payload"),
+        [
+            ("get_accounts", "get", (), {"accounts": []}),
+            ("get_portfolio", "get", (), _PORTFOLIO_PAYLOAD),
+            ("get_order", "get", ("ORDER-123",), _ORDER_PAYLOAD),
+            ("cancel_order", "delete", ("ORDER-123",), {}),
+        ],
+    )
+    def test_refreshes_token(
+        self,
+        client: PublicApiClient,
+        method_name: str,
+        http_verb: str,
+        args: tuple,
+        payload: dict,
+    ) -> None:
+        getattr(client.api_client, http_verb).return_value = payload
+        getattr(client, method_name)(*args)
+        client.auth_manager.refresh_token_if_needed.assert_called()
+
+
 # ---------------------------------------------------------------------------
 # get_accounts
 # ---------------------------------------------------------------------------
 
 
 class TestGetAccounts:
-    def setup_method(self) -> None:
-        self.client = _make_client()
-
-    def test_calls_correct_endpoint(self) -> None:
-        self.client.api_client.get = Mock(return_value={"accounts": []})
-        self.client.get_accounts()
-        self.client.api_client.get.assert_called_once_with(
-            "/userapigateway/trading/account"
-        )
+    @pytest.fixture(autouse=True)
+    def _setup(self, client: PublicApiClient) -> None:
+        self.client = client
 
     def test_returns_accounts_response(self) -> None:
-        self.client.api_client.get = Mock(
-            return_value={
-                "accounts": [{"accountId": "ACC-001", "accountType": "BROKERAGE"}]
-            }
-        )
+        self.client.api_client.get.return_value = {
+            "accounts": [{"accountId": "ACC-001", "accountType": "BROKERAGE"}]
+        }
         result = self.client.get_accounts()
         assert isinstance(result, AccountsResponse)
         assert len(result.accounts) == 1
         assert result.accounts[0].account_id == "ACC-001"
 
-    def test_refreshes_token(self) -> None:
-        self.client.api_client.get = Mock(return_value={"accounts": []})
-        self.client.get_accounts()
-        self.client.auth_manager.refresh_token_if_needed.assert_called()
-
     def test_empty_accounts_list(self) -> None:
-        self.client.api_client.get = Mock(return_value={"accounts": []})
+        self.client.api_client.get.return_value = {"accounts": []}
         result = self.client.get_accounts()
         assert result.accounts == []
 
@@ -174,32 +365,16 @@ class TestGetAccounts:
 
 
 class TestGetPortfolio:
-    def setup_method(self) -> None:
-        self.client = _make_client()
-
-    def test_calls_correct_endpoint_with_default_account(self) -> None:
-        self.client.api_client.get = Mock(return_value=_portfolio_payload())
-        self.client.get_portfolio()
-        url = self.client.api_client.get.call_args[0][0]
-        assert f"/{_ACCOUNT}/portfolio/v2" in url
-
-    def test_calls_correct_endpoint_with_explicit_account(self) -> None:
-        self.client.api_client.get = Mock(return_value=_portfolio_payload("OTHER"))
-        self.client.get_portfolio(account_id="OTHER")
-        url = self.client.api_client.get.call_args[0][0]
-        assert "/OTHER/portfolio/v2" in url
+    @pytest.fixture(autouse=True)
+    def _setup(self, client: PublicApiClient) -> None:
+        self.client = client
 
     def test_returns_portfolio_model(self) -> None:
-        self.client.api_client.get = Mock(return_value=_portfolio_payload())
+        self.client.api_client.get.return_value = _PORTFOLIO_PAYLOAD
         result = self.client.get_portfolio()
         assert isinstance(result, Portfolio)
         assert result.account_id == _ACCOUNT
 
-    def test_refreshes_token(self) -> None:
-        self.client.api_client.get = Mock(return_value=_portfolio_payload())
-        self.client.get_portfolio()
-        self.client.auth_manager.refresh_token_if_needed.assert_called()
-
 
 # ---------------------------------------------------------------------------
 # get_quotes
@@ -207,22 +382,13 @@ class TestGetPortfolio:
 
 
 class TestGetQuotes:
-    def setup_method(self) -> None:
-        self.client = _make_client()
-        self.instruments = [
-            OrderInstrument(symbol="AAPL", type=InstrumentType.EQUITY),
-            OrderInstrument(symbol="GOOGL", type=InstrumentType.EQUITY),
-        ]
-
-    def test_calls_correct_endpoint(self) -> None:
-        self.client.api_client.post = Mock(return_value={"quotes": []})
-        self.client.get_quotes(self.instruments)
-        url = self.client.api_client.post.call_args[0][0]
-        assert f"/{_ACCOUNT}/quotes" in url
+    @pytest.fixture(autouse=True)
+    def _setup(self, client: PublicApiClient) -> None:
+        self.client = client
 
     def test_sends_instruments_in_body(self) -> None:
-        self.client.api_client.post = Mock(return_value={"quotes": []})
-        self.client.get_quotes(self.instruments)
+        self.client.api_client.post.return_value = {"quotes": []}
+        self.client.get_quotes(list(_QUOTE_INSTRUMENTS))
         json_data = self.client.api_client.post.call_args[1]["json_data"]
         assert json_data == {
             "instruments": [
@@ -232,26 +398,24 @@ class TestGetQuotes:
         }
 
     def test_returns_list_of_quotes(self) -> None:
-        self.client.api_client.post = Mock(
-            return_value={
-                "quotes": [
-                    {
-                        "instrument": {"symbol": "AAPL", "type": "EQUITY"},
-                        "outcome": "SUCCESS",
-                        "last": "150.00",
-                    }
-                ]
-            }
-        )
-        result = self.client.get_quotes(self.instruments)
+        self.client.api_client.post.return_value = {
+            "quotes": [
+                {
+                    "instrument": {"symbol": "AAPL", "type": "EQUITY"},
+                    "outcome": "SUCCESS",
+                    "last": "150.00",
+                }
+            ]
+        }
+        result = self.client.get_quotes(list(_QUOTE_INSTRUMENTS))
         assert isinstance(result, list)
         assert len(result) == 1
         assert isinstance(result[0], Quote)
         assert result[0].last == Decimal("150.00")
 
     def test_empty_response_returns_empty_list(self) -> None:
-        self.client.api_client.post = Mock(return_value={"quotes": []})
-        result = self.client.get_quotes(self.instruments)
+        self.client.api_client.post.return_value = {"quotes": []}
+        result = self.client.get_quotes(list(_QUOTE_INSTRUMENTS))
         assert result == []
 
 
@@ -281,30 +445,25 @@ class TestQuoteRequest:
 
 
 class TestGetHistory:
-    def setup_method(self) -> None:
-        self.client = _make_client()
-
-    def test_calls_correct_endpoint(self) -> None:
-        self.client.api_client.get = Mock(return_value={"transactions": []})
-        self.client.get_history()
-        url = self.client.api_client.get.call_args[0][0]
-        assert f"/{_ACCOUNT}/history" in url
+    @pytest.fixture(autouse=True)
+    def _setup(self, client: PublicApiClient) -> None:
+        self.client = client
 
     def test_without_request_sends_no_params(self) -> None:
-        self.client.api_client.get = Mock(return_value={"transactions": []})
+        self.client.api_client.get.return_value = {"transactions": []}
         self.client.get_history()
         params = self.client.api_client.get.call_args[1]["params"]
         assert params is None
 
     def test_with_request_sends_params(self) -> None:
-        self.client.api_client.get = Mock(return_value={"transactions": []})
+        self.client.api_client.get.return_value = {"transactions": []}
         self.client.get_history(history_request=HistoryRequest(page_size=10))
         params = self.client.api_client.get.call_args[1]["params"]
         assert params is not None
         assert "pageSize" in params
 
     def test_returns_history_response_page(self) -> None:
-        self.client.api_client.get = Mock(return_value={"transactions": []})
+        self.client.api_client.get.return_value = {"transactions": []}
         result = self.client.get_history()
         assert isinstance(result, HistoryResponsePage)
 
@@ -313,101 +472,96 @@ class TestGetHistory:
 # get_instrument / get_all_instruments
 # ---------------------------------------------------------------------------
 
-_INSTRUMENT_PAYLOAD = {
-    "instrument": {"symbol": "AAPL", "type": "EQUITY"},
-    "trading": "BUY_AND_SELL",
-    "fractionalTrading": "BUY_AND_SELL",
-    "optionTrading": "BUY_AND_SELL",
-    "optionSpreadTrading": "DISABLED",
-}
-
 
 class TestGetInstrument:
-    def setup_method(self) -> None:
-        self.client = _make_client()
-
-    def test_calls_correct_endpoint(self) -> None:
-        self.client.api_client.get = Mock(return_value=_INSTRUMENT_PAYLOAD)
-        self.client.get_instrument("AAPL", InstrumentType.EQUITY)
-        url = self.client.api_client.get.call_args[0][0]
-        assert "AAPL" in url
-        assert "EQUITY" in url
+    @pytest.fixture(autouse=True)
+    def _setup(self, client: PublicApiClient) -> None:
+        self.client = client
 
     def test_returns_instrument_model(self) -> None:
-        self.client.api_client.get = Mock(return_value=_INSTRUMENT_PAYLOAD)
+        self.client.api_client.get.return_value = _INSTRUMENT_PAYLOAD
         result = self.client.get_instrument("AAPL", InstrumentType.EQUITY)
         assert isinstance(result, Instrument)
         assert result.instrument.symbol == "AAPL"
 
     def test_parses_exchange_name(self) -> None:
         payload = {**_INSTRUMENT_PAYLOAD, "exchangeName": "NASDAQ"}
-        self.client.api_client.get = Mock(return_value=payload)
+        self.client.api_client.get.return_value = payload
         result = self.client.get_instrument("AAPL", InstrumentType.EQUITY)
         assert result.exchange_name == "NASDAQ"
 
     def test_exchange_name_none_when_absent(self) -> None:
-        self.client.api_client.get = Mock(return_value=_INSTRUMENT_PAYLOAD)
+        self.client.api_client.get.return_value = _INSTRUMENT_PAYLOAD
         result = self.client.get_instrument("AAPL", InstrumentType.EQUITY)
         assert result.exchange_name is None
 
 
 class TestGetAllInstruments:
-    def setup_method(self) -> None:
-        self.client = _make_client()
-
-    def test_calls_correct_endpoint(self) -> None:
-        self.client.api_client.get = Mock(return_value={"instruments": []})
-        self.client.get_all_instruments()
-        url = self.client.api_client.get.call_args[0][0]
-        assert "instruments" in url
+    @pytest.fixture(autouse=True)
+    def _setup(self, client: PublicApiClient) -> None:
+        self.client = client
 
     def test_without_filter_sends_no_params(self) -> None:
-        self.client.api_client.get = Mock(return_value={"instruments": []})
+        self.client.api_client.get.return_value = {"instruments": []}
         self.client.get_all_instruments()
         params = self.client.api_client.get.call_args[1]["params"]
         assert params is None
 
     def test_with_filter_sends_params(self) -> None:
-        from public_api_sdk.models.instrument import InstrumentsRequest, Trading
-
-        self.client.api_client.get = Mock(return_value={"instruments": []})
+        self.client.api_client.get.return_value = {"instruments": []}
         request = InstrumentsRequest(trading_filter=[Trading.BUY_AND_SELL])
         self.client.get_all_instruments(instruments_request=request)
         params = self.client.api_client.get.call_args[1]["params"]
         assert params is not None
 
 
+class TestIterInstruments:
+    @pytest.fixture(autouse=True)
+    def _setup(self, client: PublicApiClient) -> None:
+        self.client = client
+
+    def test_yields_instrument_models(self) -> None:
+        self.client.api_client.get.return_value = {"instruments": [_INSTRUMENT_PAYLOAD]}
+        results = list(self.client.iter_instruments())
+        assert len(results) == 1
+        assert isinstance(results[0], Instrument)
+        assert results[0].instrument.symbol == "AAPL"
+
+    def test_is_lazy(self) -> None:
+        self.client.api_client.get.return_value = {"instruments": []}
+        iterator = self.client.iter_instruments()
+        self.client.api_client.get.assert_not_called()
+        assert list(iterator) == []
+        self.client.api_client.get.assert_called_once()
+
+
 # ---------------------------------------------------------------------------
 # Options: expirations, chain, greeks
 # ---------------------------------------------------------------------------
 
 
 class TestGetOptionExpirations:
-    def setup_method(self) -> None:
-        self.client = _make_client()
+    @pytest.fixture(autouse=True)
+    def _setup(self, client: PublicApiClient) -> None:
+        self.client = client
 
     def test_calls_correct_endpoint(self) -> None:
-        from public_api_sdk.models.option import OptionExpirationsRequest
-
-        self.client.api_client.post = Mock(
-            return_value={"baseSymbol": "AAPL", "expirations": []}
-        )
+        self.client.api_client.post.return_value = {
+            "baseSymbol": "AAPL",
+            "expirations": [],
+        }
         request = OptionExpirationsRequest(
             instrument=OrderInstrument(symbol="AAPL", type=InstrumentType.EQUITY)
         )
         self.client.get_option_expirations(request)
         url = self.client.api_client.post.call_args[0][0]
-        assert f"/{_ACCOUNT}/option-expirations" in url
+        assert _URL_OPTION_EXPIRATIONS in url
 
     def test_returns_expirations_response(self) -> None:
-        from public_api_sdk.models.option import (
-            OptionExpirationsRequest,
-            OptionExpirationsResponse,
-        )
-
-        self.client.api_client.post = Mock(
-            return_value={"baseSymbol": "AAPL", "expirations": ["2025-01-17"]}
-        )
+        self.client.api_client.post.return_value = {
+            "baseSymbol": "AAPL",
+            "expirations": ["2025-01-17"],
+        }
         request = OptionExpirationsRequest(
             instrument=OrderInstrument(symbol="AAPL", type=InstrumentType.EQUITY)
         )
@@ -416,48 +570,49 @@ class TestGetOptionExpirations:
         assert result.expirations == ["2025-01-17"]
 
 
-class TestGetOptionGreeks:
-    def setup_method(self) -> None:
-        self.client = _make_client()
-        self.greeks_payload = {
-            "greeks": [
-                {
-                    "symbol": "AAPL260116C00270000",
-                    "greeks": {
-                        "delta": "0.5",
-                        "gamma": "0.01",
-                        "theta": "-0.05",
-                        "vega": "0.2",
-                        "rho": "0.1",
-                        "impliedVolatility": "0.25",
-                    },
-                }
-            ]
+_GREEKS_PAYLOAD = {
+    "greeks": [
+        {
+            "symbol": "AAPL260116C00270000",
+            "greeks": {
+                "delta": "0.5",
+                "gamma": "0.01",
+                "theta": "-0.05",
+                "vega": "0.2",
+                "rho": "0.1",
+                "impliedVolatility": "0.25",
+            },
         }
+    ]
+}
+
+
+class TestGetOptionGreeks:
+    @pytest.fixture(autouse=True)
+    def _setup(self, client: PublicApiClient) -> None:
+        self.client = client
 
     def test_get_option_greeks_calls_correct_endpoint(self) -> None:
-        self.client.api_client.get = Mock(return_value=self.greeks_payload)
+        self.client.api_client.get.return_value = _GREEKS_PAYLOAD
         self.client.get_option_greeks(["AAPL260116C00270000"])
         url = self.client.api_client.get.call_args[0][0]
-        assert f"/{_ACCOUNT}/greeks" in url
+        assert _URL_GREEKS in url
 
     def test_get_option_greeks_returns_response(self) -> None:
-        self.client.api_client.get = Mock(return_value=self.greeks_payload)
+        self.client.api_client.get.return_value = _GREEKS_PAYLOAD
         result = self.client.get_option_greeks(["AAPL260116C00270000"])
         assert isinstance(result, GreeksResponse)
         assert len(result.greeks) == 1
         assert result.greeks[0].symbol == "AAPL260116C00270000"
 
     def test_get_option_greek_returns_single(self) -> None:
-        from public_api_sdk.models.option import OptionGreeks
-
-        self.client.api_client.get = Mock(return_value=self.greeks_payload)
+        self.client.api_client.get.return_value = _GREEKS_PAYLOAD
         result = self.client.get_option_greek("AAPL260116C00270000")
         assert isinstance(result, OptionGreeks)
         assert result.symbol == "AAPL260116C00270000"
 
     def test_get_option_greek_raises_when_empty(self) -> None:
-        self.client.api_client.get = Mock(return_value={"greeks": []})
+        self.client.api_client.get.return_value = {"greeks": []}
         with pytest.raises(ValueError, match="No greeks found"):
             self.client.get_option_greek("AAPL260116C00270000")
 
@@ -467,43 +622,50 @@ class TestGetOptionGreeks:
 # ---------------------------------------------------------------------------
 
 
-class TestPerformPreflightCalculation:
-    def setup_method(self) -> None:
-        self.client = _make_client()
-        self.preflight_response = {
-            "instrument": {"symbol": "AAPL", "type": "EQUITY"},
-            "orderValue": "15000.00",
-            "estimatedCommission": "0.00",
-            "estimatedCost": "15000.00",
-        }
+_PREFLIGHT_PAYLOAD = {
+    "instrument": {"symbol": "AAPL", "type": "EQUITY"},
+    "orderValue": "15000.00",
+    "estimatedCommission": "0.00",
+    "estimatedCost": "15000.00",
+}
 
-    def _make_request(self) -> PreflightRequest:
-        return PreflightRequest(
-            instrument=OrderInstrument(symbol="AAPL", type=InstrumentType.EQUITY),
-            order_side=OrderSide.BUY,
-            order_type=OrderType.LIMIT,
-            expiration=OrderExpirationRequest(time_in_force=TimeInForce.DAY),
-            quantity=100,
-            limit_price=Decimal("150.00"),
-        )
 
-    def test_calls_correct_endpoint(self) -> None:
-        self.client.api_client.post = Mock(return_value=self.preflight_response)
-        self.client.perform_preflight_calculation(self._make_request())
-        url = self.client.api_client.post.call_args[0][0]
-        assert f"/{_ACCOUNT}/preflight/single-leg" in url
+@pytest.fixture(scope="module")
+def preflight_request() -> PreflightRequest:
+    """One validated PreflightRequest for the module; tests never mutate it."""
+    return PreflightRequest(
+        instrument=OrderInstrument(symbol="AAPL", type=InstrumentType.EQUITY),
+        order_side=OrderSide.BUY,
+        order_type=OrderType.LIMIT,
+        expiration=OrderExpirationRequest(time_in_force=TimeInForce.DAY),
+        quantity=100,
+        limit_price=Decimal("150.00"),
+    )
+
 
-    def test_returns_preflight_response(self) -> None:
-        from public_api_sdk.models.order import PreflightResponse
+class TestPerformPreflightCalculation:
+    @pytest.fixture(autouse=True)
+    def _setup(self, client: PublicApiClient) -> None:
+        self.client = client
+
+    def test_calls_correct_endpoint(self, preflight_request: PreflightRequest) -> None:
+        self.client.api_client.post.return_value = _PREFLIGHT_PAYLOAD
+        self.client.perform_preflight_calculation(preflight_request)
+        url = self.client.api_client.post.call_args[0][0]
+        assert _URL_PREFLIGHT in url
 
-        self.client.api_client.post = Mock(return_value=self.preflight_response)
-        result = self.client.perform_preflight_calculation(self._make_request())
+    def test_returns_preflight_response(
+        self, preflight_request: PreflightRequest
+    ) -> None:
+        self.client.api_client.post.return_value = _PREFLIGHT_PAYLOAD
+        result = self.client.perform_preflight_calculation(preflight_request)
         assert isinstance(result, PreflightResponse)
 
 
 class TestPreflightShortOrder:
-    def setup_method(self) -> None:
-        self.client = _make_client()
+    @pytest.fixture(autouse=True)
+    def _setup(self, client: PublicApiClient) -> None:
+        self.client = client
         self.mock_response = Mock(spec=PreflightResponse)
         self.client.perform_preflight_calculation = Mock(
             return_value=self.mock_response
@@ -548,49 +710,54 @@ class TestPreflightShortOrder:
 # ---------------------------------------------------------------------------
 
 
-class TestPlaceOrder:
-    def setup_method(self) -> None:
-        self.client = _make_client()
+@pytest.fixture(scope="module")
+def order_request() -> OrderRequest:
+    """One validated OrderRequest for the module; tests never mutate it."""
+    return OrderRequest(
+        order_id=_VALID_UUID,
+        instrument=OrderInstrument(symbol="AAPL", type=InstrumentType.EQUITY),
+        order_side=OrderSide.BUY,
+        order_type=OrderType.MARKET,
+        expiration=OrderExpirationRequest(time_in_force=TimeInForce.DAY),
+        quantity=10,
+    )
 
-    def _make_request(self) -> OrderRequest:
-        return OrderRequest(
-            order_id=_VALID_UUID,
-            instrument=OrderInstrument(symbol="AAPL", type=InstrumentType.EQUITY),
-            order_side=OrderSide.BUY,
-            order_type=OrderType.MARKET,
-            expiration=OrderExpirationRequest(time_in_force=TimeInForce.DAY),
-            quantity=10,
-        )
 
-    def test_calls_correct_endpoint(self) -> None:
-        self.client.api_client.post = Mock(return_value={"orderId": "ORDER-123"})
-        self.client.place_order(self._make_request())
+class TestPlaceOrder:
+    @pytest.fixture(autouse=True)
+    def _setup(self, client: PublicApiClient) -> None:
+        self.client = client
+
+    def test_calls_correct_endpoint(self, order_request: OrderRequest) -> None:
+        self.client.api_client.post.return_value = {"orderId": "ORDER-123"}
+        self.client.place_order(order_request)
         url = self.client.api_client.post.call_args[0][0]
-        assert f"/{_ACCOUNT}/order" in url
+        assert _URL_ORDER in url
 
-    def test_returns_new_order(self) -> None:
-        self.client.api_client.post = Mock(return_value={"orderId": "ORDER-123"})
-        result = self.client.place_order(self._make_request())
+    def test_returns_new_order(self, order_request: OrderRequest) -> None:
+        self.client.api_client.post.return_value = {"orderId": "ORDER-123"}
+        result = self.client.place_order(order_request)
         assert isinstance(result, NewOrder)
         assert result.order_id == "ORDER-123"
         assert result.account_id == _ACCOUNT
 
-    def test_sends_serialized_request(self) -> None:
-        self.client.api_client.post = Mock(return_value={"orderId": "ORDER-123"})
-        self.client.place_order(self._make_request())
+    def test_sends_serialized_request(self, order_request: OrderRequest) -> None:
+        self.client.api_client.post.return_value = {"orderId": "ORDER-123"}
+        self.client.place_order(order_request)
         json_data = self.client.api_client.post.call_args[1]["json_data"]
         assert "orderId" in json_data
 
-    def test_uses_explicit_account_id(self) -> None:
-        self.client.api_client.post = Mock(return_value={"orderId": "ORDER-123"})
-        self.client.place_order(self._make_request(), account_id="OTHER_ACC")
+    def test_uses_explicit_account_id(self, order_request: OrderRequest) -> None:
+        self.client.api_client.post.return_value = {"orderId": "ORDER-123"}
+        self.client.place_order(order_request, account_id="OTHER_ACC")
         url = self.client.api_client.post.call_args[0][0]
         assert "/OTHER_ACC/order" in url
 
 
 class TestPlaceShortOrder:
-    def setup_method(self) -> None:
-        self.client = _make_client()
+    @pytest.fixture(autouse=True)
+    def _setup(self, client: PublicApiClient) -> None:
+        self.client = client
         self.mock_order = Mock(spec=NewOrder)
         self.client.place_order = Mock(return_value=self.mock_order)
 
@@ -638,8 +805,9 @@ class TestPlaceShortOrder:
 
 
 class TestFlattenAndGoShort:
-    def setup_method(self) -> None:
-        self.client = _make_client()
+    @pytest.fixture(autouse=True)
+    def _setup(self, client: PublicApiClient) -> None:
+        self.client = client
         self.flatten_order = Mock()
         self.flatten_order.order_id = "FLATTEN-123"
         self.filled_flatten = Mock()
@@ -753,67 +921,27 @@ class TestFlattenAndGoShort:
 
 
 class TestGetOrder:
-    def setup_method(self) -> None:
-        self.client = _make_client()
-
-    def test_calls_correct_endpoint(self) -> None:
-        self.client.api_client.get = Mock(return_value=_order_payload())
-        self.client.get_order("ORDER-123")
-        url = self.client.api_client.get.call_args[0][0]
-        assert "ORDER-123" in url
-        assert _ACCOUNT in url
+    @pytest.fixture(autouse=True)
+    def _setup(self, client: PublicApiClient) -> None:
+        self.client = client
 
     def test_returns_order_model(self) -> None:
-        self.client.api_client.get = Mock(return_value=_order_payload())
+        self.client.api_client.get.return_value = _ORDER_PAYLOAD
         result = self.client.get_order("ORDER-123")
         assert isinstance(result, Order)
         assert result.status == OrderStatus.NEW
 
-    def test_uses_default_account(self) -> None:
-        self.client.api_client.get = Mock(return_value=_order_payload())
-        self.client.get_order("ORDER-123")
-        url = self.client.api_client.get.call_args[0][0]
-        assert _ACCOUNT in url
-
-    def test_uses_explicit_account(self) -> None:
-        self.client.api_client.get = Mock(return_value=_order_payload())
-        self.client.get_order("ORDER-123", account_id="OTHER_ACC")
-        url = self.client.api_client.get.call_args[0][0]
-        assert "OTHER_ACC" in url
-
-    def test_refreshes_token(self) -> None:
-        self.client.api_client.get = Mock(return_value=_order_payload())
-        self.client.get_order("ORDER-123")
-        self.client.auth_manager.refresh_token_if_needed.assert_called()
-
 
 class TestCancelOrder:
-    def setup_method(self) -> None:
-        self.client = _make_client()
-
-    def test_calls_correct_endpoint(self) -> None:
-        self.client.api_client.delete = Mock(return_value={})
-        self.client.cancel_order("ORDER-123")
-        url = self.client.api_client.delete.call_args[0][0]
-        assert "ORDER-123" in url
-        assert _ACCOUNT in url
+    @pytest.fixture(autouse=True)
+    def _setup(self, client: PublicApiClient) -> None:
+        self.client = client
 
     def test_returns_none(self) -> None:
-        self.client.api_client.delete = Mock(return_value={})
+        self.client.api_client.delete.return_value = {}
         result = self.client.cancel_order("ORDER-123")
         assert result is None
 
-    def test_uses_explicit_account(self) -> None:
-        self.client.api_client.delete = Mock(return_value={})
-        self.client.cancel_order("ORDER-123", account_id="OTHER_ACC")
-        url = self.client.api_client.delete.call_args[0][0]
-        assert "OTHER_ACC" in url
-
-    def test_refreshes_token(self) -> None:
-        self.client.api_client.delete = Mock(return_value={})
-        self.client.cancel_order("ORDER-123")
-        self.client.auth_manager.refresh_token_if_needed.assert_called()
-
 
 # ---------------------------------------------------------------------------
 # cancel_and_replace_order
@@ -823,8 +951,9 @@ _REQUEST_UUID = "85718cfb-32f4-4c57-976b-6060b94bbaf9"
 
 
 class TestCancelAndReplaceOrder:
-    def setup_method(self) -> None:
-        self.client = _make_client()
+    @pytest.fixture(autouse=True)
+    def _setup(self, client: PublicApiClient) -> None:
+        self.client = client
         self.request = CancelAndReplaceRequest(
             order_id=_VALID_UUID,
             request_id=_REQUEST_UUID,
@@ -834,20 +963,20 @@ class TestCancelAndReplaceOrder:
         )
 
     def test_calls_put_on_correct_endpoint(self) -> None:
-        self.client.api_client.put = Mock(return_value={"orderId": "NEW-ORDER-456"})
+        self.client.api_client.put.return_value = {"orderId": "NEW-ORDER-456"}
         self.client.cancel_and_replace_order(self.request)
         url = self.client.api_client.put.call_args[0][0]
-        assert f"/{_ACCOUNT}/order" in url
+        assert _URL_ORDER in url
 
     def test_returns_new_order(self) -> None:
-        self.client.api_client.put = Mock(return_value={"orderId": "NEW-ORDER-456"})
+        self.client.api_client.put.return_value = {"orderId": "NEW-ORDER-456"}
         result = self.client.cancel_and_replace_order(self.request)
         assert isinstance(result, NewOrder)
         assert result.order_id == "NEW-ORDER-456"
         assert result.account_id == _ACCOUNT
 
     def test_sends_serialized_body(self) -> None:
-        self.client.api_client.put = Mock(return_value={"orderId": "NEW-ORDER-456"})
+        self.client.api_client.put.return_value = {"orderId": "NEW-ORDER-456"}
         self.client.cancel_and_replace_order(self.request)
         json_data = self.client.api_client.put.call_args[1]["json_data"]
         assert json_data["orderId"] == _VALID_UUID
@@ -856,13 +985,13 @@ class TestCancelAndReplaceOrder:
         assert json_data["limitPrice"] == "150.00"
 
     def test_uses_explicit_account_id(self) -> None:
-        self.client.api_client.put = Mock(return_value={"orderId": "NEW-ORDER-456"})
+        self.client.api_client.put.return_value = {"orderId": "NEW-ORDER-456"}
         self.client.cancel_and_replace_order(self.request, account_id="OTHER_ACC")
         url = self.client.api_client.put.call_args[0][0]
         assert "/OTHER_ACC/order" in url
 
     def test_refreshes_token(self) -> None:
-        self.client.api_client.put = Mock(return_value={"orderId": "NEW-ORDER-456"})
+        self.client.api_client.put.return_value = {"orderId": "NEW-ORDER-456"}
         self.client.cancel_and_replace_order(self.request)
         self.client.auth_manager.refresh_token_if_needed.assert_called()
 
@@ -878,23 +1007,19 @@ class TestCancelAndReplaceOrder:
 
 
 class TestApiEndpointProperty:
-    def test_get_returns_base_url(self) -> None:
-        client = _make_client()
+    def test_get_returns_base_url(self, client: PublicApiClient) -> None:
         client.api_client.base_url = "https://api.example.com"
         assert client.api_endpoint == "https://api.example.com"
 
-    def test_set_updates_base_url(self) -> None:
-        client = _make_client()
+    def test_set_updates_base_url(self, client: PublicApiClient) -> None:
         client.api_endpoint = "https://staging.api.example.com"
         assert client.api_client.base_url == "https://staging.api.example.com"
 
-    def test_set_strips_trailing_slash(self) -> None:
-        client = _make_client()
+    def test_set_strips_trailing_slash(self, client: PublicApiClient) -> None:
         client.api_endpoint = "https://staging.api.example.com/"
         assert client.api_client.base_url == "https://staging.api.example.com"
 
-    def test_set_non_string_raises_type_error(self) -> None:
-        client = _make_client()
+    def test_set_non_string_raises_type_error(self, client: PublicApiClient) -> None:
         with pytest.raises(TypeError, match="must be a string URL"):
             client.api_endpoint = 12345  # type: ignore[assignment]
 
@@ -926,35 +1051,38 @@ def _bars_payload(symbol: str = "AAPL", period: str = "YEAR") -> dict:
 
 
 class TestGetBars:
-    def setup_method(self) -> None:
-        self.client = _make_client()
+    @pytest.fixture(autouse=True)
+    def _setup(self, client: PublicApiClient) -> None:
+        self.client = client
 
     def test_calls_url_without_aggregation(self) -> None:
-        self.client.api_client.get = Mock(return_value=_bars_payload())
+        self.client.api_client.get.return_value = _bars_payload()
         self.client.get_bars("AAPL", BarPeriod.YEAR)
         url = self.client.api_client.get.call_args[0][0]
         assert url == "/userapigateway/historicdata/EQUITY/AAPL/YEAR"
 
     def test_calls_url_with_aggregation(self) -> None:
-        self.client.api_client.get = Mock(return_value=_bars_payload())
-        self.client.get_bars("AAPL", BarPeriod.YEAR, aggregation=BarAggregation.ONE_HOUR)
+        self.client.api_client.get.return_value = _bars_payload()
+        self.client.get_bars(
+            "AAPL", BarPeriod.YEAR, aggregation=BarAggregation.ONE_HOUR
+        )
         url = self.client.api_client.get.call_args[0][0]
         assert url == "/userapigateway/historicdata/EQUITY/AAPL/YEAR/ONE_HOUR"
 
     def test_calls_url_with_ten_years_period(self) -> None:
-        self.client.api_client.get = Mock(return_value=_bars_payload(period="TEN_YEARS"))
+        self.client.api_client.get.return_value = _bars_payload(period="TEN_YEARS")
         self.client.get_bars("AAPL", BarPeriod.TEN_YEARS)
         url = self.client.api_client.get.call_args[0][0]
         assert url == "/userapigateway/historicdata/EQUITY/AAPL/TEN_YEARS"
 
     def test_calls_url_with_all_period(self) -> None:
-        self.client.api_client.get = Mock(return_value=_bars_payload(period="ALL"))
+        self.client.api_client.get.return_value = _bars_payload(period="ALL")
         self.client.get_bars("AAPL", BarPeriod.ALL)
         url = self.client.api_client.get.call_args[0][0]
         assert url == "/userapigateway/historicdata/EQUITY/AAPL/ALL"
 
     def test_calls_url_with_crypto_instrument_type(self) -> None:
-        self.client.api_client.get = Mock(return_value=_bars_payload(symbol="BTC"))
+        self.client.api_client.get.return_value = _bars_payload(symbol="BTC")
         self.client.get_bars(
             "BTC", BarPeriod.YEAR, instrument_type=InstrumentType.CRYPTO
         )
@@ -962,7 +1090,9 @@ class TestGetBars:
         assert url == "/userapigateway/historicdata/CRYPTO/BTC/YEAR"
 
     def test_calls_url_with_option_instrument_type(self) -> None:
-        self.client.api_client.get = Mock(return_value=_bars_payload(symbol="AAPL  240119C00150000"))
+        self.client.api_client.get.return_value = _bars_payload(
+            symbol="AAPL  240119C00150000"
+        )
         self.client.get_bars(
             "AAPL  240119C00150000",
             BarPeriod.YEAR,
@@ -978,26 +1108,28 @@ class TestGetBars:
             )
 
     def test_passes_purchase_date_as_query_param(self) -> None:
-        self.client.api_client.get = Mock(return_value=_bars_payload(period="SINCE_PURCHASE"))
-        self.client.get_bars("AAPL", BarPeriod.SINCE_PURCHASE, purchase_date="2024-03-15")
+        self.client.api_client.get.return_value = _bars_payload(period="SINCE_PURCHASE")
+        self.client.get_bars(
+            "AAPL", BarPeriod.SINCE_PURCHASE, purchase_date="2024-03-15"
+        )
         params = self.client.api_client.get.call_args[1]["params"]
         assert params == {"purchaseDate": "2024-03-15"}
 
     def test_omits_params_when_no_purchase_date(self) -> None:
-        self.client.api_client.get = Mock(return_value=_bars_payload())
+        self.client.api_client.get.return_value = _bars_payload()
         self.client.get_bars("AAPL", BarPeriod.YEAR)
         params = self.client.api_client.get.call_args[1]["params"]
         assert params is None
 
     def test_returns_bars_response(self) -> None:
-        self.client.api_client.get = Mock(return_value=_bars_payload())
+        self.client.api_client.get.return_value = _bars_payload()
         result = self.client.get_bars("AAPL", BarPeriod.YEAR)
         assert isinstance(result, BarsResponse)
         assert result.symbol == "AAPL"
         assert result.period == "YEAR"
 
     def test_response_deserializes_sessions_and_bars(self) -> None:
-        self.client.api_client.get = Mock(return_value=_bars_payload())
+        self.client.api_client.get.return_value = _bars_payload()
         result = self.client.get_bars("AAPL", BarPeriod.YEAR)
         assert result.total_expected_bars == 1
         assert len(result.regular_market.bars) == 1
@@ -1015,15 +1147,19 @@ class TestGetBars:
             "change": "1.50",
             "percentChange": "0.81",
         }
-        self.client.api_client.get = Mock(return_value=payload)
+        self.client.api_client.get.return_value = payload
         result = self.client.get_bars("AAPL", BarPeriod.YEAR)
         assert isinstance(result.last_regular_trading_session_close, LastSessionClose)
         assert result.last_regular_trading_session_close.close == Decimal("186.50")
         assert result.last_regular_trading_session_close.close_date == "2024-01-02"
         assert result.last_regular_trading_session_close.change == Decimal("1.50")
-        assert result.last_regular_trading_session_close.percent_change == Decimal("0.81")
+        assert result.last_regular_trading_session_close.percent_change == Decimal(
+            "0.81"
+        )
 
-    def test_parses_last_regular_trading_session_close_with_nullable_fields(self) -> None:
+    def test_parses_last_regular_trading_session_close_with_nullable_fields(
+        self,
+    ) -> None:
         payload = _bars_payload()
         payload["lastRegularTradingSessionClose"] = {
             "close": "186.50",
@@ -1031,19 +1167,19 @@ class TestGetBars:
             "change": None,
             "percentChange": None,
         }
-        self.client.api_client.get = Mock(return_value=payload)
+        self.client.api_client.get.return_value = payload
         result = self.client.get_bars("AAPL", BarPeriod.YEAR)
         assert result.last_regular_trading_session_close is not None
         assert result.last_regular_trading_session_close.change is None
         assert result.last_regular_trading_session_close.percent_change is None
 
     def test_last_regular_trading_session_close_is_none_when_absent(self) -> None:
-        self.client.api_client.get = Mock(return_value=_bars_payload())
+        self.client.api_client.get.return_value = _bars_payload()
         result = self.client.get_bars("AAPL", BarPeriod.YEAR)
         assert result.last_regular_trading_session_close is None
 
     def test_passes_trading_session_toggle_as_query_param(self) -> None:
-        self.client.api_client.get = Mock(return_value=_bars_payload(period="DAY"))
+        self.client.api_client.get.return_value = _bars_payload(period="DAY")
         self.client.get_bars(
             "AAPL",
             BarPeriod.DAY,
@@ -1053,9 +1189,7 @@ class TestGetBars:
         assert params == {"tradingSessionToggle": "ALL_SESSIONS"}
 
     def test_combines_purchase_date_and_trading_session_toggle(self) -> None:
-        self.client.api_client.get = Mock(
-            return_value=_bars_payload(period="SINCE_PURCHASE")
-        )
+        self.client.api_client.get.return_value = _bars_payload(period="SINCE_PURCHASE")
         self.client.get_bars(
             "AAPL",
             BarPeriod.SINCE_PURCHASE,
@@ -1072,7 +1206,7 @@ class TestGetBars:
         payload = _bars_payload(period="DAY")
         payload["preMarketOvernight"] = {"expectedBars": 1, "bars": []}
         payload["postMarketOvernight"] = {"expectedBars": 2, "bars": []}
-        self.client.api_client.get = Mock(return_value=payload)
+        self.client.api_client.get.return_value = payload
         result = self.client.get_bars(
             "AAPL",
             BarPeriod.DAY,
@@ -1084,7 +1218,7 @@ class TestGetBars:
         assert result.post_market_overnight.expected_bars == 2
 
     def test_overnight_sessions_none_when_absent(self) -> None:
-        self.client.api_client.get = Mock(return_value=_bars_payload())
+        self.client.api_client.get.return_value = _bars_payload()
         result = self.client.get_bars("AAPL", BarPeriod.YEAR)
         assert result.pre_market_overnight is None
         assert result.post_market_overnight is None
@@ -1096,12 +1230,9 @@ class TestGetBars:
 
 
 class TestClose:
-    def test_stops_subscription_managers_and_api_client(self) -> None:
-        client = _make_client()
-        client._subscription_manager.stop = Mock()
-        client._order_subscription_manager.stop = Mock()
-        client.api_client.close = Mock()
-
+    def test_stops_subscription_managers_and_api_client(
+        self, client: PublicApiClient
+    ) -> None:
         client.close()
 
         client._subscription_manager.stop.assert_called_once()
@@ -1114,68 +1245,65 @@ class TestClose:
 # ---------------------------------------------------------------------------
 
 
-def _taxlots_summary_payload() -> dict:
-    return {
-        "asOf": "2026-07-18",
-        "shortTerm": "10.00",
-        "longTerm": "20.00",
-        "sixtyFortyTerm": "0.00",
-        "totalProfitLoss": "30.00",
-        "lots": [
-            {
-                "accountNumber": _ACCOUNT,
-                "symbol": "AAPL",
-                "cusip": "037833100",
-                "companyName": "Apple Inc.",
-                "quantity": "10",
-                "costBasis": "1500.00",
-                "unitCost": "150.00",
-                "currentPrice": "160.00",
-                "currentValue": "1600.00",
-                "gainLoss": "100.00",
-                "shortTermGainLoss": "100.00",
-                "longTermGainLoss": "0.00",
-            }
-        ],
-    }
+_TAXLOTS_SUMMARY_PAYLOAD = {
+    "asOf": "2026-07-18",
+    "shortTerm": "10.00",
+    "longTerm": "20.00",
+    "sixtyFortyTerm": "0.00",
+    "totalProfitLoss": "30.00",
+    "lots": [
+        {
+            "accountNumber": _ACCOUNT,
+            "symbol": "AAPL",
+            "cusip": "037833100",
+            "companyName": "Apple Inc.",
+            "quantity": "10",
+            "costBasis": "1500.00",
+            "unitCost": "150.00",
+            "currentPrice": "160.00",
+            "currentValue": "1600.00",
+            "gainLoss": "100.00",
+            "shortTermGainLoss": "100.00",
+            "longTermGainLoss": "0.00",
+        }
+    ],
+}
 
 
-def _taxlots_detail_payload() -> dict:
-    return {
-        "asOf": "2026-07-18",
-        "symbol": "AAPL",
-        "companyName": "Apple Inc.",
-        "lots": [
-            {
-                "quantity": "10",
-                "costBasis": "1500.00",
-                "unitCost": "150.00",
-                "currentPrice": "160.00",
-                "currentValue": "1600.00",
-                "gainLoss": "100.00",
-                "openDate": "2024-01-15",
-                "term": "LONG",
-                "shortTermGainLoss": "0.00",
-                "longTermGainLoss": "100.00",
-            }
-        ],
-    }
+_TAXLOTS_DETAIL_PAYLOAD = {
+    "asOf": "2026-07-18",
+    "symbol": "AAPL",
+    "companyName": "Apple Inc.",
+    "lots": [
+        {
+            "quantity": "10",
+            "costBasis": "1500.00",
+            "unitCost": "150.00",
+            "currentPrice": "160.00",
+            "currentValue": "1600.00",
+            "gainLoss": "100.00",
+            "openDate": "2024-01-15",
+            "term": "LONG",
+            "shortTermGainLoss": "0.00",
+            "longTermGainLoss": "100.00",
+        }
+    ],
+}
 
 
 class TestGetUnrealizedTaxLots:
-    def setup_method(self) -> None:
-        self.client = _make_client()
+    @pytest.fixture(autouse=True)
+    def _setup(self, client: PublicApiClient) -> None:
+        self.client = client
 
     def test_calls_correct_endpoint(self) -> None:
-        self.client.api_client.get = Mock(return_value=_taxlots_summary_payload())
+        self.client.api_client.get.return_value = _TAXLOTS_SUMMARY_PAYLOAD
         self.client.get_unrealized_tax_lots()
         url = self.client.api_client.get.call_args[0][0]
-        assert url == f"/userapigateway/trading/{_ACCOUNT}/taxlots/unrealized"
+        assert url == _URL_TAXLOTS
 
     def test_returns_summary_response(self) -> None:
-        from public_api_sdk.models.tax_lots import UnrealizedLotsSummaryResponse
-
-        self.client.api_client.get = Mock(return_value=_taxlots_summary_payload())
+        self.client.api_client.get.return_value = _TAXLOTS_SUMMARY_PAYLOAD
         result = self.client.get_unrealized_tax_lots()
         assert isinstance(result, UnrealizedLotsSummaryResponse)
         assert result.total_profit_loss == Decimal("30.00")
@@ -1183,43 +1311,42 @@ class TestGetUnrealizedTaxLots:
         assert result.lots[0].gain_loss == Decimal("100.00")
 
     def test_uses_explicit_account(self) -> None:
-        self.client.api_client.get = Mock(return_value=_taxlots_summary_payload())
+        self.client.api_client.get.return_value = _TAXLOTS_SUMMARY_PAYLOAD
         self.client.get_unrealized_tax_lots(account_id="OTHER_ACC")
         url = self.client.api_client.get.call_args[0][0]
         assert "/OTHER_ACC/taxlots/unrealized" in url
 
     def test_refreshes_token(self) -> None:
-        self.client.api_client.get = Mock(return_value=_taxlots_summary_payload())
+        self.client.api_client.get.return_value = _TAXLOTS_SUMMARY_PAYLOAD
         self.client.get_unrealized_tax_lots()
         self.client.auth_manager.refresh_token_if_needed.assert_called()
 
 
 class TestGetUnrealizedTaxLotsForSymbol:
-    def setup_method(self) -> None:
-        self.client = _make_client()
+    @pytest.fixture(autouse=True)
+    def _setup(self, client: PublicApiClient) -> None:
+        self.client = client
 
     def test_calls_correct_endpoint(self) -> None:
-        self.client.api_client.get = Mock(return_value=_taxlots_detail_payload())
+        self.client.api_client.get.return_value = _TAXLOTS_DETAIL_PAYLOAD
         self.client.get_unrealized_tax_lots_for_symbol("AAPL")
         url = self.client.api_client.get.call_args[0][0]
-        assert url == f"/userapigateway/trading/{_ACCOUNT}/taxlots/unrealized/AAPL"
+        assert url == f"{_URL_TAXLOTS}/AAPL"
 
     def test_omits_price_param_when_absent(self) -> None:
-        self.client.api_client.get = Mock(return_value=_taxlots_detail_payload())
+        self.client.api_client.get.return_value = _TAXLOTS_DETAIL_PAYLOAD
         self.client.get_unrealized_tax_lots_for_symbol("AAPL")
         params = self.client.api_client.get.call_args[1]["params"]
         assert params is None
 
     def test_passes_price_query_param(self) -> None:
-        self.client.api_client.get = Mock(return_value=_taxlots_detail_payload())
+        self.client.api_client.get.return_value = _TAXLOTS_DETAIL_PAYLOAD
         self.client.get_unrealized_tax_lots_for_symbol("AAPL", price="160.00")
         params = self.client.api_client.get.call_args[1]["params"]
         assert params == {"price": "160.00"}
 
     def test_returns_detail_response(self) -> None:
-        from public_api_sdk.models.tax_lots import UnrealizedLotsDetailResponse
-
-        self.client.api_client.get = Mock(return_value=_taxlots_detail_payload())
+        self.client.api_client.get.return_value = _TAXLOTS_DETAIL_PAYLOAD
         result = self.client.get_unrealized_tax_lots_for_symbol("AAPL")
         assert isinstance(result, UnrealizedLotsDetailResponse)
         assert result.symbol == "AAPL"
@@ -1229,23 +1356,24 @@ class TestGetUnrealizedTaxLotsForSymbol:
 
 
 class TestGetUnrealizedTaxLotsCsv:
-    def setup_method(self) -> None:
-        self.client = _make_client()
+    @pytest.fixture(autouse=True)
+    def _setup(self, client: PublicApiClient) -> None:
+        self.client = client
 
     def test_calls_correct_endpoint(self) -> None:
-        self.client.api_client.get = Mock(
-            return_value={"fileName": "lots.csv", "base64Data": "aGVsbG8="}
-        )
+        self.client.api_client.get.return_value = {
+            "fileName": "lots.csv",
+            "base64Data": "aGVsbG8=",
+        }
         self.client.get_unrealized_tax_lots_csv()
         url = self.client.api_client.get.call_args[0][0]
-        assert url == f"/userapigateway/trading/{_ACCOUNT}/taxlots/csv/unrealized"
+        assert url == _URL_TAXLOTS_CSV
 
     def test_returns_base64_file(self) -> None:
-        from public_api_sdk.models.tax_lots import Base64File
-
-        self.client.api_client.get = Mock(
-            return_value={"fileName": "lots.csv", "base64Data": "aGVsbG8="}
-        )
+        self.client.api_client.get.return_value = {
+            "fileName": "lots.csv",
+            "base64Data": "aGVsbG8=",
+        }
         result = self.client.get_unrealized_tax_lots_csv()
         assert isinstance(result, Base64File)
         assert result.file_name == "lots.csv"
@@ -1257,43 +1385,37 @@ class TestGetUnrealizedTaxLotsCsv:
 # ---------------------------------------------------------------------------
 
 
-def _strategy_quote_payload() -> dict:
-    return {
-        "debitCredit": "DEBIT",
-        "strategyLegs": [
-            {
-                "instrument": {
-                    "symbol": "AAPL260116C00270000",
-                    "baseSymbol": "AAPL",
-                    "type": "CALL",
-                    "strikePrice": "270.00",
-                    "expirationDate": "2026-01-16",
-                },
-                "side": "BUY",
-                "openCloseIndicator": "OPEN",
-                "ratioQuantity": 1,
-                "quote": {
-                    "symbol": "AAPL260116C00270000",
-                    "timestamp": "2026-07-18T12:00:00Z",
-                    "signature": "sig-abc",
-                    "bid": "3.10",
-                    "ask": "3.30",
-                },
-            }
-        ],
-        "price": "3.20",
-        "bid": "3.20",
-        "ask": "3.30",
-        "strategyName": "Long Call",
-    }
-
+_STRATEGY_QUOTE_PAYLOAD = {
+    "debitCredit": "DEBIT",
+    "strategyLegs": [
+        {
+            "instrument": {
+                "symbol": "AAPL260116C00270000",
+                "baseSymbol": "AAPL",
+                "type": "CALL",
+                "strikePrice": "270.00",
+                "expirationDate": "2026-01-16",
+            },
+            "side": "BUY",
+            "openCloseIndicator": "OPEN",
+            "ratioQuantity": 1,
+            "quote": {
+                "symbol": "AAPL260116C00270000",
+                "timestamp": "2026-07-18T12:00:00Z",
+                "signature": "sig-abc",
+                "bid": "3.10",
+                "ask": "3.30",
+            },
+        }
+    ],
+    "price": "3.20",
+    "bid": "3.20",
+    "ask": "3.30",
+    "strategyName": "Long Call",
+}
 
-def _strategy_request() -> "StrategyQuoteRequest":
-    from public_api_sdk.models.strategy_quote import (
-        StrategyOrderLeg,
-        StrategyQuoteRequest,
-    )
 
+def _strategy_request() -> StrategyQuoteRequest:
     return StrategyQuoteRequest(
         base_symbol="AAPL",
         option_legs=[
@@ -1308,20 +1430,20 @@ def _strategy_request() -> "StrategyQuoteRequest":
 
 
 class TestGetStrategyQuote:
-    def setup_method(self) -> None:
-        self.client = _make_client()
+    @pytest.fixture(autouse=True)
+    def _setup(self, client: PublicApiClient) -> None:
+        self.client = client
 
     def test_calls_correct_endpoint(self) -> None:
-        self.client.api_client.post = Mock(return_value=_strategy_quote_payload())
+        self.client.api_client.post.return_value = _STRATEGY_QUOTE_PAYLOAD
         self.client.get_strategy_quote(_strategy_request())
         url = self.client.api_client.post.call_args[0][0]
         assert url == (
-            f"/userapigateway/option-details/{_ACCOUNT}"
-            "/strategy-details/quote"
+            f"/userapigateway/option-details/{_ACCOUNT}" "/strategy-details/quote"
         )
 
     def test_sends_serialized_body(self) -> None:
-        self.client.api_client.post = Mock(return_value=_strategy_quote_payload())
+        self.client.api_client.post.return_value = _STRATEGY_QUOTE_PAYLOAD
         self.client.get_strategy_quote(_strategy_request())
         json_data = self.client.api_client.post.call_args[1]["json_data"]
         assert json_data == {
@@ -1337,12 +1459,7 @@ class TestGetStrategyQuote:
         }
 
     def test_returns_strategy_quote_dto(self) -> None:
-        from public_api_sdk.models.strategy_quote import (
-            DebitCredit,
-            StrategyQuoteDto,
-        )
-
-        self.client.api_client.post = Mock(return_value=_strategy_quote_payload())
+        self.client.api_client.post.return_value = _STRATEGY_QUOTE_PAYLOAD
         result = self.client.get_strategy_quote(_strategy_request())
         assert isinstance(result, StrategyQuoteDto)
         assert result.price == Decimal("3.20")
@@ -1351,13 +1468,13 @@ class TestGetStrategyQuote:
         assert result.strategy_legs[0].quote.bid == Decimal("3.10")
 
     def test_uses_explicit_account(self) -> None:
-        self.client.api_client.post = Mock(return_value=_strategy_quote_payload())
+        self.client.api_client.post.return_value = _STRATEGY_QUOTE_PAYLOAD
         self.client.get_strategy_quote(_strategy_request(), account_id="OTHER_ACC")
         url = self.client.api_client.post.call_args[0][0]
         assert "/OTHER_ACC/strategy-details/quote" in url
 
     def test_refreshes_token(self) -> None:
-        self.client.api_client.post = Mock(return_value=_strategy_quote_payload())
+        self.client.api_client.post.return_value = _STRATEGY_QUOTE_PAYLOAD
         self.client.get_strategy_quote(_strategy_request())
         self.client.auth_manager.refresh_token_if_needed.assert_called()
 
@@ -1368,12 +1485,11 @@ class TestGetStrategyQuote:
 
 
 class TestTaxLotMatchingInstructions:
-    def setup_method(self) -> None:
-        self.client = _make_client()
+    @pytest.fixture(autouse=True)
+    def _setup(self, client: PublicApiClient) -> None:
+        self.client = client
 
     def test_place_order_serializes_instructions(self) -> None:
-        from public_api_sdk.models.order import GatewayTaxLotMatchingInstruction
-
         request = OrderRequest(
             order_id=_VALID_UUID,
             instrument=OrderInstrument(symbol="AAPL", type=InstrumentType.EQUITY),
@@ -1388,7 +1504,7 @@ class TestTaxLotMatchingInstructions:
                 )
             ],
         )
-        self.client.api_client.post = Mock(return_value={"orderId": "ORDER-123"})
+        self.client.api_client.post.return_value = {"orderId": "ORDER-123"}
         self.client.place_order(request)
         json_data = self.client.api_client.post.call_args[1]["json_data"]
         assert json_data["taxLotMatchingInstructions"] == [
@@ -1404,14 +1520,12 @@ class TestTaxLotMatchingInstructions:
             expiration=OrderExpirationRequest(time_in_force=TimeInForce.DAY),
             quantity=Decimal("10"),
         )
-        self.client.api_client.post = Mock(return_value={"orderId": "ORDER-123"})
+        self.client.api_client.post.return_value = {"orderId": "ORDER-123"}
         self.client.place_order(request)
         json_data = self.client.api_client.post.call_args[1]["json_data"]
         assert "taxLotMatchingInstructions" not in json_data
 
     def test_preflight_serializes_instructions(self) -> None:
-        from public_api_sdk.models.order import GatewayTaxLotMatchingInstruction
-
         request = PreflightRequest(
             instrument=OrderInstrument(symbol="AAPL", type=InstrumentType.EQUITY),
             order_side=OrderSide.SELL,
@@ -1425,12 +1539,10 @@ class TestTaxLotMatchingInstructions:
                 )
             ],
         )
-        self.client.api_client.post = Mock(
-            return_value={
-                "instrument": {"symbol": "AAPL", "type": "EQUITY"},
-                "orderValue": "1600.00",
-            }
-        )
+        self.client.api_client.post.return_value = {
+            "instrument": {"symbol": "AAPL", "type": "EQUITY"},
+            "orderValue": "1600.00",
+        }
         self.client.perform_preflight_calculation(request)
         json_data = self.client.api_client.post.call_args[1]["json_data"]
         assert json_data["taxLotMatchingInstructions"] == [
@@ -5,7 +5,21 @@ are correctly deserialized into the SDK's Pydantic models, and that optional
 fields degrade gracefully when absent.
 """
 
+import json
+import re
 from decimal import Decimal
+from types import MappingProxyType
+from typing import ClassVar, Mapping
+
+try:
+    # optional speedup, mirroring the SDK clients: orjson emits the canned
+    # payload bytes below faster than stdlib json
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+import pytest
+from pydantic import TypeAdapter
 
 from public_api_sdk.models.account import (
     Account,
@@ -49,26 +63,230 @@ from public_api_sdk.models.quote import (
     QuoteOutcome,
 )
 
+# ---------------------------------------------------------------------------
+# Canned payloads
+# ---------------------------------------------------------------------------
+#
+# Static payloads are serialized to JSON bytes once at import and validated
+# through ``model_validate_json`` — the same path production responses take —
+# so each test run skips the intermediate Python dict.  One test per model
+# keeps the ``Model(**payload)`` kwargs path covered.
+
+
+def _json(payload: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
+
+_ACCOUNTS_FULL_JSON = _json(
+    {
+        "accounts": [
+            {
+                "accountId": "ACC-001",
+                "accountType": "BROKERAGE",
+                "optionsLevel": "LEVEL_2",
+                "brokerageAccountType": "MARGIN",
+                "tradePermissions": "BUY_AND_SELL",
+            }
+        ]
+    }
+)
+
+_ACCOUNTS_MULTI_JSON = _json(
+    {
+        "accounts": [
+            {"accountId": "ACC-001", "accountType": "BROKERAGE"},
+            {"accountId": "ACC-002", "accountType": "TRADITIONAL_IRA"},
+            {"accountId": "ACC-003", "accountType": "HIGH_YIELD"},
+        ]
+    }
+)
+
+_QUOTE_FULL = {
+    "instrument": {"symbol": "AAPL", "type": "EQUITY"},
+    "outcome": "SUCCESS",
+    "last": "150.50",
+    "bid": "150.45",
+    "bidSize": 100,
+    "ask": "150.55",
+    "askSize": 200,
+    "volume": 5000000,
+}
+
+
+def _to_snake(d: dict) -> dict:
+    """camelCase keys to snake_case, top level only — the nested values the
+    tests use have no camelCase keys of their own."""
+    return {re.sub(r"(?<!^)(?=[A-Z])", "_", k).lower(): v for k, v in d.items()}
+
+
+# derived once at import so the regex does not run per test
+_QUOTE_FULL_SNAKE = _to_snake(_QUOTE_FULL)
+
+_QUOTE_UNKNOWN = {
+    "instrument": {"symbol": "AAPL", "type": "EQUITY"},
+    "outcome": "UNKNOWN",
+}
+_QUOTE_UNKNOWN_JSON = _json(_QUOTE_UNKNOWN)
+
+_QUOTE_OPEN_INTEREST_JSON = _json(
+    {
+        "instrument": {"symbol": "AAPL260116C00270000", "type": "EQUITY"},
+        "outcome": "SUCCESS",
+        "openInterest": 12345,
+    }
+)
+
+_INSTRUMENT_ENABLED = {
+    "instrument": {"symbol": "AAPL", "type": "EQUITY"},
+    "trading": "BUY_AND_SELL",
+    "fractionalTrading": "BUY_AND_SELL",
+    "optionTrading": "BUY_AND_SELL",
+    "optionSpreadTrading": "BUY_AND_SELL",
+}
+_INSTRUMENT_ENABLED_JSON = _json(_INSTRUMENT_ENABLED)
+
+_INSTRUMENT_DISABLED_JSON = _json(
+    {
+        "instrument": {"symbol": "XYZ", "type": "EQUITY"},
+        "trading": "LIQUIDATION_ONLY",
+        "fractionalTrading": "DISABLED",
+        "optionTrading": "DISABLED",
+        "optionSpreadTrading": "DISABLED",
+    }
+)
+
+_HISTORY_TRADE_JSON = _json(
+    {
+        "transactions": [
+            {
+                "id": "txn-001",
+                "timestamp": "2025-01-15T10:30:00Z",
+                "type": "TRADE",
+                "subType": "TRADE",
+                "accountNumber": "ACC-001",
+                "symbol": "AAPL",
+                "securityType": "EQUITY",
+                "side": "BUY",
+                "netAmount": "-1500.00",
+                "principalAmount": "1500.00",
+                "quantity": "10",
+                "fees": "0.00",
+            }
+        ]
+    }
+)
+
+_HISTORY_MONEY_MOVEMENT_JSON = _json(
+    {
+        "transactions": [
+            {
+                "id": "txn-002",
+                "timestamp": "2025-01-10T09:00:00Z",
+                "type": "MONEY_MOVEMENT",
+                "subType": "DEPOSIT",
+                "netAmount": "5000.00",
+                "direction": "INCOMING",
+            }
+        ]
+    }
+)
+
+_MULTI_TXN_PAYLOAD = {
+    "transactions": [
+        {"id": f"txn-{i}", "timestamp": "2025-01-15T10:30:00Z", "type": "TRADE"}
+        for i in range(5)
+    ]
+}
+
+_HISTORY_PAGINATION_JSON = _json(
+    {
+        "transactions": [],
+        "nextToken": "TOKEN_FOR_PAGE_2",
+        "pageSize": 25,
+    }
+)
+
+# base payloads shared by several test classes.  Tests never mutate these:
+# variants replace whole top-level keys through the _*_payload helpers below,
+# which is safe with a shallow merge because nested values are never touched
+# in place.
+_BASE_PORTFOLIO = {
+    "accountId": "ACC-001",
+    "accountType": "BROKERAGE",
+    "buyingPower": {
+        "cashOnlyBuyingPower": "10000.00",
+        "buyingPower": "20000.00",
+        "optionsBuyingPower": "5000.00",
+    },
+    "equity": [],
+    "positions": [],
+    "orders": [],
+}
+
+_BASE_PREFLIGHT = {
+    "instrument": {"symbol": "AAPL", "type": "EQUITY"},
+    "orderValue": "1000.00",
+}
+
+_GREEK_VALUES = {
+    "delta": "0.52",
+    "gamma": "0.015",
+    "theta": "-0.04",
+    "vega": "0.18",
+    "rho": "0.08",
+    "impliedVolatility": "0.30",
+}
+
+
+# expected values that recur across assertions, interned once — each inline
+# Decimal("...") re-runs the string parser and allocates a fresh instance
+_DEC_10000 = Decimal("10000.00")
+_DEC_20000 = Decimal("20000.00")
+_DEC_5000 = Decimal("5000.00")
+_DEC_15000 = Decimal("15000.00")
+_DEC_NEG_1500 = Decimal("-1500.00")
+_DEC_270 = Decimal("270.00")
+_DEC_5_25 = Decimal("5.25")
+_DEC_3_25 = Decimal("3.25")
+_DEC_100 = Decimal("100")
+_DEC_10 = Decimal("10")
+_DELTA_052 = Decimal("0.52")
+_IV_030 = Decimal("0.30")
+
+
+# one reusable validator per response model: TypeAdapter.validate_* skips
+# the BaseModel.__init__ dispatch and calls the core validator directly
+_ACCOUNTS_TA = TypeAdapter(AccountsResponse)
+_PORTFOLIO_TA = TypeAdapter(Portfolio)
+_QUOTE_TA = TypeAdapter(Quote)
+_INSTRUMENT_TA = TypeAdapter(Instrument)
+_HISTORY_TA = TypeAdapter(HistoryResponsePage)
+_GREEKS_TA = TypeAdapter(GreeksResponse)
+
+
+def _portfolio_payload(**overrides: object) -> dict:
+    return {**_BASE_PORTFOLIO, **overrides}
+
+
+def _instrument_payload(**overrides: object) -> dict:
+    return {**_INSTRUMENT_ENABLED, **overrides}
+
+
+def _preflight_payload(**overrides: object) -> dict:
+    return {**_BASE_PREFLIGHT, **overrides}
+
 
 # ---------------------------------------------------------------------------
 # AccountsResponse
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.xdist_group(name="accounts")
 class TestAccountsResponseDeserialization:
     def test_full_account(self) -> None:
-        payload = {
-            "accounts": [
-                {
-                    "accountId": "ACC-001",
-                    "accountType": "BROKERAGE",
-                    "optionsLevel": "LEVEL_2",
-                    "brokerageAccountType": "MARGIN",
-                    "tradePermissions": "BUY_AND_SELL",
-                }
-            ]
-        }
-        response = AccountsResponse(**payload)
+        response = _ACCOUNTS_TA.validate_json(_ACCOUNTS_FULL_JSON)
         account = response.accounts[0]
         assert account.account_id == "ACC-001"
         assert account.account_type == AccountType.BROKERAGE
@@ -76,45 +294,35 @@ class TestAccountsResponseDeserialization:
         assert account.brokerage_account_type == BrokerageAccountType.MARGIN
         assert account.trade_permissions == TradePermissions.BUY_AND_SELL
 
-    def test_optional_fields_missing(self) -> None:
-        payload = {"accounts": [{"accountId": "ACC-002", "accountType": "ROTH_IRA"}]}
-        response = AccountsResponse(**payload)
-        account = response.accounts[0]
-        assert account.account_id == "ACC-002"
-        assert account.account_type == AccountType.ROTH_IRA
-        assert account.options_level is None
-        assert account.brokerage_account_type is None
-        assert account.trade_permissions is None
-
     def test_multiple_accounts(self) -> None:
-        payload = {
-            "accounts": [
-                {"accountId": "ACC-001", "accountType": "BROKERAGE"},
-                {"accountId": "ACC-002", "accountType": "TRADITIONAL_IRA"},
-                {"accountId": "ACC-003", "accountType": "HIGH_YIELD"},
-            ]
-        }
-        response = AccountsResponse(**payload)
+        response = _ACCOUNTS_TA.validate_json(_ACCOUNTS_MULTI_JSON)
         assert len(response.accounts) == 3
         assert response.accounts[1].account_type == AccountType.TRADITIONAL_IRA
 
     def test_empty_accounts_list(self) -> None:
-        response = AccountsResponse(**{"accounts": []})
+        response = AccountsResponse(accounts=[])
         assert response.accounts == []
 
-    def test_all_account_types(self) -> None:
-        types = [
-            "BROKERAGE",
-            "HIGH_YIELD",
-            "BOND_ACCOUNT",
-            "RIA_ASSET",
-            "TREASURY",
-            "TRADITIONAL_IRA",
-            "ROTH_IRA",
-        ]
-        for account_type in types:
-            account = Account(accountId="ACC", accountType=account_type)
-            assert account.account_type == AccountType(account_type)
+    @pytest.mark.parametrize(
+        ("account_type", "expected"),
+        [
+            # expected members resolved once at collection via the member map,
+            # which skips EnumMeta.__call__'s value-coercion path
+            pytest.param(name, AccountType.__members__[name], id=name)
+            for name in [
+                "BROKERAGE",
+                "HIGH_YIELD",
+                "BOND_ACCOUNT",
+                "RIA_ASSET",
+                "TREASURY",
+                "TRADITIONAL_IRA",
+                "ROTH_IRA",
+            ]
+        ],
+    )
+    def test_all_account_types(self, account_type: str, expected: AccountType) -> None:
+        account = Account(accountId="ACC", accountType=account_type)
+        assert account.account_type is expected
 
 
 # ---------------------------------------------------------------------------
@@ -122,78 +330,59 @@ class TestAccountsResponseDeserialization:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.xdist_group(name="portfolio")
 class TestPortfolioDeserialization:
-    def _base_payload(self, account_id: str = "ACC-001") -> dict:
-        return {
-            "accountId": account_id,
-            "accountType": "BROKERAGE",
-            "buyingPower": {
-                "cashOnlyBuyingPower": "10000.00",
-                "buyingPower": "20000.00",
-                "optionsBuyingPower": "5000.00",
-            },
-            "equity": [],
-            "positions": [],
-            "orders": [],
-        }
-
     def test_minimal_portfolio(self) -> None:
-        portfolio = Portfolio(**self._base_payload())
+        portfolio = Portfolio(**_BASE_PORTFOLIO)
         assert portfolio.account_id == "ACC-001"
-        assert isinstance(portfolio.buying_power, BuyingPower)
-        assert portfolio.buying_power.buying_power == Decimal("20000.00")
-        assert portfolio.buying_power.cash_only_buying_power == Decimal("10000.00")
-        assert portfolio.buying_power.options_buying_power == Decimal("5000.00")
+        assert type(portfolio.buying_power) is BuyingPower
+        assert portfolio.buying_power.buying_power == _DEC_20000
+        assert portfolio.buying_power.cash_only_buying_power == _DEC_10000
+        assert portfolio.buying_power.options_buying_power == _DEC_5000
 
     def test_portfolio_with_position(self) -> None:
-        payload = self._base_payload()
-        payload["positions"] = [
-            {
-                "instrument": {
-                    "symbol": "AAPL",
-                    "name": "Apple Inc.",
-                    "type": "EQUITY",
-                },
-                "quantity": "100",
-                "currentValue": "15000.00",
-                "percentOfPortfolio": "0.25",
-            }
-        ]
-        portfolio = Portfolio(**payload)
+        payload = _portfolio_payload(
+            positions=[
+                {
+                    "instrument": {
+                        "symbol": "AAPL",
+                        "name": "Apple Inc.",
+                        "type": "EQUITY",
+                    },
+                    "quantity": "100",
+                    "currentValue": "15000.00",
+                    "percentOfPortfolio": "0.25",
+                }
+            ]
+        )
+        portfolio = _PORTFOLIO_TA.validate_python(payload)
         assert len(portfolio.positions) == 1
         position = portfolio.positions[0]
-        assert isinstance(position, PortfolioPosition)
-        assert position.instrument.symbol == "AAPL"
-        assert position.quantity == Decimal("100")
-        assert position.current_value == Decimal("15000.00")
-
-    def test_portfolio_position_optional_fields(self) -> None:
-        payload = self._base_payload()
-        payload["positions"] = [
-            {
-                "instrument": {"symbol": "MSFT", "name": "Microsoft", "type": "EQUITY"},
-                "quantity": "50",
-            }
-        ]
-        portfolio = Portfolio(**payload)
-        position = portfolio.positions[0]
-        assert position.current_value is None
-        assert position.last_price is None
-        assert position.cost_basis is None
+        assert type(position) is PortfolioPosition
+        assert (
+            position.instrument.symbol,
+            position.quantity,
+            position.current_value,
+        ) == (
+            "AAPL",
+            _DEC_100,
+            _DEC_15000,
+        )
 
     def test_portfolio_with_open_orders(self) -> None:
-        payload = self._base_payload()
-        payload["orders"] = [
-            {
-                "orderId": "ORDER-1",
-                "instrument": {"symbol": "AAPL", "type": "EQUITY"},
-                "type": "LIMIT",
-                "side": "BUY",
-                "status": "NEW",
-                "quantity": "10",
-            }
-        ]
-        portfolio = Portfolio(**payload)
+        payload = _portfolio_payload(
+            orders=[
+                {
+                    "orderId": "ORDER-1",
+                    "instrument": {"symbol": "AAPL", "type": "EQUITY"},
+                    "type": "LIMIT",
+                    "side": "BUY",
+                    "status": "NEW",
+                    "quantity": "10",
+                }
+            ]
+        )
+        portfolio = _PORTFOLIO_TA.validate_python(payload)
         assert len(portfolio.orders) == 1
         assert portfolio.orders[0].order_id == "ORDER-1"
 
@@ -203,70 +392,44 @@ class TestPortfolioDeserialization:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.xdist_group(name="quote")
 class TestQuoteDeserialization:
-    def test_full_quote_camelcase(self) -> None:
-        """camelCase keys as returned by the API are accepted."""
-        payload = {
-            "instrument": {"symbol": "AAPL", "type": "EQUITY"},
-            "outcome": "SUCCESS",
-            "last": "150.50",
-            "bid": "150.45",
-            "bidSize": 100,
-            "ask": "150.55",
-            "askSize": 200,
-            "volume": 5000000,
-        }
-        quote = Quote(**payload)
-        assert quote.outcome == QuoteOutcome.SUCCESS
-        assert quote.last == Decimal("150.50")
-        assert quote.bid == Decimal("150.45")
-        assert quote.bid_size == 100
-        assert quote.ask == Decimal("150.55")
-        assert quote.ask_size == 200
-        assert quote.volume == 5000000
-
-    def test_snake_case_also_accepted(self) -> None:
-        """snake_case keys also work because populate_by_name=True."""
-        payload = {
-            "instrument": {"symbol": "AAPL", "type": "EQUITY"},
-            "outcome": "SUCCESS",
-            "bid_size": 50,
-            "ask_size": 75,
-        }
-        quote = Quote(**payload)
-        assert quote.bid_size == 50
-        assert quote.ask_size == 75
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            pytest.param(_QUOTE_FULL, id="camel"),
+            pytest.param(_QUOTE_FULL_SNAKE, id="snake"),
+        ],
+    )
+    def test_full_quote(self, payload: dict) -> None:
+        """camelCase API keys and their snake_case names (populate_by_name=True)
+        deserialize identically."""
+        quote = _QUOTE_TA.validate_python(payload)
+        assert (
+            quote.outcome,
+            quote.last,
+            quote.bid,
+            quote.bid_size,
+            quote.ask,
+            quote.ask_size,
+            quote.volume,
+        ) == (
+            QuoteOutcome.SUCCESS,
+            Decimal("150.50"),
+            Decimal("150.45"),
+            100,
+            Decimal("150.55"),
+            200,
+            5000000,
+        )
 
     def test_unknown_outcome(self) -> None:
-        payload = {
-            "instrument": {"symbol": "AAPL", "type": "EQUITY"},
-            "outcome": "UNKNOWN",
-        }
-        quote = Quote(**payload)
+        quote = _QUOTE_TA.validate_json(_QUOTE_UNKNOWN_JSON)
         assert quote.outcome == QuoteOutcome.UNKNOWN
         assert quote.last is None
 
-    def test_all_optional_fields_absent(self) -> None:
-        payload = {
-            "instrument": {"symbol": "AAPL", "type": "EQUITY"},
-            "outcome": "UNKNOWN",
-        }
-        quote = Quote(**payload)
-        assert quote.last is None
-        assert quote.bid is None
-        assert quote.ask is None
-        assert quote.bid_size is None
-        assert quote.ask_size is None
-        assert quote.volume is None
-        assert quote.open_interest is None
-
     def test_open_interest_camelcase(self) -> None:
-        payload = {
-            "instrument": {"symbol": "AAPL260116C00270000", "type": "EQUITY"},
-            "outcome": "SUCCESS",
-            "openInterest": 12345,
-        }
-        quote = Quote(**payload)
+        quote = _QUOTE_TA.validate_json(_QUOTE_OPEN_INTEREST_JSON)
         assert quote.open_interest == 12345
 
 
@@ -275,16 +438,10 @@ class TestQuoteDeserialization:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.xdist_group(name="instrument")
 class TestInstrumentDeserialization:
     def test_equity_instrument_fully_enabled(self) -> None:
-        payload = {
-            "instrument": {"symbol": "AAPL", "type": "EQUITY"},
-            "trading": "BUY_AND_SELL",
-            "fractionalTrading": "BUY_AND_SELL",
-            "optionTrading": "BUY_AND_SELL",
-            "optionSpreadTrading": "BUY_AND_SELL",
-        }
-        instrument = Instrument(**payload)
+        instrument = _INSTRUMENT_TA.validate_json(_INSTRUMENT_ENABLED_JSON)
         assert instrument.instrument.symbol == "AAPL"
         assert instrument.instrument.type == InstrumentType.EQUITY
         assert instrument.trading == Trading.BUY_AND_SELL
@@ -293,30 +450,14 @@ class TestInstrumentDeserialization:
         assert instrument.option_spread_trading == Trading.BUY_AND_SELL
 
     def test_instrument_with_disabled_trading(self) -> None:
-        payload = {
-            "instrument": {"symbol": "XYZ", "type": "EQUITY"},
-            "trading": "LIQUIDATION_ONLY",
-            "fractionalTrading": "DISABLED",
-            "optionTrading": "DISABLED",
-            "optionSpreadTrading": "DISABLED",
-        }
-        instrument = Instrument(**payload)
+        instrument = _INSTRUMENT_TA.validate_json(_INSTRUMENT_DISABLED_JSON)
         assert instrument.trading == Trading.LIQUIDATION_ONLY
         assert instrument.option_trading == Trading.DISABLED
 
-    def test_instrument_details_optional(self) -> None:
-        payload = {
-            "instrument": {"symbol": "AAPL", "type": "EQUITY"},
-            "trading": "BUY_AND_SELL",
-            "fractionalTrading": "BUY_AND_SELL",
-            "optionTrading": "BUY_AND_SELL",
-            "optionSpreadTrading": "BUY_AND_SELL",
-        }
-        instrument = Instrument(**payload)
-        assert instrument.instrument_details is None
-
-    def test_instruments_response_list(self) -> None:
-        payload = {
+    # frozen at class scope: built once even under repeat runs, and the proxy
+    # makes accidental mutation raise instead of leaking between tests
+    _INSTRUMENTS_PAYLOAD: ClassVar[Mapping[str, object]] = MappingProxyType(
+        {
             "instruments": [
                 {
                     "instrument": {"symbol": "AAPL", "type": "EQUITY"},
@@ -334,10 +475,15 @@ class TestInstrumentDeserialization:
                 },
             ]
         }
-        response = InstrumentsResponse(**payload)
-        assert len(response.instruments) == 2
-        assert response.instruments[0].instrument.symbol == "AAPL"
-        assert response.instruments[1].instrument.symbol == "BTC"
+    )
+
+    def test_instruments_response_list(self) -> None:
+        response = InstrumentsResponse(**self._INSTRUMENTS_PAYLOAD)
+        assert (
+            len(response.instruments),
+            response.instruments[0].instrument.symbol,
+            response.instruments[1].instrument.symbol,
+        ) == (2, "AAPL", "BTC")
 
 
 # ---------------------------------------------------------------------------
@@ -345,6 +491,7 @@ class TestInstrumentDeserialization:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.xdist_group(name="history")
 class TestHistoryDeserialization:
     def test_empty_page(self) -> None:
         payload = {"transactions": []}
@@ -354,146 +501,148 @@ class TestHistoryDeserialization:
         assert page.page_size is None
 
     def test_trade_transaction(self) -> None:
-        payload = {
-            "transactions": [
-                {
-                    "id": "txn-001",
-                    "timestamp": "2025-01-15T10:30:00Z",
-                    "type": "TRADE",
-                    "subType": "TRADE",
-                    "accountNumber": "ACC-001",
-                    "symbol": "AAPL",
-                    "securityType": "EQUITY",
-                    "side": "BUY",
-                    "netAmount": "-1500.00",
-                    "principalAmount": "1500.00",
-                    "quantity": "10",
-                    "fees": "0.00",
-                }
-            ]
-        }
-        page = HistoryResponsePage(**payload)
+        page = _HISTORY_TA.validate_json(_HISTORY_TRADE_JSON)
         txn = page.transactions[0]
-        assert isinstance(txn, HistoryTransaction)
-        assert txn.id == "txn-001"
-        assert txn.type == TransactionType.TRADE
-        assert txn.symbol == "AAPL"
-        assert txn.net_amount == Decimal("-1500.00")
-        assert txn.quantity == Decimal("10")
+        assert type(txn) is HistoryTransaction
+        assert (txn.id, txn.type, txn.symbol, txn.net_amount, txn.quantity) == (
+            "txn-001",
+            TransactionType.TRADE,
+            "AAPL",
+            _DEC_NEG_1500,
+            _DEC_10,
+        )
 
     def test_money_movement_transaction(self) -> None:
-        payload = {
-            "transactions": [
-                {
-                    "id": "txn-002",
-                    "timestamp": "2025-01-10T09:00:00Z",
-                    "type": "MONEY_MOVEMENT",
-                    "subType": "DEPOSIT",
-                    "netAmount": "5000.00",
-                    "direction": "INCOMING",
-                }
-            ]
-        }
-        page = HistoryResponsePage(**payload)
+        page = _HISTORY_TA.validate_json(_HISTORY_MONEY_MOVEMENT_JSON)
         txn = page.transactions[0]
         assert txn.type == TransactionType.MONEY_MOVEMENT
-        assert txn.net_amount == Decimal("5000.00")
-
-    def test_transaction_optional_fields_absent(self) -> None:
-        payload = {
-            "transactions": [
-                {
-                    "id": "txn-003",
-                    "timestamp": "2025-01-12T12:00:00Z",
-                    "type": "POSITION_ADJUSTMENT",
-                }
-            ]
-        }
-        page = HistoryResponsePage(**payload)
-        txn = page.transactions[0]
-        assert txn.symbol is None
-        assert txn.net_amount is None
-        assert txn.side is None
+        assert txn.net_amount == _DEC_5000
 
     def test_pagination_fields(self) -> None:
-        payload = {
-            "transactions": [],
-            "nextToken": "TOKEN_FOR_PAGE_2",
-            "pageSize": 25,
-        }
-        page = HistoryResponsePage(**payload)
+        page = _HISTORY_TA.validate_json(_HISTORY_PAGINATION_JSON)
         assert page.next_token == "TOKEN_FOR_PAGE_2"
         assert page.page_size == 25
 
     def test_multiple_transactions(self) -> None:
-        payload = {
-            "transactions": [
-                {
-                    "id": f"txn-{i}",
-                    "timestamp": "2025-01-15T10:30:00Z",
-                    "type": "TRADE",
-                }
-                for i in range(5)
-            ]
-        }
-        page = HistoryResponsePage(**payload)
+        page = _HISTORY_TA.validate_python(_MULTI_TXN_PAYLOAD)
         assert len(page.transactions) == 5
         assert page.transactions[4].id == "txn-4"
 
 
+# ---------------------------------------------------------------------------
+# Optional fields — absent camelCase keys parse to None across models
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.xdist_group(name="optional-fields")
+class TestOptionalFieldsAbsent:
+    @pytest.mark.parametrize(
+        ("model_cls", "payload", "list_field", "none_attrs"),
+        [
+            pytest.param(
+                AccountsResponse,
+                {"accounts": [{"accountId": "ACC-002", "accountType": "ROTH_IRA"}]},
+                "accounts",
+                ("options_level", "brokerage_account_type", "trade_permissions"),
+                id="account",
+            ),
+            pytest.param(
+                Portfolio,
+                _portfolio_payload(
+                    positions=[
+                        {
+                            "instrument": {
+                                "symbol": "MSFT",
+                                "name": "Microsoft",
+                                "type": "EQUITY",
+                            },
+                            "quantity": "50",
+                        }
+                    ]
+                ),
+                "positions",
+                ("current_value", "last_price", "cost_basis"),
+                id="portfolio-position",
+            ),
+            pytest.param(
+                Quote,
+                _QUOTE_UNKNOWN,
+                None,
+                (
+                    "last",
+                    "bid",
+                    "ask",
+                    "bid_size",
+                    "ask_size",
+                    "volume",
+                    "open_interest",
+                ),
+                id="quote",
+            ),
+            pytest.param(
+                Instrument,
+                _INSTRUMENT_ENABLED,
+                None,
+                ("instrument_details",),
+                id="instrument",
+            ),
+            pytest.param(
+                HistoryResponsePage,
+                {
+                    "transactions": [
+                        {
+                            "id": "txn-003",
+                            "timestamp": "2025-01-12T12:00:00Z",
+                            "type": "POSITION_ADJUSTMENT",
+                        }
+                    ]
+                },
+                "transactions",
+                ("symbol", "net_amount", "side"),
+                id="transaction",
+            ),
+        ],
+    )
+    def test_absent_keys_parse_to_none(
+        self, model_cls: type, payload: dict, list_field: str, none_attrs: tuple
+    ) -> None:
+        instance = model_cls(**payload)
+        obj = getattr(instance, list_field)[0] if list_field else instance
+        for attr in none_attrs:
+            assert getattr(obj, attr) is None
+
+
 # ---------------------------------------------------------------------------
 # GreeksResponse
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.xdist_group(name="greeks")
 class TestGreeksResponseDeserialization:
-    def _greek_values(self) -> dict:
-        return {
-            "delta": "0.52",
-            "gamma": "0.015",
-            "theta": "-0.04",
-            "vega": "0.18",
-            "rho": "0.08",
-            "impliedVolatility": "0.30",
-        }
-
-    def test_single_greek(self) -> None:
-        payload = {
-            "greeks": [
-                {"symbol": "AAPL260116C00270000", "greeks": self._greek_values()}
-            ]
-        }
-        response = GreeksResponse(**payload)
-        assert len(response.greeks) == 1
+    @pytest.mark.parametrize("n", [1, 2])
+    def test_greeks_count(self, n: int) -> None:
+        symbols = ["AAPL260116C00270000", "AAPL260116P00270000"][:n]
+        payload = {"greeks": [{"symbol": s, "greeks": _GREEK_VALUES} for s in symbols]}
+        response = _GREEKS_TA.validate_python(payload)
+        assert len(response.greeks) == n
         greek = response.greeks[0]
-        assert isinstance(greek, OptionGreeks)
+        assert type(greek) is OptionGreeks
         assert greek.symbol == "AAPL260116C00270000"
-        assert isinstance(greek.greeks, GreekValues)
-        assert greek.greeks.delta == Decimal("0.52")
-        assert greek.greeks.implied_volatility == Decimal("0.30")
-
-    def test_multiple_greeks(self) -> None:
-        payload = {
-            "greeks": [
-                {"symbol": "AAPL260116C00270000", "greeks": self._greek_values()},
-                {"symbol": "AAPL260116P00270000", "greeks": self._greek_values()},
-            ]
-        }
-        response = GreeksResponse(**payload)
-        assert len(response.greeks) == 2
+        assert type(greek.greeks) is GreekValues
+        assert greek.greeks.delta == _DELTA_052
+        assert greek.greeks.implied_volatility == _IV_030
 
     def test_implied_volatility_camelcase_alias(self) -> None:
-        values = self._greek_values()
-        greek_values = GreekValues(**values)
-        assert greek_values.implied_volatility == Decimal("0.30")
+        greek_values = GreekValues(**_GREEK_VALUES)
+        assert greek_values.implied_volatility == _IV_030
 
     def test_empty_greeks_list(self) -> None:
-        response = GreeksResponse(**{"greeks": []})
+        response = GreeksResponse(greeks=[])
         assert response.greeks == []
 
     def test_greeks_omitted_entirely(self) -> None:
         """Spec: GreeksResponse.greeks is optional. Missing → empty list."""
-        response = GreeksResponse(**{})
+        response = GreeksResponse()
         assert response.greeks == []
 
     def test_greek_response_without_greeks(self) -> None:
@@ -507,14 +656,14 @@ class TestGreeksResponseDeserialization:
         """Spec: all individual greek fields are optional."""
         partial = {"delta": "0.52"}
         values = GreekValues(**partial)
-        assert values.delta == Decimal("0.52")
+        assert values.delta == _DELTA_052
         assert values.gamma is None
         assert values.theta is None
         assert values.implied_volatility is None
 
     def test_empty_greek_values(self) -> None:
         """All greek fields absent parses to an all-None instance."""
-        values = GreekValues(**{})
+        values = GreekValues()
         assert values.delta is None
         assert values.gamma is None
         assert values.theta is None
@@ -528,6 +677,7 @@ class TestGreeksResponseDeserialization:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.xdist_group(name="quote")
 class TestQuoteNewFieldsDeserialization:
     def test_previous_close(self) -> None:
         payload = {
@@ -535,7 +685,7 @@ class TestQuoteNewFieldsDeserialization:
             "outcome": "SUCCESS",
             "previousClose": "149.00",
         }
-        quote = Quote(**payload)
+        quote = _QUOTE_TA.validate_python(payload)
         assert quote.previous_close == Decimal("149.00")
 
     def test_one_day_change(self) -> None:
@@ -544,7 +694,7 @@ class TestQuoteNewFieldsDeserialization:
             "outcome": "SUCCESS",
             "oneDayChange": {"change": "1.50", "percentChange": "1.01"},
         }
-        quote = Quote(**payload)
+        quote = _QUOTE_TA.validate_python(payload)
         assert isinstance(quote.one_day_change, OneDayChange)
         assert quote.one_day_change.change == Decimal("1.50")
         assert quote.one_day_change.percent_change == Decimal("1.01")
@@ -555,7 +705,7 @@ class TestQuoteNewFieldsDeserialization:
             "outcome": "SUCCESS",
             "oneDayChange": {"change": "0.25"},
         }
-        quote = Quote(**payload)
+        quote = _QUOTE_TA.validate_python(payload)
         assert quote.one_day_change is not None
         assert quote.one_day_change.change == Decimal("0.25")
         assert quote.one_day_change.percent_change is None
@@ -577,13 +727,13 @@ class TestQuoteNewFieldsDeserialization:
                 },
             },
         }
-        quote = Quote(**payload)
+        quote = _QUOTE_TA.validate_python(payload)
         assert isinstance(quote.option_details, QuoteOptionDetails)
-        assert quote.option_details.strike_price == Decimal("270.00")
-        assert quote.option_details.mid_price == Decimal("3.25")
+        assert quote.option_details.strike_price == _DEC_270
+        assert quote.option_details.mid_price == _DEC_3_25
         assert quote.option_details.greeks is not None
-        assert quote.option_details.greeks.delta == Decimal("0.52")
-        assert quote.option_details.greeks.implied_volatility == Decimal("0.30")
+        assert quote.option_details.greeks.delta == _DELTA_052
+        assert quote.option_details.greeks.implied_volatility == _IV_030
 
     def test_option_details_without_greeks(self) -> None:
         """Spec: OptionDetails.greeks is optional."""
@@ -592,9 +742,9 @@ class TestQuoteNewFieldsDeserialization:
             "outcome": "SUCCESS",
             "optionDetails": {"strikePrice": "270.00"},
         }
-        quote = Quote(**payload)
+        quote = _QUOTE_TA.validate_python(payload)
         assert quote.option_details is not None
-        assert quote.option_details.strike_price == Decimal("270.00")
+        assert quote.option_details.strike_price == _DEC_270
         assert quote.option_details.greeks is None
         assert quote.option_details.mid_price is None
 
@@ -605,7 +755,7 @@ class TestQuoteNewFieldsDeserialization:
             "outcome": "SUCCESS",
             "optionDetails": {"strikePrice": "270.00", "midPrice": None},
         }
-        quote = Quote(**payload)
+        quote = _QUOTE_TA.validate_python(payload)
         assert quote.option_details is not None
         assert quote.option_details.mid_price is None
 
@@ -614,7 +764,7 @@ class TestQuoteNewFieldsDeserialization:
             "instrument": {"symbol": "AAPL", "type": "EQUITY"},
             "outcome": "SUCCESS",
         }
-        quote = Quote(**payload)
+        quote = _QUOTE_TA.validate_python(payload)
         assert quote.previous_close is None
         assert quote.one_day_change is None
         assert quote.option_details is None
@@ -625,86 +775,75 @@ class TestQuoteNewFieldsDeserialization:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.xdist_group(name="instrument")
 class TestInstrumentNewFieldsDeserialization:
-    def _base_payload(self) -> dict:
-        return {
-            "instrument": {"symbol": "AAPL", "type": "EQUITY"},
-            "trading": "BUY_AND_SELL",
-            "fractionalTrading": "BUY_AND_SELL",
-            "optionTrading": "BUY_AND_SELL",
-            "optionSpreadTrading": "BUY_AND_SELL",
-        }
-
     def test_crypto_instrument_details(self) -> None:
-        payload = self._base_payload()
-        payload["instrument"] = {"symbol": "BTC", "type": "CRYPTO"}
-        payload["instrumentDetails"] = {
-            "payloadType": "Crypto",
-            "cryptoQuantityPrecision": 8,
-            "cryptoPricePrecision": 2,
-            "tradableInNewYork": True,
-        }
-        instrument = Instrument(**payload)
+        payload = _instrument_payload(
+            instrument={"symbol": "BTC", "type": "CRYPTO"},
+            instrumentDetails={
+                "payloadType": "Crypto",
+                "cryptoQuantityPrecision": 8,
+                "cryptoPricePrecision": 2,
+                "tradableInNewYork": True,
+            },
+        )
+        instrument = _INSTRUMENT_TA.validate_python(payload)
         assert isinstance(instrument.instrument_details, CryptoInstrumentDetails)
         assert instrument.instrument_details.crypto_quantity_precision == 8
         assert instrument.instrument_details.crypto_price_precision == 2
         assert instrument.instrument_details.tradable_in_new_york is True
 
     def test_bond_instrument_details(self) -> None:
-        payload = self._base_payload()
-        payload["instrument"] = {"symbol": "US912828XYZ", "type": "BOND"}
-        payload["instrumentDetails"] = {
-            "payloadType": "Bond",
-            "hasOutstanding": True,
-        }
-        instrument = Instrument(**payload)
+        payload = _instrument_payload(
+            instrument={"symbol": "US912828XYZ", "type": "BOND"},
+            instrumentDetails={"payloadType": "Bond", "hasOutstanding": True},
+        )
+        instrument = _INSTRUMENT_TA.validate_python(payload)
         assert isinstance(instrument.instrument_details, BondInstrumentDetails)
         assert instrument.instrument_details.has_outstanding is True
 
     def test_bond_instrument_details_minimal(self) -> None:
         """Bond payload with only payloadType should still parse."""
-        payload = self._base_payload()
-        payload["instrumentDetails"] = {"payloadType": "Bond"}
-        instrument = Instrument(**payload)
+        payload = _instrument_payload(instrumentDetails={"payloadType": "Bond"})
+        instrument = _INSTRUMENT_TA.validate_python(payload)
         assert isinstance(instrument.instrument_details, BondInstrumentDetails)
         assert instrument.instrument_details.has_outstanding is None
 
     def test_crypto_details_all_fields_optional(self) -> None:
         """Crypto variant should parse even if only payloadType is present."""
-        payload = self._base_payload()
-        payload["instrumentDetails"] = {"payloadType": "Crypto"}
-        instrument = Instrument(**payload)
+        payload = _instrument_payload(instrumentDetails={"payloadType": "Crypto"})
+        instrument = _INSTRUMENT_TA.validate_python(payload)
         assert instrument.instrument_details is not None
         assert isinstance(instrument.instrument_details, CryptoInstrumentDetails)
         assert instrument.instrument_details.crypto_quantity_precision is None
 
     def test_shorting_availability(self) -> None:
-        payload = self._base_payload()
-        payload["shortingAvailability"] = "HARD_TO_BORROW"
-        payload["hardToBorrowPercentageRate"] = "5.25"
-        instrument = Instrument(**payload)
+        payload = _instrument_payload(
+            shortingAvailability="HARD_TO_BORROW",
+            hardToBorrowPercentageRate="5.25",
+        )
+        instrument = _INSTRUMENT_TA.validate_python(payload)
         assert instrument.shorting_availability == ShortingAvailability.HARD_TO_BORROW
-        assert instrument.hard_to_borrow_percentage_rate == Decimal("5.25")
+        assert instrument.hard_to_borrow_percentage_rate == _DEC_5_25
 
     def test_shorting_easy_to_borrow(self) -> None:
-        payload = self._base_payload()
-        payload["shortingAvailability"] = "EASY_TO_BORROW"
-        instrument = Instrument(**payload)
+        payload = _instrument_payload(shortingAvailability="EASY_TO_BORROW")
+        instrument = _INSTRUMENT_TA.validate_python(payload)
         assert instrument.shorting_availability == ShortingAvailability.EASY_TO_BORROW
 
     def test_shorting_not_shortable(self) -> None:
-        payload = self._base_payload()
-        payload["shortingAvailability"] = "NOT_SHORTABLE"
-        instrument = Instrument(**payload)
+        payload = _instrument_payload(shortingAvailability="NOT_SHORTABLE")
+        instrument = _INSTRUMENT_TA.validate_python(payload)
         assert instrument.shorting_availability == ShortingAvailability.NOT_SHORTABLE
 
     def test_option_contract_price_increments(self) -> None:
-        payload = self._base_payload()
-        payload["optionContractPriceIncrements"] = {
-            "incrementBelow3": "0.05",
-            "incrementAbove3": "0.10",
-        }
-        instrument = Instrument(**payload)
+        payload = _instrument_payload(
+            optionContractPriceIncrements={
+                "incrementBelow3": "0.05",
+                "incrementAbove3": "0.10",
+            }
+        )
+        instrument = _INSTRUMENT_TA.validate_python(payload)
         assert isinstance(
             instrument.option_contract_price_increments, OptionPriceIncrement
         )
@@ -717,7 +856,7 @@ class TestInstrumentNewFieldsDeserialization:
 
     def test_all_new_fields_absent(self) -> None:
         """New fields are all optional — should parse without them."""
-        instrument = Instrument(**self._base_payload())
+        instrument = _INSTRUMENT_TA.validate_python(_INSTRUMENT_ENABLED)
         assert instrument.instrument_details is None
         assert instrument.shorting_availability is None
         assert instrument.hard_to_borrow_percentage_rate is None
@@ -766,74 +905,68 @@ class TestInstrumentNewFieldsDeserialization:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.xdist_group(name="portfolio")
 class TestPortfolioStrategiesDeserialization:
-    def _base_payload(self) -> dict:
-        return {
-            "accountId": "ACC-001",
-            "accountType": "BROKERAGE",
-            "buyingPower": {
-                "cashOnlyBuyingPower": "10000.00",
-                "buyingPower": "20000.00",
-                "optionsBuyingPower": "5000.00",
-            },
-            "equity": [],
-            "positions": [],
-            "orders": [],
-        }
-
     def test_position_with_strategy_ids(self) -> None:
-        payload = self._base_payload()
-        payload["positions"] = [
-            {
-                "instrument": {
-                    "symbol": "AAPL260116C00270000",
-                    "name": "AAPL Jan 2026 $270 Call",
-                    "type": "OPTION",
-                },
-                "quantity": "1",
-                "strategyIds": ["strategy-uuid-1", "strategy-uuid-2"],
-            }
-        ]
-        portfolio = Portfolio(**payload)
+        payload = _portfolio_payload(
+            positions=[
+                {
+                    "instrument": {
+                        "symbol": "AAPL260116C00270000",
+                        "name": "AAPL Jan 2026 $270 Call",
+                        "type": "OPTION",
+                    },
+                    "quantity": "1",
+                    "strategyIds": ["strategy-uuid-1", "strategy-uuid-2"],
+                }
+            ]
+        )
+        portfolio = _PORTFOLIO_TA.validate_python(payload)
         position = portfolio.positions[0]
         assert position.strategy_ids == ["strategy-uuid-1", "strategy-uuid-2"]
 
     def test_position_without_strategy_ids_defaults_empty(self) -> None:
         """strategyIds is required per spec, but SDK tolerates omission with [] default."""
-        payload = self._base_payload()
-        payload["positions"] = [
-            {
-                "instrument": {"symbol": "AAPL", "name": "Apple Inc.", "type": "EQUITY"},
-                "quantity": "100",
-            }
-        ]
-        portfolio = Portfolio(**payload)
+        payload = _portfolio_payload(
+            positions=[
+                {
+                    "instrument": {
+                        "symbol": "AAPL",
+                        "name": "Apple Inc.",
+                        "type": "EQUITY",
+                    },
+                    "quantity": "100",
+                }
+            ]
+        )
+        portfolio = _PORTFOLIO_TA.validate_python(payload)
         assert portfolio.positions[0].strategy_ids == []
 
     def test_portfolio_with_strategies(self) -> None:
-        payload = self._base_payload()
-        payload["strategies"] = [
-            {
-                "strategyId": "strategy-uuid-1",
-                "displayName": "$180/$185 Call Spread",
-                "quantity": "2",
-                "currentValue": "500.00",
-                "percentOfPortfolio": "2.5",
-                "optionLegs": [
-                    {
-                        "symbol": "AAPL260116C00180000",
-                        "positionType": "LONG",
-                        "ratioQuantity": "1",
-                    },
-                    {
-                        "symbol": "AAPL260116C00185000",
-                        "positionType": "SHORT",
-                        "ratioQuantity": "1",
-                    },
-                ],
-            }
-        ]
-        portfolio = Portfolio(**payload)
+        payload = _portfolio_payload(
+            strategies=[
+                {
+                    "strategyId": "strategy-uuid-1",
+                    "displayName": "$180/$185 Call Spread",
+                    "quantity": "2",
+                    "currentValue": "500.00",
+                    "percentOfPortfolio": "2.5",
+                    "optionLegs": [
+                        {
+                            "symbol": "AAPL260116C00180000",
+                            "positionType": "LONG",
+                            "ratioQuantity": "1",
+                        },
+                        {
+                            "symbol": "AAPL260116C00185000",
+                            "positionType": "SHORT",
+                            "ratioQuantity": "1",
+                        },
+                    ],
+                }
+            ]
+        )
+        portfolio = _PORTFOLIO_TA.validate_python(payload)
         assert portfolio.strategies is not None
         assert len(portfolio.strategies) == 1
         strategy = portfolio.strategies[0]
@@ -851,26 +984,22 @@ class TestPortfolioStrategiesDeserialization:
 
     def test_portfolio_strategies_null(self) -> None:
         """Spec: strategies is nullable — backends without strategy support return null."""
-        payload = self._base_payload()
-        payload["strategies"] = None
-        portfolio = Portfolio(**payload)
+        portfolio = _PORTFOLIO_TA.validate_python(_portfolio_payload(strategies=None))
         assert portfolio.strategies is None
 
     def test_portfolio_strategies_absent(self) -> None:
-        portfolio = Portfolio(**self._base_payload())
+        portfolio = _PORTFOLIO_TA.validate_python(_BASE_PORTFOLIO)
         assert portfolio.strategies is None
 
     def test_portfolio_strategies_empty_list(self) -> None:
-        payload = self._base_payload()
-        payload["strategies"] = []
-        portfolio = Portfolio(**payload)
+        portfolio = _PORTFOLIO_TA.validate_python(_portfolio_payload(strategies=[]))
         assert portfolio.strategies == []
 
     def test_position_strategy_ids_snake_case(self) -> None:
         """populate_by_name=True — snake_case input also works."""
         position = PortfolioPosition(
             instrument={"symbol": "AAPL", "name": "Apple", "type": "EQUITY"},
-            quantity=Decimal("100"),
+            quantity=_DEC_100,
             strategy_ids=["s1", "s2"],
         )
         assert position.strategy_ids == ["s1", "s2"]
@@ -881,18 +1010,12 @@ class TestPortfolioStrategiesDeserialization:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.xdist_group(name="preflight")
 class TestPreflightResponseNewFieldsDeserialization:
-    def _base_payload(self) -> dict:
-        return {
-            "instrument": {"symbol": "AAPL", "type": "EQUITY"},
-            "orderValue": "1000.00",
-        }
-
     def test_estimated_execution_fee(self) -> None:
         from public_api_sdk.models.order import PreflightResponse
 
-        payload = self._base_payload()
-        payload["estimatedExecutionFee"] = "0.15"
+        payload = _preflight_payload(estimatedExecutionFee="0.15")
         response = PreflightResponse(**payload)
         assert response.estimated_execution_fee == Decimal("0.15")
 
@@ -904,20 +1027,23 @@ class TestPreflightResponseNewFieldsDeserialization:
             UptickRule,
         )
 
-        payload = self._base_payload()
-        payload["shortSelling"] = {
-            "availability": "HARD_TO_BORROW",
-            "uptickRule": "TRIGGERED",
-            "hardToBorrowPercentageRate": "5.25",
-            "initialMarginRequirementPercentage": "150.0",
-            "maintenanceMarginRequirementPercentage": "130.0",
-            "maxQuantityForLocate": 10000,
-        }
+        payload = _preflight_payload(
+            shortSelling={
+                "availability": "HARD_TO_BORROW",
+                "uptickRule": "TRIGGERED",
+                "hardToBorrowPercentageRate": "5.25",
+                "initialMarginRequirementPercentage": "150.0",
+                "maintenanceMarginRequirementPercentage": "130.0",
+                "maxQuantityForLocate": 10000,
+            }
+        )
         response = PreflightResponse(**payload)
         assert isinstance(response.short_selling, ShortSelling)
-        assert response.short_selling.availability == ShortingAvailability.HARD_TO_BORROW
+        assert (
+            response.short_selling.availability == ShortingAvailability.HARD_TO_BORROW
+        )
         assert response.short_selling.uptick_rule == UptickRule.TRIGGERED
-        assert response.short_selling.hard_to_borrow_percentage_rate == Decimal("5.25")
+        assert response.short_selling.hard_to_borrow_percentage_rate == _DEC_5_25
         assert response.short_selling.initial_margin_requirement_percentage == Decimal(
             "150.0"
         )
@@ -934,14 +1060,17 @@ class TestPreflightResponseNewFieldsDeserialization:
             UptickRule,
         )
 
-        payload = self._base_payload()
-        payload["shortSelling"] = {
-            "availability": "EASY_TO_BORROW",
-            "uptickRule": "NOT_TRIGGERED",
-        }
+        payload = _preflight_payload(
+            shortSelling={
+                "availability": "EASY_TO_BORROW",
+                "uptickRule": "NOT_TRIGGERED",
+            }
+        )
         response = PreflightResponse(**payload)
         assert response.short_selling is not None
-        assert response.short_selling.availability == ShortingAvailability.EASY_TO_BORROW
+        assert (
+            response.short_selling.availability == ShortingAvailability.EASY_TO_BORROW
+        )
         assert response.short_selling.uptick_rule == UptickRule.NOT_TRIGGERED
         assert response.short_selling.hard_to_borrow_percentage_rate is None
         assert response.short_selling.max_quantity_for_locate is None
@@ -949,11 +1078,12 @@ class TestPreflightResponseNewFieldsDeserialization:
     def test_short_selling_not_shortable(self) -> None:
         from public_api_sdk.models.order import PreflightResponse, ShortingAvailability
 
-        payload = self._base_payload()
-        payload["shortSelling"] = {
-            "availability": "NOT_SHORTABLE",
-            "uptickRule": "NOT_TRIGGERED",
-        }
+        payload = _preflight_payload(
+            shortSelling={
+                "availability": "NOT_SHORTABLE",
+                "uptickRule": "NOT_TRIGGERED",
+            }
+        )
         response = PreflightResponse(**payload)
         assert response.short_selling is not None
         assert response.short_selling.availability == ShortingAvailability.NOT_SHORTABLE
@@ -961,7 +1091,7 @@ class TestPreflightResponseNewFieldsDeserialization:
     def test_new_fields_absent(self) -> None:
         from public_api_sdk.models.order import PreflightResponse
 
-        response = PreflightResponse(**self._base_payload())
+        response = PreflightResponse(**_BASE_PREFLIGHT)
         assert response.estimated_execution_fee is None
         assert response.short_selling is None
 
@@ -971,6 +1101,7 @@ class TestPreflightResponseNewFieldsDeserialization:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.xdist_group(name="quote")
 class TestQuoteBondDetailsDeserialization:
     def test_bond_details(self) -> None:
         from public_api_sdk.models.quote import BondDetails
@@ -989,7 +1120,7 @@ class TestQuoteBondDetailsDeserialization:
                 "minBuyIncrementAmount": "100.00",
             },
         }
-        quote = Quote(**payload)
+        quote = _QUOTE_TA.validate_python(payload)
         assert isinstance(quote.bond_details, BondDetails)
         assert quote.bond_details.ask_min_size == "1000"
         assert quote.bond_details.bid_markup == "0.4"
@@ -1001,7 +1132,7 @@ class TestQuoteBondDetailsDeserialization:
             "instrument": {"symbol": "AAPL", "type": "EQUITY"},
             "outcome": "SUCCESS",
         }
-        quote = Quote(**payload)
+        quote = _QUOTE_TA.validate_python(payload)
         assert quote.bond_details is None
 
     def test_bond_details_partial(self) -> None:
@@ -1010,7 +1141,7 @@ class TestQuoteBondDetailsDeserialization:
             "outcome": "SUCCESS",
             "bondDetails": {"askMarkup": "0.5"},
         }
-        quote = Quote(**payload)
+        quote = _QUOTE_TA.validate_python(payload)
         assert quote.bond_details is not None
         assert quote.bond_details.ask_markup == "0.5"
         assert quote.bond_details.bid_markup is None
@@ -1021,32 +1152,20 @@ class TestQuoteBondDetailsDeserialization:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.xdist_group(name="portfolio")
 class TestPortfolioWithdrawalFieldsDeserialization:
-    def _base_payload(self) -> dict:
-        return {
-            "accountId": "ACC-001",
-            "accountType": "BROKERAGE",
-            "buyingPower": {
-                "cashOnlyBuyingPower": "10000.00",
-                "buyingPower": "20000.00",
-                "optionsBuyingPower": "5000.00",
-            },
-            "equity": [],
-            "positions": [],
-            "orders": [],
-        }
-
     def test_available_to_withdraw(self) -> None:
         from public_api_sdk.models.portfolio import AvailableToWithdraw
 
-        payload = self._base_payload()
-        payload["cash"] = "1234.56"
-        payload["totalAccountValue"] = "54321.00"
-        payload["availableToWithdraw"] = {
-            "cashOnlyAvailableToWithdraw": "1000.00",
-            "availableToWithdraw": "2000.00",
-        }
-        portfolio = Portfolio(**payload)
+        payload = _portfolio_payload(
+            cash="1234.56",
+            totalAccountValue="54321.00",
+            availableToWithdraw={
+                "cashOnlyAvailableToWithdraw": "1000.00",
+                "availableToWithdraw": "2000.00",
+            },
+        )
+        portfolio = _PORTFOLIO_TA.validate_python(payload)
         assert portfolio.cash == Decimal("1234.56")
         assert portfolio.total_account_value == Decimal("54321.00")
         assert isinstance(portfolio.available_to_withdraw, AvailableToWithdraw)
@@ -1059,17 +1178,16 @@ class TestPortfolioWithdrawalFieldsDeserialization:
         )
 
     def test_withdrawal_fields_absent(self) -> None:
-        portfolio = Portfolio(**self._base_payload())
+        portfolio = _PORTFOLIO_TA.validate_python(_BASE_PORTFOLIO)
         assert portfolio.cash is None
         assert portfolio.total_account_value is None
         assert portfolio.available_to_withdraw is None
 
     def test_nullable_fields_explicit_null(self) -> None:
-        payload = self._base_payload()
-        payload["cash"] = None
-        payload["totalAccountValue"] = None
-        payload["availableToWithdraw"] = None
-        portfolio = Portfolio(**payload)
+        payload = _portfolio_payload(
+            cash=None, totalAccountValue=None, availableToWithdraw=None
+        )
+        portfolio = _PORTFOLIO_TA.validate_python(payload)
         assert portfolio.cash is None
         assert portfolio.total_account_value is None
         assert portfolio.available_to_withdraw is None
@@ -1080,6 +1198,7 @@ class TestPortfolioWithdrawalFieldsDeserialization:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.xdist_group(name="tax-lots")
 class TestUnrealizedTaxLotsDeserialization:
     def test_summary_response_full(self) -> None:
         from public_api_sdk.models.order import OptionType
@@ -1135,11 +1254,11 @@ class TestUnrealizedTaxLotsDeserialization:
         assert response.total_profit_loss == Decimal("35.00")
         lot = response.lots[0]
         assert lot.account_number == "ACC-001"
-        assert lot.quantity == Decimal("10")
+        assert lot.quantity == _DEC_10
         assert lot.current_value == Decimal("1600.00")
         assert lot.lot_selection_id == "lot-123"
         assert isinstance(lot.details, OptionSpecificTaxLotDetails)
-        assert lot.details.strike_price == Decimal("270.00")
+        assert lot.details.strike_price == _DEC_270
         assert lot.details.option_type == OptionType.CALL
         assert lot.details.expiration_date == "2026-01-16"
         assert isinstance(lot.out_of_date_status, OutOfDateStatus)
@@ -1234,14 +1353,14 @@ class TestUnrealizedTaxLotsDeserialization:
     def test_base64_file(self) -> None:
         from public_api_sdk.models.tax_lots import Base64File
 
-        b = Base64File(**{"fileName": "lots.csv", "base64Data": "aGVsbG8="})
+        b = Base64File(fileName="lots.csv", base64Data="aGVsbG8=")
         assert b.file_name == "lots.csv"
         assert b.base64_data == "aGVsbG8="
 
     def test_base64_file_empty(self) -> None:
         from public_api_sdk.models.tax_lots import Base64File
 
-        b = Base64File(**{})
+        b = Base64File()
         assert b.file_name is None
         assert b.base64_data is None
 
@@ -1251,6 +1370,7 @@ class TestUnrealizedTaxLotsDeserialization:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.xdist_group(name="strategy-quote")
 class TestStrategyQuoteDtoDeserialization:
     def test_full_dto(self) -> None:
         from public_api_sdk.models.order import (
@@ -1312,7 +1432,7 @@ class TestStrategyQuoteDtoDeserialization:
         dto = StrategyQuoteDto(**payload)
         assert dto.debit_credit == DebitCredit.CREDIT
         assert dto.price == Decimal("3.20")
-        assert dto.mark == Decimal("3.25")
+        assert dto.mark == _DEC_3_25
         assert dto.strategy_name == "Short Call"
         assert dto.expiration_date == "2026-01-16"
         leg = dto.strategy_legs[0]
@@ -1322,10 +1442,10 @@ class TestStrategyQuoteDtoDeserialization:
         assert leg.ratio_quantity == 1
         assert isinstance(leg.instrument, StrategyLegInstrumentDto)
         assert leg.instrument.type == OptionType.CALL
-        assert leg.instrument.strike_price == Decimal("270.00")
+        assert leg.instrument.strike_price == _DEC_270
         assert isinstance(leg.quote, SignedQuote)
         assert leg.quote.bid == Decimal("3.10")
-        assert leg.quote.bid_size == Decimal("10")
+        assert leg.quote.bid_size == _DEC_10
         assert leg.quote.open_interest == 4200
         assert leg.quote.trading_halted is False
         assert isinstance(leg.quote.detail, BondQuoteDetail)
@@ -1385,6 +1505,7 @@ class TestStrategyQuoteDtoDeserialization:
         assert dto.equity_quote.ratio_quantity == 100
 
 
+@pytest.mark.xdist_group(name="strategy-quote")
 class TestStrategyQuoteRequestSerialization:
     def test_serializes_with_equity_leg(self) -> None:
         from public_api_sdk.models.order import OpenCloseIndicator, OrderSide
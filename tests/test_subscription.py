@@ -2,6 +2,8 @@
 # Tests need to access private methods to verify implementation details
 # no-member: Pylint has issues with Pydantic models and enum attributes
 
+import asyncio
+import gc
 import threading
 import time
 import unittest
@@ -20,6 +22,15 @@ from public_api_sdk.models import (
 from public_api_sdk.subscription_manager import PriceSubscriptionManager
 
 
+def _quote(instrument: OrderInstrument, **fields: object) -> Quote:
+    """One SUCCESS quote; last/bid/ask are passed as Decimal-ready strings."""
+    for name in ("last", "bid", "ask"):
+        value = fields.get(name)
+        if value is not None:
+            fields[name] = Decimal(str(value))
+    return Quote(instrument=instrument, outcome=QuoteOutcome.SUCCESS, **fields)
+
+
 class TestPriceSubscriptionManager(unittest.TestCase):
     def setUp(self) -> None:
         self.mock_get_quotes = MagicMock()
@@ -168,24 +179,22 @@ class TestPriceSubscriptionManager(unittest.TestCase):
     def test_detect_price_change(self) -> None:
         instrument = self.test_instruments[0]
 
-        old_quote = Quote(
-            instrument=instrument,
-            outcome=QuoteOutcome.SUCCESS,
-            last=Decimal("150.00"),
-            bid=Decimal("149.99"),
-            ask=Decimal("150.01"),
+        old_quote = _quote(
+            instrument,
+            last="150.00",
+            bid="149.99",
+            ask="150.01",
             bid_size=100,
             ask_size=200,
             volume=1000000,
         )
 
         # no change
-        same_quote = Quote(
-            instrument=instrument,
-            outcome=QuoteOutcome.SUCCESS,
-            last=Decimal("150.00"),
-            bid=Decimal("149.99"),
-            ask=Decimal("150.01"),
+        same_quote = _quote(
+            instrument,
+            last="150.00",
+            bid="149.99",
+            ask="150.01",
             bid_size=100,
             ask_size=200,
             volume=1000000,
@@ -195,12 +204,11 @@ class TestPriceSubscriptionManager(unittest.TestCase):
         self.assertIsNone(change)
 
         # price change
-        new_quote = Quote(
-            instrument=instrument,
-            outcome=QuoteOutcome.SUCCESS,
-            last=Decimal("151.00"),
-            bid=Decimal("150.99"),
-            ask=Decimal("151.01"),
+        new_quote = _quote(
+            instrument,
+            last="151.00",
+            bid="150.99",
+            ask="151.01",
             bid_size=150,
             ask_size=200,
             volume=1100000,
@@ -217,26 +225,53 @@ class TestPriceSubscriptionManager(unittest.TestCase):
             self.assertEqual(change.old_quote, old_quote)
             self.assertEqual(change.new_quote, new_quote)
 
-    def test_callback_execution_on_price_change(self) -> None:
-        callback = MagicMock()
+    def test_watch_fields_filter_detection(self) -> None:
         instrument = self.test_instruments[0]
+        old = _quote(instrument, last="150.00", bid="149.99")
+        bid_only = _quote(instrument, last="150.00", bid="149.50")
+        last_changed = _quote(instrument, last="151.00", bid="149.50")
 
-        # mock quotes
-        quote1 = Quote(
-            instrument=instrument,
-            outcome=QuoteOutcome.SUCCESS,
-            last=Decimal("150.00"),
-            bid=Decimal("149.99"),
-            ask=Decimal("150.01"),
+        # a change outside the watched fields does not dispatch
+        change = self.manager._detect_price_change(
+            instrument, old, bid_only, watch_fields=("last",)
         )
+        self.assertIsNone(change)
 
-        quote2 = Quote(
-            instrument=instrument,
-            outcome=QuoteOutcome.SUCCESS,
-            last=Decimal("151.00"),  # changed
-            bid=Decimal("150.99"),  # changed
-            ask=Decimal("151.01"),  # changed
+        # a watched-field change does
+        change = self.manager._detect_price_change(
+            instrument, old, last_changed, watch_fields=("last",)
         )
+        self.assertIsNotNone(change)
+        if change:
+            self.assertEqual(change.changed_fields, ["last"])
+
+    def test_watch_fields_suppress_callback(self) -> None:
+        callback = MagicMock()
+        instrument = self.test_instruments[0]
+        quote1 = _quote(instrument, last="150.00", bid="149.99")
+        # only the unwatched bid moves between polls
+        quote2 = _quote(instrument, last="150.00", bid="149.50")
+        self.mock_get_quotes.side_effect = [[quote1], [quote2]]
+
+        self.manager.subscribe(
+            [instrument],
+            callback,
+            SubscriptionConfig(polling_frequency_seconds=0.1, watch_fields=("last",)),
+        )
+
+        # wait for polling to cover both quotes
+        time.sleep(0.5)
+
+        callback.assert_not_called()
+
+    def test_callback_execution_on_price_change(self) -> None:
+        callback = MagicMock()
+        instrument = self.test_instruments[0]
+
+        # mock quotes
+        quote1 = _quote(instrument, last="150.00", bid="149.99", ask="150.01")
+        # all three fields changed
+        quote2 = _quote(instrument, last="151.00", bid="150.99", ask="151.01")
 
         # setup mock to return different quotes
         self.mock_get_quotes.side_effect = [[quote1], [quote2]]
@@ -287,11 +322,7 @@ class TestPriceSubscriptionManager(unittest.TestCase):
     def test_retry_logic_on_error(self) -> None:
         callback = MagicMock()
 
-        quote = Quote(
-            instrument=self.test_instruments[0],
-            outcome=QuoteOutcome.SUCCESS,
-            last=Decimal("150.00"),
-        )
+        quote = _quote(self.test_instruments[0], last="150.00")
 
         # first two calls fail, third succeeds
         self.mock_get_quotes.side_effect = [
@@ -329,12 +360,8 @@ class TestPriceSubscriptionManager(unittest.TestCase):
             async_called.set()
 
         instrument = self.test_instruments[0]
-        quote1 = Quote(
-            instrument=instrument, outcome=QuoteOutcome.SUCCESS, last=Decimal("150.00")
-        )
-        quote2 = Quote(
-            instrument=instrument, outcome=QuoteOutcome.SUCCESS, last=Decimal("151.00")
-        )
+        quote1 = _quote(instrument, last="150.00")
+        quote2 = _quote(instrument, last="151.00")
 
         self.mock_get_quotes.side_effect = [[quote1], [quote2]]
 
@@ -347,6 +374,43 @@ class TestPriceSubscriptionManager(unittest.TestCase):
         # wait for async callback
         self.assertTrue(async_called.wait(timeout=2))
 
+    def test_owner_finalizer_unsubscribes(self) -> None:
+        class Owner:
+            pass
+
+        owner = Owner()
+        sub_id = self.manager.subscribe(self.test_instruments, MagicMock(), owner=owner)
+        self.assertIn(sub_id, self.manager.subscriptions)
+
+        del owner
+        gc.collect()
+
+        self.assertNotIn(sub_id, self.manager.subscriptions)
+        self.assertEqual(len(self.manager.instrument_to_subscription), 0)
+
+    def test_callback_timeout_bounds_slow_callbacks(self) -> None:
+        release = threading.Event()
+
+        def slow_callback(_price_change: PriceChange) -> None:
+            release.wait(timeout=5)
+
+        instrument = self.test_instruments[0]
+        change = PriceChange(
+            instrument=instrument,
+            old_quote=None,
+            new_quote=_quote(instrument, last="150.00"),
+            changed_fields=["last"],
+        )
+
+        start = time.monotonic()
+        with self.assertLogs("public_api_sdk.subscription_manager", level="WARNING"):
+            asyncio.run(
+                self.manager._execute_callback(slow_callback, change, timeout=0.1)
+            )
+        # the poll pass gave up at the deadline, not when the callback ended
+        self.assertLess(time.monotonic() - start, 2)
+        release.set()
+
     def test_subscription_validation(self) -> None:
         # empty instruments
         with self.assertRaises(ValueError):
@@ -370,6 +434,30 @@ class TestSubscriptionConfig(unittest.TestCase):
         with self.assertRaises(ValueError):
             SubscriptionConfig(polling_frequency_seconds=65)
 
+    def test_watch_fields_config(self) -> None:
+        self.assertEqual(SubscriptionConfig().watch_fields, ("last", "bid", "ask"))
+
+        config = SubscriptionConfig(watch_fields=("last",))
+        self.assertEqual(config.watch_fields, ("last",))
+
+        # must name at least one quote field
+        with self.assertRaises(ValueError):
+            SubscriptionConfig(watch_fields=())
+
+        # unknown quote fields are rejected
+        with self.assertRaises(ValueError):
+            SubscriptionConfig(watch_fields=("last", "not_a_field"))
+
+    def test_callback_timeout_config(self) -> None:
+        # inline dispatch (no timeout) is the default
+        self.assertIsNone(SubscriptionConfig().callback_timeout_seconds)
+
+        config = SubscriptionConfig(callback_timeout_seconds=0.5)
+        self.assertEqual(config.callback_timeout_seconds, 0.5)
+
+        with self.assertRaises(ValueError):
+            SubscriptionConfig(callback_timeout_seconds=0)
+
     def test_valid_config(self) -> None:
         config = SubscriptionConfig(
             polling_frequency_seconds=5.0,